@@ -4,15 +4,23 @@ Provides global state for tracking cache refresh progress,
 used by both SSE streaming and polling endpoints.
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from threading import Lock
+from time import sleep
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheRefreshStatus:
-    """Current cache refresh status."""
+    """Current cache refresh status.
+
+    Slotted: fields are read on every SSE tick and status poll, and
+    slot descriptors avoid the per-instance __dict__ lookup.
+    """
 
     in_progress: bool = False
     status: str = "idle"  # idle, starting, discovering, saving, complete, error
@@ -60,21 +68,55 @@ class CacheRefreshStatus:
         self.result = {}
 
 
-# Global status instance with thread-safe access
+# Global status instance with thread-safe access.
+#
+# Writers serialize on _status_lock and bump _seq before and after mutating
+# (odd = write in progress). Readers never take the lock: they snapshot and
+# retry if _seq moved underneath them (seqlock), so SSE ticks and polling
+# endpoints don't contend with the refresh thread.
 _status = CacheRefreshStatus()
 _status_lock = Lock()
+_seq = 0
+_snapshot: tuple[int, dict] | None = None
 
 
-def get_refresh_status() -> dict:
-    """Get current refresh status as dict."""
+@contextmanager
+def _write() -> Iterator[None]:
+    """Serialize a status mutation and publish it to lock-free readers."""
+    global _seq
     with _status_lock:
-        return _status.to_dict()
+        _seq += 1
+        try:
+            yield
+        finally:
+            _seq += 1
+
+
+def get_refresh_status() -> dict:
+    """Get current refresh status as dict.
+
+    The snapshot is cached per sequence number, so repeated polls between
+    updates return the same dict without rebuilding it. Callers must treat
+    it as read-only.
+    """
+    global _snapshot
+    while True:
+        seq = _seq
+        if seq & 1:
+            sleep(0)
+            continue
+        cached = _snapshot
+        if cached is not None and cached[0] == seq:
+            return cached[1]
+        snapshot = _status.to_dict()
+        if seq == _seq:
+            _snapshot = (seq, snapshot)
+            return snapshot
 
 
 def is_refresh_in_progress() -> bool:
     """Check if refresh is in progress."""
-    with _status_lock:
-        return _status.in_progress
+    return _status.in_progress
 
 
 def start_refresh() -> bool:
@@ -82,7 +124,11 @@ def start_refresh() -> bool:
 
     Returns False if already in progress.
     """
-    with _status_lock:
+    # Unlocked fast-path rejection (e.g. UI double-clicks); the check is
+    # repeated under the lock so only one caller can win the race.
+    if _status.in_progress:
+        return False
+    with _write():
         if _status.in_progress:
             return False
         _status.reset()
@@ -104,7 +150,7 @@ def update_refresh_status(
     total: int | None = None,
 ) -> None:
     """Update refresh status."""
-    with _status_lock:
+    with _write():
         if status is not None:
             _status.status = status
         if message is not None:
@@ -123,7 +169,9 @@ def update_refresh_status(
 
 def complete_refresh(result: dict) -> None:
     """Mark refresh as complete."""
-    with _status_lock:
+    # Snapshots share this dict by reference; copy it so later caller edits don't leak in
+    result = deepcopy(result)
+    with _write():
         _status.in_progress = False
         _status.status = "complete"
         _status.message = "Cache refresh complete"
@@ -134,7 +182,7 @@ def complete_refresh(result: dict) -> None:
 
 def fail_refresh(error: str) -> None:
     """Mark refresh as failed."""
-    with _status_lock:
+    with _write():
         _status.in_progress = False
         _status.status = "error"
         _status.message = f"Error: {error}"
@@ -2,7 +2,12 @@
 
 from functools import lru_cache
 
-from teamarr.services import SportsDataService, create_default_service
+from teamarr.services import (
+    MatchingService,
+    SportsDataService,
+    create_default_service,
+    create_matching_service,
+)
 
 
 @lru_cache
@@ -12,3 +17,9 @@ def get_sports_service() -> SportsDataService:
     Providers are configured in teamarr/providers/__init__.py.
     """
     return create_default_service()
+
+
+@lru_cache
+def get_matching_service() -> MatchingService:
+    """Get singleton MatchingService over the shared SportsDataService."""
+    return create_matching_service(get_sports_service())
@@ -4,6 +4,7 @@ Provides global state for tracking EPG generation progress,
 used by both SSE streaming and polling endpoints.
 """
 
+from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from threading import Lock
@@ -72,9 +73,12 @@ def get_status() -> dict:
 
 
 def is_in_progress() -> bool:
-    """Check if generation is in progress."""
-    with _status_lock:
-        return _status.in_progress
+    """Check if generation is in progress.
+
+    Reads the flag without the lock: a single attribute load is atomic,
+    and this is hit on every SSE connect and status poll.
+    """
+    return _status.in_progress
 
 
 def start_generation() -> bool:
@@ -82,6 +86,9 @@ def start_generation() -> bool:
 
     Returns False if already in progress.
     """
+    # Unlocked fast-path rejection; re-checked under the lock below.
+    if _status.in_progress:
+        return False
     with _status_lock:
         if _status.in_progress:
             return False
@@ -129,6 +136,8 @@ def update_status(
 
 def complete_generation(result: dict) -> None:
     """Mark generation as complete."""
+    # Keep our own copy: snapshots hand this dict out by reference
+    result = deepcopy(result)
     with _status_lock:
         _status.in_progress = False
         _status.status = "complete"
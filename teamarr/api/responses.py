@@ -0,0 +1,18 @@
+"""Response classes shared by API routes."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from teamarr.utilities import fast_json
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when available.
+
+    Handlers return plain dicts/lists through this class to skip FastAPI's
+    jsonable_encoder pass. datetime values serialize natively as ISO 8601.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return fast_json.dumpb(content)
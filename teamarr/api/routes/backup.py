@@ -11,7 +11,13 @@ from fastapi import APIRouter, File, HTTPException, UploadFile, status
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
-from teamarr.database.connection import DEFAULT_DB_PATH
+from teamarr.database.connection import (
+    DEFAULT_DB_PATH,
+    checkpoint_db,
+    close_pooled_connections,
+)
+from teamarr.database.exception_keywords import invalidate_keywords_cache
+from teamarr.database.settings import invalidate_settings_cache
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +42,9 @@ async def download_backup():
             detail="Database file not found",
         )
 
+    # Make sure committed data is in the main file, not only the WAL
+    checkpoint_db()
+
     # Generate filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"teamarr_backup_{timestamp}.db"
@@ -97,13 +106,17 @@ async def restore_backup(file: UploadFile = File(...)):
             # Create backup of current database before restoring
             backup_path = None
             if DEFAULT_DB_PATH.exists():
+                checkpoint_db()
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_path = DEFAULT_DB_PATH.parent / f"teamarr_pre_restore_{timestamp}.db"
                 shutil.copy2(DEFAULT_DB_PATH, backup_path)
                 logger.info("[RESTORE] Created pre-restore backup at %s", backup_path)
 
             # Replace database with uploaded file
+            close_pooled_connections()
             shutil.copy2(tmp_path, DEFAULT_DB_PATH)
+            invalidate_settings_cache()
+            invalidate_keywords_cache()
             logger.info("[RESTORE] Database restored from uploaded backup")
 
             return RestoreResponse(
@@ -1,13 +1,18 @@
 """EPG generation endpoints."""
 
-import json
+import asyncio
+import calendar
+import io
 import logging
-import queue
+import re
 import threading
+import time
+import xml.etree.ElementTree as ET
 from datetime import date, datetime
+from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import Response, StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
 from teamarr.api.dependencies import get_sports_service
 from teamarr.api.generation_status import (
@@ -30,18 +35,44 @@ from teamarr.api.models import (
     StreamBatchMatchResponse,
     StreamMatchResultModel,
 )
+from teamarr.consumers.generation import run_full_generation
 from teamarr.consumers.matching import StreamMatcher
+from teamarr.consumers.stream_match_cache import (
+    StreamMatchCache,
+    compute_fingerprint,
+    event_to_cache_data,
+)
 from teamarr.database import get_db
+from teamarr.database.leagues import get_all_leagues
+from teamarr.database.settings import (
+    get_cached_dispatcharr_settings,
+    get_cached_epg_settings,
+    get_epg_settings,
+)
+from teamarr.database.stats import get_failed_matches as db_get_failed
+from teamarr.database.stats import get_match_stats_summary
+from teamarr.database.stats import get_matched_streams as db_get_matched
+from teamarr.dispatcharr import get_dispatcharr_connection
 from teamarr.services import (
     EventEPGOptions,
     SportsDataService,
     create_epg_service,
 )
+from teamarr.utilities import fast_json
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Minimum seconds between SSE progress events with an unchanged percentage
+SSE_MIN_EMIT_INTERVAL = 0.1
+
+# Seconds of SSE silence before a keepalive comment is sent
+SSE_HEARTBEAT_INTERVAL = 15.0
+
+# Template variables left in generated titles/descriptions (e.g. "{home_team}")
+UNREPLACED_VARIABLE_PATTERN = re.compile(r"\{[a-z_]+\}")
+
 
 # =============================================================================
 # EPG Generation endpoints
@@ -64,15 +95,10 @@ def generate_epg(
 
     For real-time progress, use GET /epg/generate/stream instead.
     """
-    from teamarr.consumers.generation import run_full_generation
-    from teamarr.database.settings import get_dispatcharr_settings
-    from teamarr.dispatcharr import get_dispatcharr_connection
-
     # Get Dispatcharr connection if configured (not just client)
     # Must use get_dispatcharr_connection() to get DispatcharrConnection
     # with .m3u, .channels, .epg managers
-    with get_db() as conn:
-        dispatcharr_settings = get_dispatcharr_settings(conn)
+    dispatcharr_settings = get_cached_dispatcharr_settings(get_db)
 
     dispatcharr_client = None
     if dispatcharr_settings.enabled and dispatcharr_settings.url:
@@ -111,8 +137,6 @@ def generate_epg(
         match_rate=0.0,
     )
     if result.run_id:
-        from teamarr.database.stats import get_match_stats_summary
-
         with get_db() as conn:
             stats = get_match_stats_summary(conn, run_id=result.run_id)
             totals = stats.get("totals", {})
@@ -154,7 +178,7 @@ def get_generation_status():
 
 
 @router.get("/epg/generate/stream")
-def generate_epg_stream():
+async def generate_epg_stream():
     """Stream EPG generation progress using Server-Sent Events.
 
     This endpoint calls the unified run_full_generation() function which
@@ -166,16 +190,15 @@ def generate_epg_stream():
     - Channel lifecycle (scheduled deletions)
     - Reconciliation (detect issues)
     - History cleanup
-    """
-    from teamarr.consumers.generation import run_full_generation
-    from teamarr.database.settings import get_dispatcharr_settings
-    from teamarr.dispatcharr import get_dispatcharr_connection
 
+    Generation runs in a worker thread; the SSE consumer is a coroutine on
+    the event loop, so connected clients don't each pin a thread.
+    """
     # Check if already in progress
     if is_in_progress():
         err = {"status": "error", "message": "Generation already in progress"}
         return StreamingResponse(
-            iter([f"data: {json.dumps(err)}\n\n"]),
+            iter([f"data: {fast_json.dumps(err)}\n\n"]),
             media_type="text/event-stream",
         )
 
@@ -183,25 +206,40 @@ def generate_epg_stream():
     if not start_generation():
         err = {"status": "error", "message": "Failed to start generation"}
         return StreamingResponse(
-            iter([f"data: {json.dumps(err)}\n\n"]),
+            iter([f"data: {fast_json.dumps(err)}\n\n"]),
             media_type="text/event-stream",
         )
 
-    # Queue for progress updates (used by SSE stream if client reads it)
-    progress_queue: queue.Queue = queue.Queue()
+    # Latest progress snapshot for the SSE stream. Only the newest status
+    # matters to the client, so a single slot replaces a queue of ticks.
+    # The generation thread wakes the SSE coroutine through the event loop.
+    loop = asyncio.get_running_loop()
+    latest_status: list[dict | None] = [None]
+    progress_ready = asyncio.Event()
+    generation_done = threading.Event()
+
+    def wake_stream() -> None:
+        try:
+            loop.call_soon_threadsafe(progress_ready.set)
+        except RuntimeError:
+            # Event loop closed (shutdown); generation must keep running
+            pass
+
+    def publish_status() -> None:
+        latest_status[0] = get_status()
+        wake_stream()
 
     def run_generation():
         """Run EPG generation in background thread."""
         try:
             # Get Dispatcharr connection if configured (not just client)
-            with get_db() as conn:
-                dispatcharr_settings = get_dispatcharr_settings(conn)
+            dispatcharr_settings = get_cached_dispatcharr_settings(get_db)
 
             dispatcharr_client = None
             if dispatcharr_settings.enabled and dispatcharr_settings.url:
                 dispatcharr_client = get_dispatcharr_connection(get_db)
 
-            # Progress callback that updates status and queues for SSE
+            # Progress callback that updates status and publishes for SSE
             def progress_callback(
                 phase: str,
                 percent: int,
@@ -219,7 +257,7 @@ def generate_epg_stream():
                     total=total,
                     item_name=item_name,
                 )
-                progress_queue.put(get_status())
+                publish_status()
 
             # Run unified generation
             result = run_full_generation(
@@ -232,8 +270,6 @@ def generate_epg_stream():
                 # Fetch match stats from database
                 match_stats = {}
                 if result.run_id:
-                    from teamarr.database.stats import get_match_stats_summary
-
                     with get_db() as conn:
                         stats = get_match_stats_summary(conn, run_id=result.run_id)
                         totals = stats.get("totals", {})
@@ -258,44 +294,69 @@ def generate_epg_stream():
             else:
                 fail_generation(result.error or "Unknown error")
 
-            progress_queue.put(get_status())
+            publish_status()
 
         except Exception as e:
             fail_generation(str(e))
-            progress_queue.put(get_status())
+            publish_status()
 
         finally:
-            progress_queue.put({"_done": True})
+            generation_done.set()
+            wake_stream()
 
     # Start generation thread IMMEDIATELY (before returning response)
     # This ensures generation runs even if client doesn't read SSE stream
     generation_thread = threading.Thread(target=run_generation, daemon=True)
     generation_thread.start()
 
-    def generate():
+    async def generate():
         """Generator function for SSE stream."""
         # Send initial status immediately
-        yield f"data: {json.dumps(get_status())}\n\n"
-
-        # Stream progress updates
-        while True:
+        yield f"data: {fast_json.dumps(get_status())}\n\n"
+
+        # Stream the newest progress snapshot each time the generation
+        # thread publishes one; intermediate ticks are naturally coalesced.
+        # The loop only wakes on new progress, to flush a rate-limited
+        # snapshot, or to send a keepalive heartbeat.
+        last_emit = time.monotonic()
+        last_percent = None
+        sent = None
+        while not generation_done.is_set():
+            pending = latest_status[0] is not sent
             try:
-                data = progress_queue.get(timeout=0.5)
-
-                if data.get("_done"):
-                    break
+                await asyncio.wait_for(
+                    progress_ready.wait(),
+                    timeout=SSE_MIN_EMIT_INTERVAL if pending else SSE_HEARTBEAT_INTERVAL,
+                )
+            except TimeoutError:
+                pass
+            progress_ready.clear()
+
+            now = time.monotonic()
+            data = latest_status[0]
+            if data is None or data is sent:
+                if now - last_emit >= SSE_HEARTBEAT_INTERVAL:
+                    # Send heartbeat to keep connection alive
+                    last_emit = now
+                    yield ": heartbeat\n\n"
+                continue
 
-                yield f"data: {json.dumps(data)}\n\n"
+            # Hold back ticks that arrive faster than the UI can render them
+            # unless the percentage actually moved
+            percent = data.get("percent")
+            if percent == last_percent and now - last_emit < SSE_MIN_EMIT_INTERVAL:
+                continue
 
-            except queue.Empty:
-                # Send heartbeat to keep connection alive
-                yield ": heartbeat\n\n"
+            sent = data
+            last_emit = now
+            last_percent = percent
+            yield f"data: {fast_json.dumps(data)}\n\n"
 
         # Wait for thread to complete
-        generation_thread.join(timeout=5)
+        await asyncio.to_thread(generation_thread.join, 5)
 
         # Send final status
-        yield f"data: {json.dumps(get_status())}\n\n"
+        yield f"data: {fast_json.dumps(get_status())}\n\n"
 
     return StreamingResponse(
         generate(),
@@ -317,14 +378,7 @@ def get_xmltv():
 
     Dispatcharr EPG source URL: http://teamarr:9195/api/v1/epg/xmltv
     """
-    from pathlib import Path
-
-    from fastapi.responses import FileResponse
-
-    from teamarr.database.settings import get_epg_settings
-
-    with get_db() as conn:
-        epg_settings = get_epg_settings(conn)
+    epg_settings = get_cached_epg_settings(get_db)
 
     output_path = epg_settings.epg_output_path or "./data/teamarr.xml"
     file_path = Path(output_path)
@@ -352,6 +406,10 @@ def _parse_date(date_str: str | None) -> date:
     if not date_str:
         return date.today()
     try:
+        # Canonical YYYY-MM-DD takes the C fast path; strptime still covers
+        # unpadded forms like 2024-1-5
+        if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+            return date.fromisoformat(date_str)
         return datetime.strptime(date_str, "%Y-%m-%d").date()
     except ValueError:
         raise HTTPException(
@@ -496,32 +554,100 @@ def match_streams(
 # =============================================================================
 
 
-def _get_combined_xmltv() -> str:
+# Last XMLTV file read for analysis/preview, keyed by (path, mtime_ns, size)
+# so back-to-back /epg/analysis and /epg/content polls reuse one read until
+# the next generation rewrites the file
+_combined_xmltv_cache: tuple[tuple[str, int, int], str] | None = None
+_combined_xmltv_lock = threading.Lock()
+
+
+def _get_combined_xmltv(conn) -> str:
     """Get combined XMLTV content from the generated file.
 
     Uses the same file that's served to users via /epg/xmltv endpoint,
     guaranteeing consistency between preview and actual output.
-    """
-    from pathlib import Path
 
-    from teamarr.database.settings import get_epg_settings
+    Takes the caller's connection so endpoints that also query stats
+    check out a single connection.
+    """
+    global _combined_xmltv_cache
 
-    with get_db() as conn:
-        epg_settings = get_epg_settings(conn)
+    epg_settings = get_epg_settings(conn)
 
     output_path = Path(epg_settings.epg_output_path)
-    if not output_path.exists():
+    try:
+        stat = output_path.stat()
+    except OSError:
         return ""
 
-    return output_path.read_text(encoding="utf-8")
+    key = (str(output_path), stat.st_mtime_ns, stat.st_size)
+    with _combined_xmltv_lock:
+        cached = _combined_xmltv_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        content = output_path.read_text(encoding="utf-8")
+        _combined_xmltv_cache = (key, content)
+        return content
+
+
+def _xmltv_epoch(timestamp: str) -> int:
+    """Convert the YYYYMMDDHHmmss prefix of an XMLTV timestamp to epoch seconds.
+
+    Fixed-width slicing avoids datetime.strptime, which dominates the gap
+    scan on large EPGs. The offset suffix is ignored (as before).
+
+    Raises:
+        ValueError: If the prefix is not 14 digits or is not a valid date/time
+    """
+    digits = timestamp[:14]
+    if len(digits) != 14 or not digits.isdigit():
+        raise ValueError(f"Invalid XMLTV timestamp: {timestamp!r}")
+
+    year = int(digits[0:4])
+    month = int(digits[4:6])
+    day = int(digits[6:8])
+    hour = int(digits[8:10])
+    minute = int(digits[10:12])
+    second = int(digits[12:14])
+    if not (
+        1 <= month <= 12
+        and 1 <= day <= calendar.monthrange(year, month)[1]
+        and hour < 24
+        and minute < 60
+        and second < 62
+    ):
+        raise ValueError(f"Invalid XMLTV timestamp: {timestamp!r}")
+
+    return calendar.timegm((year, month, day, hour, minute, second, 0, 0, 0))
+
+
+def _coverage_gap(
+    channel_id: str, stop1: str, title1: str, start2: str, title2: str
+) -> dict | None:
+    """Describe the gap between two consecutive programmes if > 5 minutes."""
+    # Parse times (format: YYYYMMDDHHmmss +ZZZZ)
+    try:
+        gap_seconds = _xmltv_epoch(start2) - _xmltv_epoch(stop1)
+    except (ValueError, TypeError):
+        return None
+
+    gap_minutes = int(gap_seconds / 60)
+    if gap_minutes <= 5:
+        return None
+
+    return {
+        "channel": channel_id,
+        "after_program": title1[:50],
+        "before_program": title2[:50],
+        "after_stop": stop1,
+        "before_start": start2,
+        "gap_minutes": gap_minutes,
+    }
 
 
 def _analyze_xmltv(xmltv_content: str) -> dict:
     """Analyze XMLTV content for issues."""
-    import re
-    import xml.etree.ElementTree as ET
-    from collections import defaultdict
-
     result = {
         "channels": {"total": 0, "team_based": 0, "event_based": 0},
         "programmes": {
@@ -539,123 +665,120 @@ def _analyze_xmltv(xmltv_content: str) -> dict:
     if not xmltv_content:
         return result
 
-    try:
-        # Parse with comments
-        parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True))
-        root = ET.fromstring(xmltv_content, parser=parser)
-    except ET.ParseError:
-        return result
-
-    # Count channels
-    channels = root.findall("channel")
-    result["channels"]["total"] = len(channels)
-    for ch in channels:
-        ch_id = ch.get("id", "")
-        if ch_id.startswith("teamarr-event-"):
-            result["channels"]["event_based"] += 1
-        else:
-            result["channels"]["team_based"] += 1
-
-    # Analyze programmes
-    programmes = root.findall("programme")
-    result["programmes"]["total"] = len(programmes)
-
-    # Track programmes per channel for gap detection
-    channel_programmes: dict[str, list[tuple[str, str, str]]] = defaultdict(list)
+    # Last (stop, title) seen per channel for single-pass gap detection.
+    # XMLTV output lists each channel's programmes in start order, so
+    # comparing against the previous programme replaces a collect-and-sort.
+    last_by_channel: dict[str, tuple[str, str]] = {}
+    coverage_gaps: list[dict] = []
     unreplaced_vars: set[str] = set()
-    var_pattern = re.compile(r"\{[a-z_]+\}")
 
+    channel_count = 0
+    event_channel_count = 0
+    programmes = {"total": 0, "events": 0, "pregame": 0, "postgame": 0, "idle": 0}
     min_start = None
     max_stop = None
 
-    for prog in programmes:
-        channel_id = prog.get("channel", "")
-        start = prog.get("start", "")
-        stop = prog.get("stop", "")
-
-        # Track date range
-        if start:
-            start_date = start[:8]
-            if min_start is None or start_date < min_start:
-                min_start = start_date
-        if stop:
-            stop_date = stop[:8]
-            if max_stop is None or stop_date > max_stop:
-                max_stop = stop_date
-
-        # Get text content for variable checking
-        title = prog.findtext("title", "") or ""
-        subtitle = prog.findtext("sub-title", "") or ""
-        desc = prog.findtext("desc", "") or ""
-
-        # Check for programme type from filler comment (V1 compatibility)
-        # Comments look like: <!-- teamarr:filler-pregame -->
-        filler_type = None
-        for child in prog:
-            if callable(child.tag):  # This is a Comment
-                comment_text = child.text or ""
-                if comment_text.startswith("teamarr:filler-"):
-                    filler_type = comment_text.replace("teamarr:filler-", "")
-                    break
-
-        if filler_type == "pregame":
-            result["programmes"]["pregame"] += 1
-        elif filler_type == "postgame":
-            result["programmes"]["postgame"] += 1
-        elif filler_type == "idle":
-            result["programmes"]["idle"] += 1
-        else:
-            result["programmes"]["events"] += 1
-
-        for text in [title, subtitle, desc]:
-            if text:
-                matches = var_pattern.findall(text)
-                unreplaced_vars.update(matches)
-
-        # Store for gap detection
-        if channel_id and start and stop:
-            channel_programmes[channel_id].append((start, stop, title or "Unknown"))
+    # Stream the document instead of building the full DOM: each top-level
+    # element is analyzed when it closes and then dropped from the tree.
+    # Comments arrive as events (they are not inserted into the tree), so
+    # the filler marker is captured while its programme is open.
+    root = None
+    depth = 0
+    filler_type = None
 
-    result["unreplaced_variables"] = sorted(unreplaced_vars)
-    result["date_range"]["start"] = min_start
-    result["date_range"]["end"] = max_stop
+    try:
+        events = ET.iterparse(io.StringIO(xmltv_content), events=("start", "end", "comment"))
+        for event, elem in events:
+            if event == "start":
+                depth += 1
+                if root is None:
+                    root = elem
+                elif depth == 2:
+                    tag = elem.tag
+                    if tag == "programme":
+                        filler_type = None
+                    elif tag == "channel":
+                        # Classify from the attributes as soon as the tag opens
+                        channel_count += 1
+                        if elem.attrib.get("id", "")[:14] == "teamarr-event-":
+                            event_channel_count += 1
+                continue
 
-    # Detect coverage gaps (> 5 minute gap between programmes)
-    from datetime import datetime
+            if event == "comment":
+                # Check for programme type from filler comment (V1 compatibility)
+                # Comments look like: <!-- teamarr:filler-pregame -->
+                if depth == 2 and filler_type is None:
+                    comment_text = elem.text or ""
+                    if comment_text.startswith("teamarr:filler-"):
+                        filler_type = comment_text.replace("teamarr:filler-", "")
+                continue
 
-    for channel_id, progs in channel_programmes.items():
-        # Sort by start time
-        progs.sort(key=lambda x: x[0])
+            depth -= 1
+            if depth != 1:
+                continue
 
-        for i in range(len(progs) - 1):
-            _, stop1, title1 = progs[i]
-            start2, _, title2 = progs[i + 1]
+            if elem.tag == "programme":
+                programmes["total"] += 1
+                channel_id = elem.get("channel", "")
+                start = elem.get("start", "")
+                stop = elem.get("stop", "")
+
+                # Track date range
+                if start:
+                    start_date = start[:8]
+                    if min_start is None or start_date < min_start:
+                        min_start = start_date
+                if stop:
+                    stop_date = stop[:8]
+                    if max_stop is None or stop_date > max_stop:
+                        max_stop = stop_date
+
+                # Get text content for variable checking
+                title = elem.findtext("title", "") or ""
+                subtitle = elem.findtext("sub-title", "") or ""
+                desc = elem.findtext("desc", "") or ""
+
+                if filler_type == "pregame":
+                    programmes["pregame"] += 1
+                elif filler_type == "postgame":
+                    programmes["postgame"] += 1
+                elif filler_type == "idle":
+                    programmes["idle"] += 1
+                else:
+                    programmes["events"] += 1
+
+                # One scan over all three fields; NUL separators keep a match
+                # from spanning two fields. Most programmes have no braces at
+                # all, so skip the regex unless one is present.
+                texts = f"{title}\x00{subtitle}\x00{desc}"
+                if "{" in texts:
+                    unreplaced_vars.update(UNREPLACED_VARIABLE_PATTERN.findall(texts))
+
+                # Detect coverage gaps (> 5 minute gap between programmes)
+                if channel_id and start and stop:
+                    title = title or "Unknown"
+                    prev = last_by_channel.get(channel_id)
+                    if prev is not None:
+                        gap = _coverage_gap(channel_id, prev[0], prev[1], start, title)
+                        if gap:
+                            coverage_gaps.append(gap)
+                    last_by_channel[channel_id] = (stop, title)
+
+            root.clear()
+    except ET.ParseError:
+        return result
 
-            # Parse times (format: YYYYMMDDHHmmss +ZZZZ)
-            try:
-                stop1_time = stop1[:14]
-                start2_time = start2[:14]
-
-                fmt = "%Y%m%d%H%M%S"
-                dt_stop = datetime.strptime(stop1_time, fmt)
-                dt_start = datetime.strptime(start2_time, fmt)
-
-                gap_seconds = (dt_start - dt_stop).total_seconds()
-                gap_minutes = int(gap_seconds / 60)
-
-                if gap_minutes > 5:  # More than 5 minute gap
-                    result["coverage_gaps"].append(
-                        {
-                            "channel": channel_id,
-                            "after_program": title1[:50],
-                            "before_program": title2[:50],
-                            "after_stop": stop1,
-                            "before_start": start2,
-                            "gap_minutes": gap_minutes,
-                        }
-                    )
-            except (ValueError, TypeError):
-                continue
+    result["channels"] = {
+        "total": channel_count,
+        "team_based": channel_count - event_channel_count,
+        "event_based": event_channel_count,
+    }
+    result["programmes"] = programmes
+    result["unreplaced_variables"] = sorted(unreplaced_vars)
+    result["date_range"]["start"] = min_start
+    result["date_range"]["end"] = max_stop
+
+    result["coverage_gaps"] = coverage_gaps
 
     return result
 
@@ -671,12 +794,12 @@ def get_epg_analysis():
     - Unreplaced template variables
     - Coverage gaps between programmes
     """
-    xmltv = _get_combined_xmltv()
-    result = _analyze_xmltv(xmltv)
-
-    # Override programme counts with stats from latest full_epg processing run
-    # (XML comments may not survive serialization, so use DB stats instead)
+    # One connection for the XMLTV settings lookup and both stats queries
     with get_db() as conn:
+        xmltv = _get_combined_xmltv(conn)
+
+        # Latest full_epg processing run stats override programme counts
+        # (XML comments may not survive serialization, so use DB stats instead)
         row = conn.execute(
             """
             SELECT programmes_total, programmes_events, programmes_pregame,
@@ -687,22 +810,24 @@ def get_epg_analysis():
             LIMIT 1
             """
         ).fetchone()
-        if row:
-            result["programmes"]["total"] = row["programmes_total"] or result["programmes"]["total"]
-            result["programmes"]["events"] = row["programmes_events"] or 0
-            result["programmes"]["pregame"] = row["programmes_pregame"] or 0
-            result["programmes"]["postgame"] = row["programmes_postgame"] or 0
-            result["programmes"]["idle"] = row["programmes_idle"] or 0
 
         # Get actual managed channel count from database (not XMLTV)
         # This is more accurate as event channels may not be in XMLTV yet
         event_channel_count = conn.execute(
             "SELECT COUNT(*) FROM managed_channels WHERE deleted_at IS NULL"
         ).fetchone()[0]
-        result["channels"]["event_based"] = event_channel_count
-        result["channels"]["total"] = (
-            result["channels"]["team_based"] + event_channel_count
-        )
+
+    result = _analyze_xmltv(xmltv)
+
+    if row:
+        result["programmes"]["total"] = row["programmes_total"] or result["programmes"]["total"]
+        result["programmes"]["events"] = row["programmes_events"] or 0
+        result["programmes"]["pregame"] = row["programmes_pregame"] or 0
+        result["programmes"]["postgame"] = row["programmes_postgame"] or 0
+        result["programmes"]["idle"] = row["programmes_idle"] or 0
+
+    result["channels"]["event_based"] = event_channel_count
+    result["channels"]["total"] = result["channels"]["team_based"] + event_channel_count
 
     return result
 
@@ -716,23 +841,29 @@ def get_epg_content(
     Returns the combined XMLTV content as text for display in UI.
     Use max_lines=0 to return the full content without truncation.
     """
-    xmltv = _get_combined_xmltv()
+    with get_db() as conn:
+        xmltv = _get_combined_xmltv(conn)
 
     if not xmltv:
         return {"content": "", "total_lines": 0, "truncated": False, "size_bytes": 0}
 
-    lines = xmltv.split("\n")
-    total_lines = len(lines)
+    # Count and slice with C-level scans rather than splitting the whole
+    # document into a list of lines and joining it back together
+    total_lines = xmltv.count("\n") + 1
 
     # max_lines=0 means no limit
     if max_lines > 0 and total_lines > max_lines:
         truncated = True
-        lines = lines[:max_lines]
+        end = -1
+        for _ in range(max_lines):
+            end = xmltv.find("\n", end + 1)
+        content = xmltv[:end]
     else:
         truncated = False
+        content = xmltv
 
     return {
-        "content": "\n".join(lines),
+        "content": content,
         "total_lines": total_lines,
         "truncated": truncated,
         "size_bytes": len(xmltv.encode("utf-8")),
@@ -754,8 +885,6 @@ def get_matched_streams(
 
     Returns list of streams that were successfully matched to events.
     """
-    from teamarr.database.stats import get_matched_streams as db_get_matched
-
     with get_db() as conn:
         streams = db_get_matched(conn, run_id=run_id, group_id=group_id, limit=limit)
 
@@ -783,8 +912,6 @@ def get_failed_matches(
     - excluded_league: Matched but event is in non-configured league
     - exception: Stream contains exception keyword
     """
-    from teamarr.database.stats import get_failed_matches as db_get_failed
-
     with get_db() as conn:
         failures = db_get_failed(conn, run_id=run_id, group_id=group_id, reason=reason, limit=limit)
 
@@ -809,8 +936,6 @@ def get_match_stats(
     - Breakdown by group and league
     - Failure reasons breakdown
     """
-    from teamarr.database.stats import get_match_stats_summary
-
     with get_db() as conn:
         stats = get_match_stats_summary(conn, run_id=run_id)
 
@@ -834,12 +959,6 @@ def correct_stream_match(
 
     Use correct_event_id=None to mark a stream as "no event" (explicit skip).
     """
-    from teamarr.consumers.stream_match_cache import (
-        StreamMatchCache,
-        compute_fingerprint,
-        event_to_cache_data,
-    )
-
     cache = StreamMatchCache(get_db)
 
     # Get current cache entry if exists
@@ -899,8 +1018,6 @@ def remove_stream_correction(
     This deletes the user-corrected cache entry. On next EPG generation,
     the stream will be matched algorithmically again.
     """
-    from teamarr.consumers.stream_match_cache import StreamMatchCache, compute_fingerprint
-
     cache = StreamMatchCache(get_db)
 
     # Check if it's actually a user correction
@@ -949,8 +1066,6 @@ def search_events(
     Returns events matching the search criteria. Use this to find the
     correct event when manually correcting a failed or incorrect match.
     """
-    from teamarr.database.leagues import get_all_leagues
-
     target = _parse_date(target_date) if target_date else date.today()
     results: list[EventSearchResult] = []
 
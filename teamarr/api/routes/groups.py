@@ -6,12 +6,39 @@ Provides REST API for:
 - M3U group discovery from Dispatcharr
 """
 
+import asyncio
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from datetime import date
+from operator import attrgetter
+
 from fastapi import APIRouter, HTTPException, Query, status
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
+from teamarr.api.responses import FastJSONResponse
 from teamarr.database import get_db
-import logging
+from teamarr.database.groups import (
+    EventEPGGroup,
+    delete_group,
+    get_all_groups,
+    get_group,
+    get_group_by_name,
+    get_group_channel_counts,
+    get_group_with_counts,
+    set_group_enabled,
+    update_group,
+)
+from teamarr.database.groups import create_group as db_create_group
+from teamarr.database.groups import get_group_stats as db_get_group_stats
+from teamarr.database.settings import get_cached_dispatcharr_settings, get_display_settings
+from teamarr.dispatcharr import get_dispatcharr_connection, get_factory
+from teamarr.services import create_group_service
+from teamarr.utilities import fast_json
+from teamarr.utilities.cache import TTLCache
+from teamarr.utilities.xmltv import merge_xmltv_content
 
 logger = logging.getLogger(__name__)
 
@@ -327,6 +354,18 @@ class BulkGroupUpdateResponse(BaseModel):
     total_failed: int
 
 
+class GroupBatchUpdateItem(GroupUpdate):
+    """A per-group update within a batch; fields as in GroupUpdate."""
+
+    id: int
+
+
+class GroupBatchUpdateRequest(BaseModel):
+    """Batch update request: independent updates for several groups."""
+
+    updates: list[GroupBatchUpdateItem] = Field(..., min_length=1)
+
+
 # =============================================================================
 # VALIDATION
 # =============================================================================
@@ -337,6 +376,18 @@ VALID_CHANNEL_SORT_ORDER = {"time", "sport_time", "league_time"}
 VALID_OVERLAP_HANDLING = {"add_stream", "add_only", "create_all", "skip"}
 
 
+# (field name, allowed values, 400 detail), checked in order
+_VALIDATORS = tuple(
+    (field_name, valid, f"Invalid {field_name}. Valid: {sorted(valid)}")
+    for field_name, valid in (
+        ("duplicate_event_handling", VALID_DUPLICATE_HANDLING),
+        ("channel_assignment_mode", VALID_ASSIGNMENT_MODE),
+        ("channel_sort_order", VALID_CHANNEL_SORT_ORDER),
+        ("overlap_handling", VALID_OVERLAP_HANDLING),
+    )
+)
+
+
 def validate_group_fields(
     duplicate_event_handling: str | None = None,
     channel_assignment_mode: str | None = None,
@@ -344,26 +395,106 @@ def validate_group_fields(
     overlap_handling: str | None = None,
 ):
     """Validate group field values."""
-    if duplicate_event_handling and duplicate_event_handling not in VALID_DUPLICATE_HANDLING:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid duplicate_event_handling. Valid: {VALID_DUPLICATE_HANDLING}",
-        )
-    if channel_assignment_mode and channel_assignment_mode not in VALID_ASSIGNMENT_MODE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid channel_assignment_mode. Valid: {VALID_ASSIGNMENT_MODE}",
-        )
-    if channel_sort_order and channel_sort_order not in VALID_CHANNEL_SORT_ORDER:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid channel_sort_order. Valid: {VALID_CHANNEL_SORT_ORDER}",
-        )
-    if overlap_handling and overlap_handling not in VALID_OVERLAP_HANDLING:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid overlap_handling. Valid: {VALID_OVERLAP_HANDLING}",
-        )
+    values = (
+        duplicate_event_handling,
+        channel_assignment_mode,
+        channel_sort_order,
+        overlap_handling,
+    )
+    for value, (_, valid, detail) in zip(values, _VALIDATORS, strict=True):
+        if value and value not in valid:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+# Group IDs recently found missing. Repeated lookups of a nonexistent ID
+# (stale UI tabs, retries, crawlers) are answered without touching the DB.
+# IDs are AUTOINCREMENT so a missing ID only reappears via create (which
+# evicts it) or a backup restore, which the short TTL covers.
+MISSING_GROUP_CACHE_TTL_SECONDS = 5
+_missing_group_ids = TTLCache(default_ttl_seconds=MISSING_GROUP_CACHE_TTL_SECONDS, max_size=1024)
+
+
+def _raise_if_known_missing(group_id: int) -> None:
+    """Short-circuit with a 404 if group_id was recently found missing."""
+    if _missing_group_ids.get(str(group_id)):
+        raise _group_not_found(group_id)
+
+
+def _group_not_found(group_id: int) -> HTTPException:
+    """Build the 404 raised by every endpoint that looks up a group by ID.
+
+    Also records the ID in the missing-group cache.
+    """
+    _missing_group_ids.set(str(group_id), True)
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Group {group_id} not found",
+    )
+
+
+def _team_filter_payload(teams: list[dict] | None) -> list[dict] | None:
+    """Shape stored team filter entries like TeamFilterEntry would."""
+    if not teams:
+        return None
+    return [
+        {
+            "provider": t["provider"],
+            "team_id": t["team_id"],
+            "league": t["league"],
+            "name": t.get("name"),
+        }
+        for t in teams
+    ]
+
+
+# Every GroupResponse field except channel_count is an EventEPGGroup attribute
+# of the same name; attrgetter reads them all in a single C-level call.
+_GROUP_PAYLOAD_FIELDS = tuple(
+    name for name in GroupResponse.model_fields if name != "channel_count"
+)
+_group_payload_values = attrgetter(*_GROUP_PAYLOAD_FIELDS)
+
+# Groups encoded per chunk when streaming the group list
+LIST_STREAM_BATCH_SIZE = 100
+
+
+def _group_to_payload(
+    g: EventEPGGroup, channel_count: int | None = None, m3u_account_name: str | None = None
+) -> dict:
+    """Build the GroupResponse-shaped dict for a group.
+
+    Returned through FastJSONResponse, so datetimes are left for orjson to
+    encode. m3u_account_name overrides the stored name when given.
+    """
+    payload = dict(zip(_GROUP_PAYLOAD_FIELDS, _group_payload_values(g), strict=True))
+    payload["include_teams"] = _team_filter_payload(g.include_teams)
+    payload["exclude_teams"] = _team_filter_payload(g.exclude_teams)
+    if m3u_account_name is not None:
+        payload["m3u_account_name"] = m3u_account_name
+    payload["channel_count"] = channel_count
+    return payload
+
+
+def _iter_group_list_json(payloads: Iterable[dict], total: int) -> Iterator[bytes]:
+    """Encode a GroupListResponse body incrementally.
+
+    Groups are serialized LIST_STREAM_BATCH_SIZE at a time, so only one batch
+    of payload dicts and encoded bytes is alive at once. Batching (rather
+    than one chunk per group) keeps the threadpool hops Starlette makes per
+    chunk of a sync iterator from dominating small lists.
+    """
+    yield b'{"groups":['
+    batch: list[bytes] = []
+    separator = b""
+    for payload in payloads:
+        batch.append(fast_json.dumpb(payload))
+        if len(batch) == LIST_STREAM_BATCH_SIZE:
+            yield separator + b",".join(batch)
+            separator = b","
+            batch = []
+    if batch:
+        yield separator + b",".join(batch)
+    yield b'],"total":%d}' % total
 
 
 # =============================================================================
@@ -371,106 +502,47 @@ def validate_group_fields(
 # =============================================================================
 
 
-@router.get("", response_model=GroupListResponse)
+@router.get("", response_model=GroupListResponse, response_class=FastJSONResponse)
 def list_groups(
     include_disabled: bool = Query(False, description="Include disabled groups"),
     include_stats: bool = Query(False, description="Include channel counts"),
 ):
     """List all event EPG groups."""
-    from teamarr.database.groups import get_all_group_stats, get_all_groups
-    from teamarr.dispatcharr import get_dispatcharr_connection
 
     with get_db() as conn:
         groups = get_all_groups(conn, include_disabled=include_disabled)
 
-        stats = {}
+        channel_counts: dict[int, int] | None = None
         if include_stats:
-            stats = get_all_group_stats(conn)
+            channel_counts = get_group_channel_counts(conn, [g.id for g in groups])
 
-    # Fetch fresh M3U account names from Dispatcharr
+    # Fresh M3U account names from Dispatcharr (stored names are the fallback)
     m3u_account_names: dict[int, str] = {}
-    account_ids = {g.m3u_account_id for g in groups if g.m3u_account_id}
-    if account_ids:
-        try:
-            dispatcharr = get_dispatcharr_connection(get_db)
-            if dispatcharr:
-                accounts = dispatcharr.m3u.list_accounts()
-                m3u_account_names = {a.id: a.name for a in accounts}
-        except Exception:
-            pass  # Fall back to stored names if Dispatcharr unavailable
-
-    def get_account_name(g):
-        """Get fresh M3U account name, falling back to stored name."""
-        if g.m3u_account_id and g.m3u_account_id in m3u_account_names:
-            return m3u_account_names[g.m3u_account_id]
-        return g.m3u_account_name
-
-    return GroupListResponse(
-        groups=[
-            GroupResponse(
-                id=g.id,
-                name=g.name,
-                display_name=g.display_name,
-                leagues=g.leagues,
-                group_mode=g.group_mode,
-                parent_group_id=g.parent_group_id,
-                template_id=g.template_id,
-                channel_start_number=g.channel_start_number,
-                channel_group_id=g.channel_group_id,
-                channel_profile_ids=g.channel_profile_ids,
-                duplicate_event_handling=g.duplicate_event_handling,
-                channel_assignment_mode=g.channel_assignment_mode,
-                sort_order=g.sort_order,
-                total_stream_count=g.total_stream_count,
-                m3u_group_id=g.m3u_group_id,
-                m3u_group_name=g.m3u_group_name,
-                m3u_account_id=g.m3u_account_id,
-                m3u_account_name=get_account_name(g),
-                stream_include_regex=g.stream_include_regex,
-                stream_include_regex_enabled=g.stream_include_regex_enabled,
-                stream_exclude_regex=g.stream_exclude_regex,
-                stream_exclude_regex_enabled=g.stream_exclude_regex_enabled,
-                custom_regex_teams=g.custom_regex_teams,
-                custom_regex_teams_enabled=g.custom_regex_teams_enabled,
-                custom_regex_date=g.custom_regex_date,
-                custom_regex_date_enabled=g.custom_regex_date_enabled,
-                custom_regex_time=g.custom_regex_time,
-                custom_regex_time_enabled=g.custom_regex_time_enabled,
-                skip_builtin_filter=g.skip_builtin_filter,
-                include_teams=[TeamFilterEntry(**t) for t in g.include_teams] if g.include_teams else None,
-                exclude_teams=[TeamFilterEntry(**t) for t in g.exclude_teams] if g.exclude_teams else None,
-                team_filter_mode=g.team_filter_mode,
-                last_refresh=g.last_refresh.isoformat() if g.last_refresh else None,
-                stream_count=g.stream_count,
-                matched_count=g.matched_count,
-                filtered_stale=g.filtered_stale,
-                filtered_include_regex=g.filtered_include_regex,
-                filtered_exclude_regex=g.filtered_exclude_regex,
-                filtered_not_event=g.filtered_not_event,
-                filtered_team=g.filtered_team,
-                failed_count=g.failed_count,
-                streams_excluded=g.streams_excluded,
-                excluded_event_final=g.excluded_event_final,
-                excluded_event_past=g.excluded_event_past,
-                excluded_before_window=g.excluded_before_window,
-                excluded_league_not_included=g.excluded_league_not_included,
-                channel_sort_order=g.channel_sort_order,
-                overlap_handling=g.overlap_handling,
-                enabled=g.enabled,
-                created_at=g.created_at.isoformat() if g.created_at else None,
-                updated_at=g.updated_at.isoformat() if g.updated_at else None,
-                channel_count=stats.get(g.id, {}).get("active"),
-            )
-            for g in groups
-        ],
-        total=len(groups),
+    if any(g.m3u_account_id for g in groups):
+        m3u_account_names = _get_m3u_account_names()
+
+    payloads = (
+        _group_to_payload(
+            g,
+            # Groups with no active channels are absent from the counts
+            channel_count=channel_counts.get(g.id, 0) if channel_counts is not None else None,
+            m3u_account_name=m3u_account_names.get(g.m3u_account_id),
+        )
+        for g in groups
+    )
+    return StreamingResponse(
+        _iter_group_list_json(payloads, len(groups)), media_type="application/json"
     )
 
 
-@router.post("", response_model=GroupResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    response_model=GroupResponse,
+    response_class=FastJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+)
 def create_group(request: GroupCreate):
     """Create a new event EPG group."""
-    from teamarr.database.groups import create_group, get_group, get_group_by_name
 
     validate_group_fields(
         duplicate_event_handling=request.duplicate_event_handling,
@@ -480,15 +552,7 @@ def create_group(request: GroupCreate):
     )
 
     with get_db() as conn:
-        # Check for duplicate name within same M3U account
-        existing = get_group_by_name(conn, request.name, request.m3u_account_id)
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Group with name '{request.name}' already exists for this M3U account",
-            )
-
-        group_id = create_group(
+        group = db_create_group(
             conn,
             name=request.name,
             leagues=request.leagues,
@@ -527,64 +591,17 @@ def create_group(request: GroupCreate):
             enabled=request.enabled,
         )
 
-        group = get_group(conn, group_id)
+    # None means the name is taken within this M3U account
+    if group is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Group with name '{request.name}' already exists for this M3U account",
+        )
 
-    logger.info("[CREATED] Event group id=%d name=%s", group_id, request.name)
-
-    return GroupResponse(
-        id=group.id,
-        name=group.name,
-        display_name=group.display_name,
-        leagues=group.leagues,
-        group_mode=group.group_mode,
-        parent_group_id=group.parent_group_id,
-        template_id=group.template_id,
-        channel_start_number=group.channel_start_number,
-        channel_group_id=group.channel_group_id,
-        channel_group_mode=group.channel_group_mode,
-        channel_profile_ids=group.channel_profile_ids,
-        duplicate_event_handling=group.duplicate_event_handling,
-        channel_assignment_mode=group.channel_assignment_mode,
-        sort_order=group.sort_order,
-        total_stream_count=group.total_stream_count,
-        m3u_group_id=group.m3u_group_id,
-        m3u_group_name=group.m3u_group_name,
-        m3u_account_id=group.m3u_account_id,
-        m3u_account_name=group.m3u_account_name,
-        stream_include_regex=group.stream_include_regex,
-        stream_include_regex_enabled=group.stream_include_regex_enabled,
-        stream_exclude_regex=group.stream_exclude_regex,
-        stream_exclude_regex_enabled=group.stream_exclude_regex_enabled,
-        custom_regex_teams=group.custom_regex_teams,
-        custom_regex_teams_enabled=group.custom_regex_teams_enabled,
-        custom_regex_date=group.custom_regex_date,
-        custom_regex_date_enabled=group.custom_regex_date_enabled,
-        custom_regex_time=group.custom_regex_time,
-        custom_regex_time_enabled=group.custom_regex_time_enabled,
-        skip_builtin_filter=group.skip_builtin_filter,
-        include_teams=[TeamFilterEntry(**t) for t in group.include_teams] if group.include_teams else None,
-        exclude_teams=[TeamFilterEntry(**t) for t in group.exclude_teams] if group.exclude_teams else None,
-        team_filter_mode=group.team_filter_mode,
-        last_refresh=group.last_refresh.isoformat() if group.last_refresh else None,
-        stream_count=group.stream_count,
-        matched_count=group.matched_count,
-        filtered_stale=group.filtered_stale,
-        filtered_include_regex=group.filtered_include_regex,
-        filtered_exclude_regex=group.filtered_exclude_regex,
-        filtered_not_event=group.filtered_not_event,
-        filtered_team=group.filtered_team,
-        failed_count=group.failed_count,
-        streams_excluded=group.streams_excluded,
-        excluded_event_final=group.excluded_event_final,
-        excluded_event_past=group.excluded_event_past,
-        excluded_before_window=group.excluded_before_window,
-        excluded_league_not_included=group.excluded_league_not_included,
-        channel_sort_order=group.channel_sort_order,
-        overlap_handling=group.overlap_handling,
-        enabled=group.enabled,
-        created_at=group.created_at.isoformat() if group.created_at else None,
-        updated_at=group.updated_at.isoformat() if group.updated_at else None,
-    )
+    _missing_group_ids.delete(str(group.id))
+    logger.info("[CREATED] Event group id=%d name=%s", group.id, request.name)
+
+    return FastJSONResponse(_group_to_payload(group), status_code=status.HTTP_201_CREATED)
 
 
 @router.post("/bulk", response_model=BulkGroupCreateResponse, status_code=status.HTTP_201_CREATED)
@@ -594,7 +611,6 @@ def create_groups_bulk(request: BulkGroupCreateRequest):
     All groups will be created with the same mode, leagues, and settings.
     Useful for importing multiple groups from the same M3U account.
     """
-    from teamarr.database.groups import create_group, get_group_by_name
 
     # Validate settings
     validate_group_fields(
@@ -610,21 +626,8 @@ def create_groups_bulk(request: BulkGroupCreateRequest):
     with get_db() as conn:
         for item in request.groups:
             try:
-                # Check for duplicate name within same M3U account
-                existing = get_group_by_name(conn, item.m3u_group_name, item.m3u_account_id)
-                if existing:
-                    results.append(BulkGroupCreateResult(
-                        m3u_group_id=item.m3u_group_id,
-                        m3u_account_id=item.m3u_account_id,
-                        name=item.m3u_group_name,
-                        success=False,
-                        error=f"Group already exists for this M3U account",
-                    ))
-                    total_failed += 1
-                    continue
-
-                # Create the group
-                group_id = create_group(
+                # Create the group (None if the name is taken within the account)
+                group = db_create_group(
                     conn,
                     name=item.m3u_group_name,
                     leagues=request.settings.leagues,
@@ -642,11 +645,22 @@ def create_groups_bulk(request: BulkGroupCreateRequest):
                     m3u_account_name=item.m3u_account_name,
                     enabled=request.settings.enabled,
                 )
+                if group is None:
+                    results.append(BulkGroupCreateResult(
+                        m3u_group_id=item.m3u_group_id,
+                        m3u_account_id=item.m3u_account_id,
+                        name=item.m3u_group_name,
+                        success=False,
+                        error="Group already exists for this M3U account",
+                    ))
+                    total_failed += 1
+                    continue
 
+                _missing_group_ids.delete(str(group.id))
                 results.append(BulkGroupCreateResult(
                     m3u_group_id=item.m3u_group_id,
                     m3u_account_id=item.m3u_account_id,
-                    group_id=group_id,
+                    group_id=group.id,
                     name=item.m3u_group_name,
                     success=True,
                 ))
@@ -682,7 +696,6 @@ def update_groups_bulk(request: BulkGroupUpdateRequest):
     Note: All groups must have the same group_mode (single/multi) - the frontend
     should prevent mixed selections.
     """
-    from teamarr.database.groups import get_group, update_group
 
     # Validate fields
     validate_group_fields(
@@ -751,102 +764,180 @@ def update_groups_bulk(request: BulkGroupUpdateRequest):
     )
 
 
-@router.get("/{group_id}", response_model=GroupResponse)
+@router.post("/batch", response_model=GroupListResponse, response_class=FastJSONResponse)
+def update_groups_batch(request: GroupBatchUpdateRequest):
+    """Apply independent updates to several groups in one transaction.
+
+    Unlike PUT /bulk (one set of values for many groups), each item carries
+    its own fields. All items are validated before any write, and the batch
+    is all-or-nothing: a missing group or duplicate name rolls back every
+    update and returns that item's error.
+    """
+    for item in request.updates:
+        validate_group_fields(
+            duplicate_event_handling=item.duplicate_event_handling,
+            channel_assignment_mode=item.channel_assignment_mode,
+            channel_sort_order=item.channel_sort_order,
+            overlap_handling=item.overlap_handling,
+        )
+
+    group_ids = [item.id for item in request.updates]
+    with get_db() as conn:
+        for item in request.updates:
+            _apply_group_update(conn, item.id, item)
+
+        groups = []
+        for group_id in group_ids:
+            group = get_group(conn, group_id)
+            if not group:
+                raise _group_not_found(group_id)
+            groups.append(group)
+        channel_counts = get_group_channel_counts(conn, group_ids)
+
+    logger.info("[BATCH_UPDATE] Event groups: %d updated", len(groups))
+
+    rows = [_group_to_payload(g, channel_counts.get(g.id, 0)) for g in groups]
+    return FastJSONResponse({"groups": rows, "total": len(rows)})
+
+
+@router.get("/{group_id}", response_model=GroupResponse, response_class=FastJSONResponse)
 def get_group_by_id(group_id: int):
     """Get a single event EPG group."""
-    from teamarr.database.groups import get_group, get_group_channel_count
-    from teamarr.dispatcharr import get_dispatcharr_connection
+    _raise_if_known_missing(group_id)
 
     with get_db() as conn:
-        group = get_group(conn, group_id)
-        if not group:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Group {group_id} not found",
-            )
+        found = get_group_with_counts(conn, group_id)
+    if not found:
+        raise _group_not_found(group_id)
+    group, channel_count = found
 
-        channel_count = get_group_channel_count(conn, group_id)
-
-    # Fetch fresh M3U account name from Dispatcharr
-    m3u_account_name = group.m3u_account_name
+    # Fresh M3U account name from Dispatcharr (stored name is the fallback)
+    m3u_account_name = None
     if group.m3u_account_id:
-        try:
-            dispatcharr = get_dispatcharr_connection(get_db)
-            if dispatcharr:
-                accounts = dispatcharr.m3u.list_accounts()
-                for a in accounts:
-                    if a.id == group.m3u_account_id:
-                        m3u_account_name = a.name
-                        break
-        except Exception:
-            pass  # Fall back to stored name if Dispatcharr unavailable
-
-    return GroupResponse(
-        id=group.id,
-        name=group.name,
-        display_name=group.display_name,
-        leagues=group.leagues,
-        group_mode=group.group_mode,
-        parent_group_id=group.parent_group_id,
-        template_id=group.template_id,
-        channel_start_number=group.channel_start_number,
-        channel_group_id=group.channel_group_id,
-        channel_group_mode=group.channel_group_mode,
-        channel_profile_ids=group.channel_profile_ids,
-        duplicate_event_handling=group.duplicate_event_handling,
-        channel_assignment_mode=group.channel_assignment_mode,
-        sort_order=group.sort_order,
-        total_stream_count=group.total_stream_count,
-        m3u_group_id=group.m3u_group_id,
-        m3u_group_name=group.m3u_group_name,
-        m3u_account_id=group.m3u_account_id,
-        m3u_account_name=m3u_account_name,
-        stream_include_regex=group.stream_include_regex,
-        stream_include_regex_enabled=group.stream_include_regex_enabled,
-        stream_exclude_regex=group.stream_exclude_regex,
-        stream_exclude_regex_enabled=group.stream_exclude_regex_enabled,
-        custom_regex_teams=group.custom_regex_teams,
-        custom_regex_teams_enabled=group.custom_regex_teams_enabled,
-        custom_regex_date=group.custom_regex_date,
-        custom_regex_date_enabled=group.custom_regex_date_enabled,
-        custom_regex_time=group.custom_regex_time,
-        custom_regex_time_enabled=group.custom_regex_time_enabled,
-        skip_builtin_filter=group.skip_builtin_filter,
-        include_teams=[TeamFilterEntry(**t) for t in group.include_teams] if group.include_teams else None,
-        exclude_teams=[TeamFilterEntry(**t) for t in group.exclude_teams] if group.exclude_teams else None,
-        team_filter_mode=group.team_filter_mode,
-        last_refresh=group.last_refresh.isoformat() if group.last_refresh else None,
-        stream_count=group.stream_count,
-        matched_count=group.matched_count,
-        filtered_stale=group.filtered_stale,
-        filtered_include_regex=group.filtered_include_regex,
-        filtered_exclude_regex=group.filtered_exclude_regex,
-        filtered_not_event=group.filtered_not_event,
-        filtered_team=group.filtered_team,
-        failed_count=group.failed_count,
-        streams_excluded=group.streams_excluded,
-        excluded_event_final=group.excluded_event_final,
-        excluded_event_past=group.excluded_event_past,
-        excluded_before_window=group.excluded_before_window,
-        excluded_league_not_included=group.excluded_league_not_included,
-        channel_sort_order=group.channel_sort_order,
-        overlap_handling=group.overlap_handling,
-        enabled=group.enabled,
-        created_at=group.created_at.isoformat() if group.created_at else None,
-        updated_at=group.updated_at.isoformat() if group.updated_at else None,
-        channel_count=channel_count,
+        m3u_account_name = _get_m3u_account_names().get(group.m3u_account_id)
+
+    return FastJSONResponse(
+        _group_to_payload(group, channel_count, m3u_account_name=m3u_account_name)
+    )
+
+
+def _duplicate_name_error(name: str | None) -> HTTPException:
+    """Build the 409 for a group name already taken within an M3U account."""
+    if name:
+        detail = f"Group with name '{name}' already exists for this M3U account"
+    else:
+        detail = "Group with this name already exists for this M3U account"
+    return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+
+def _apply_group_update(conn, group_id: int, request: GroupUpdate) -> None:
+    """Apply a GroupUpdate inside an open transaction.
+
+    Does not check that the group exists; callers re-read the group after
+    the update and raise 404 when it is missing.
+
+    Name uniqueness within an M3U account is enforced by the
+    (name, m3u_account_id) unique index, so a clash surfaces as an
+    IntegrityError from the UPDATE itself. The index cannot see clashes when
+    the target account is NULL (NULLs are distinct), where a name must be
+    globally unique, so only that case is checked up front.
+
+    Raises:
+        HTTPException: 409 on a duplicate name
+    """
+    if request.clear_m3u_account_id or (request.name and request.m3u_account_id is None):
+        group = get_group(conn, group_id)
+        if group:
+            target_account_id = None if request.clear_m3u_account_id else group.m3u_account_id
+            target_name = request.name or group.name
+            if target_account_id is None and (
+                target_name != group.name or group.m3u_account_id is not None
+            ):
+                existing = get_group_by_name(conn, target_name, None)
+                if existing and existing.id != group_id:
+                    raise _duplicate_name_error(target_name)
+
+    try:
+        _update_group_fields(conn, group_id, request)
+    except sqlite3.IntegrityError as e:
+        if "UNIQUE" not in str(e):
+            raise
+        name = request.name
+        if not name:
+            # Error path only: look up the unchanged name for the message
+            group = get_group(conn, group_id)
+            name = group.name if group else None
+        raise _duplicate_name_error(name) from e
+
+    # Clean up XMLTV content when group is disabled
+    if request.enabled is False:
+        conn.execute("DELETE FROM event_epg_xmltv WHERE group_id = ?", (group_id,))
+
+
+def _update_group_fields(conn, group_id: int, request: GroupUpdate) -> None:
+    """Write the fields set on a GroupUpdate."""
+    update_group(
+        conn,
+        group_id,
+        name=request.name,
+        display_name=request.display_name,
+        leagues=request.leagues,
+        group_mode=request.group_mode,
+        parent_group_id=request.parent_group_id,
+        template_id=request.template_id,
+        channel_start_number=request.channel_start_number,
+        channel_group_id=request.channel_group_id,
+        channel_group_mode=request.channel_group_mode,
+        channel_profile_ids=request.channel_profile_ids,
+        duplicate_event_handling=request.duplicate_event_handling,
+        channel_assignment_mode=request.channel_assignment_mode,
+        sort_order=request.sort_order,
+        total_stream_count=request.total_stream_count,
+        m3u_group_id=request.m3u_group_id,
+        m3u_group_name=request.m3u_group_name,
+        m3u_account_id=request.m3u_account_id,
+        m3u_account_name=request.m3u_account_name,
+        stream_include_regex=request.stream_include_regex,
+        stream_include_regex_enabled=request.stream_include_regex_enabled,
+        stream_exclude_regex=request.stream_exclude_regex,
+        stream_exclude_regex_enabled=request.stream_exclude_regex_enabled,
+        custom_regex_teams=request.custom_regex_teams,
+        custom_regex_teams_enabled=request.custom_regex_teams_enabled,
+        custom_regex_date=request.custom_regex_date,
+        custom_regex_date_enabled=request.custom_regex_date_enabled,
+        custom_regex_time=request.custom_regex_time,
+        custom_regex_time_enabled=request.custom_regex_time_enabled,
+        skip_builtin_filter=request.skip_builtin_filter,
+        include_teams=[t.model_dump() for t in request.include_teams] if request.include_teams is not None else None,
+        exclude_teams=[t.model_dump() for t in request.exclude_teams] if request.exclude_teams is not None else None,
+        team_filter_mode=request.team_filter_mode,
+        channel_sort_order=request.channel_sort_order,
+        overlap_handling=request.overlap_handling,
+        enabled=request.enabled,
+        clear_display_name=request.clear_display_name,
+        clear_parent_group_id=request.clear_parent_group_id,
+        clear_template=request.clear_template,
+        clear_channel_start_number=request.clear_channel_start_number,
+        clear_channel_group_id=request.clear_channel_group_id,
+        clear_channel_profile_ids=request.clear_channel_profile_ids,
+        clear_m3u_group_id=request.clear_m3u_group_id,
+        clear_m3u_group_name=request.clear_m3u_group_name,
+        clear_m3u_account_id=request.clear_m3u_account_id,
+        clear_m3u_account_name=request.clear_m3u_account_name,
+        clear_stream_include_regex=request.clear_stream_include_regex,
+        clear_stream_exclude_regex=request.clear_stream_exclude_regex,
+        clear_custom_regex_teams=request.clear_custom_regex_teams,
+        clear_custom_regex_date=request.clear_custom_regex_date,
+        clear_custom_regex_time=request.clear_custom_regex_time,
+        clear_include_teams=request.clear_include_teams,
+        clear_exclude_teams=request.clear_exclude_teams,
     )
 
 
-@router.put("/{group_id}", response_model=GroupResponse)
+@router.put("/{group_id}", response_model=GroupResponse, response_class=FastJSONResponse)
 def update_group_by_id(group_id: int, request: GroupUpdate):
     """Update an event EPG group."""
-    from teamarr.database.groups import (
-        get_group,
-        get_group_by_name,
-        get_group_channel_count,
-        update_group,
-    )
+    _raise_if_known_missing(group_id)
 
     validate_group_fields(
         duplicate_event_handling=request.duplicate_event_handling,
@@ -856,150 +947,15 @@ def update_group_by_id(group_id: int, request: GroupUpdate):
     )
 
     with get_db() as conn:
-        group = get_group(conn, group_id)
-        if not group:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Group {group_id} not found",
-            )
-
-        # Check for duplicate name if changing (within same M3U account)
-        # Determine the target account_id (could be changing)
-        target_account_id = (
-            None if request.clear_m3u_account_id
-            else request.m3u_account_id if request.m3u_account_id is not None
-            else group.m3u_account_id
-        )
-        target_name = request.name if request.name else group.name
-        if target_name != group.name or target_account_id != group.m3u_account_id:
-            existing = get_group_by_name(conn, target_name, target_account_id)
-            if existing and existing.id != group_id:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail=f"Group with name '{target_name}' already exists for this M3U account",
-                )
-
-        update_group(
-            conn,
-            group_id,
-            name=request.name,
-            display_name=request.display_name,
-            leagues=request.leagues,
-            group_mode=request.group_mode,
-            parent_group_id=request.parent_group_id,
-            template_id=request.template_id,
-            channel_start_number=request.channel_start_number,
-            channel_group_id=request.channel_group_id,
-            channel_group_mode=request.channel_group_mode,
-            channel_profile_ids=request.channel_profile_ids,
-            duplicate_event_handling=request.duplicate_event_handling,
-            channel_assignment_mode=request.channel_assignment_mode,
-            sort_order=request.sort_order,
-            total_stream_count=request.total_stream_count,
-            m3u_group_id=request.m3u_group_id,
-            m3u_group_name=request.m3u_group_name,
-            m3u_account_id=request.m3u_account_id,
-            m3u_account_name=request.m3u_account_name,
-            stream_include_regex=request.stream_include_regex,
-            stream_include_regex_enabled=request.stream_include_regex_enabled,
-            stream_exclude_regex=request.stream_exclude_regex,
-            stream_exclude_regex_enabled=request.stream_exclude_regex_enabled,
-            custom_regex_teams=request.custom_regex_teams,
-            custom_regex_teams_enabled=request.custom_regex_teams_enabled,
-            custom_regex_date=request.custom_regex_date,
-            custom_regex_date_enabled=request.custom_regex_date_enabled,
-            custom_regex_time=request.custom_regex_time,
-            custom_regex_time_enabled=request.custom_regex_time_enabled,
-            skip_builtin_filter=request.skip_builtin_filter,
-            include_teams=[t.model_dump() for t in request.include_teams] if request.include_teams is not None else None,
-            exclude_teams=[t.model_dump() for t in request.exclude_teams] if request.exclude_teams is not None else None,
-            team_filter_mode=request.team_filter_mode,
-            channel_sort_order=request.channel_sort_order,
-            overlap_handling=request.overlap_handling,
-            enabled=request.enabled,
-            clear_display_name=request.clear_display_name,
-            clear_parent_group_id=request.clear_parent_group_id,
-            clear_template=request.clear_template,
-            clear_channel_start_number=request.clear_channel_start_number,
-            clear_channel_group_id=request.clear_channel_group_id,
-            clear_channel_profile_ids=request.clear_channel_profile_ids,
-            clear_m3u_group_id=request.clear_m3u_group_id,
-            clear_m3u_group_name=request.clear_m3u_group_name,
-            clear_m3u_account_id=request.clear_m3u_account_id,
-            clear_m3u_account_name=request.clear_m3u_account_name,
-            clear_stream_include_regex=request.clear_stream_include_regex,
-            clear_stream_exclude_regex=request.clear_stream_exclude_regex,
-            clear_custom_regex_teams=request.clear_custom_regex_teams,
-            clear_custom_regex_date=request.clear_custom_regex_date,
-            clear_custom_regex_time=request.clear_custom_regex_time,
-            clear_include_teams=request.clear_include_teams,
-            clear_exclude_teams=request.clear_exclude_teams,
-        )
-
-        # Clean up XMLTV content when group is disabled
-        if request.enabled is False:
-            conn.execute("DELETE FROM event_epg_xmltv WHERE group_id = ?", (group_id,))
-
-        group = get_group(conn, group_id)
-        channel_count = get_group_channel_count(conn, group_id)
+        _apply_group_update(conn, group_id, request)
+        found = get_group_with_counts(conn, group_id)
+        if not found:
+            raise _group_not_found(group_id)
+        group, channel_count = found
 
     logger.info("[UPDATED] Event group id=%d", group_id)
 
-    return GroupResponse(
-        id=group.id,
-        name=group.name,
-        display_name=group.display_name,
-        leagues=group.leagues,
-        group_mode=group.group_mode,
-        parent_group_id=group.parent_group_id,
-        template_id=group.template_id,
-        channel_start_number=group.channel_start_number,
-        channel_group_id=group.channel_group_id,
-        channel_group_mode=group.channel_group_mode,
-        channel_profile_ids=group.channel_profile_ids,
-        duplicate_event_handling=group.duplicate_event_handling,
-        channel_assignment_mode=group.channel_assignment_mode,
-        sort_order=group.sort_order,
-        total_stream_count=group.total_stream_count,
-        m3u_group_id=group.m3u_group_id,
-        m3u_group_name=group.m3u_group_name,
-        m3u_account_id=group.m3u_account_id,
-        m3u_account_name=group.m3u_account_name,
-        stream_include_regex=group.stream_include_regex,
-        stream_include_regex_enabled=group.stream_include_regex_enabled,
-        stream_exclude_regex=group.stream_exclude_regex,
-        stream_exclude_regex_enabled=group.stream_exclude_regex_enabled,
-        custom_regex_teams=group.custom_regex_teams,
-        custom_regex_teams_enabled=group.custom_regex_teams_enabled,
-        custom_regex_date=group.custom_regex_date,
-        custom_regex_date_enabled=group.custom_regex_date_enabled,
-        custom_regex_time=group.custom_regex_time,
-        custom_regex_time_enabled=group.custom_regex_time_enabled,
-        skip_builtin_filter=group.skip_builtin_filter,
-        include_teams=[TeamFilterEntry(**t) for t in group.include_teams] if group.include_teams else None,
-        exclude_teams=[TeamFilterEntry(**t) for t in group.exclude_teams] if group.exclude_teams else None,
-        team_filter_mode=group.team_filter_mode,
-        last_refresh=group.last_refresh.isoformat() if group.last_refresh else None,
-        stream_count=group.stream_count,
-        matched_count=group.matched_count,
-        filtered_stale=group.filtered_stale,
-        filtered_include_regex=group.filtered_include_regex,
-        filtered_exclude_regex=group.filtered_exclude_regex,
-        filtered_not_event=group.filtered_not_event,
-        filtered_team=group.filtered_team,
-        failed_count=group.failed_count,
-        streams_excluded=group.streams_excluded,
-        excluded_event_final=group.excluded_event_final,
-        excluded_event_past=group.excluded_event_past,
-        excluded_before_window=group.excluded_before_window,
-        excluded_league_not_included=group.excluded_league_not_included,
-        channel_sort_order=group.channel_sort_order,
-        overlap_handling=group.overlap_handling,
-        enabled=group.enabled,
-        created_at=group.created_at.isoformat() if group.created_at else None,
-        updated_at=group.updated_at.isoformat() if group.updated_at else None,
-        channel_count=channel_count,
-    )
+    return FastJSONResponse(_group_to_payload(group, channel_count))
 
 
 @router.delete("/{group_id}")
@@ -1008,17 +964,14 @@ def delete_group_by_id(group_id: int) -> dict:
 
     Warning: This will cascade delete all managed channels for this group.
     """
-    from teamarr.database.groups import delete_group, get_group, get_group_channel_count
+    _raise_if_known_missing(group_id)
 
     with get_db() as conn:
-        group = get_group(conn, group_id)
-        if not group:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Group {group_id} not found",
-            )
+        found = get_group_with_counts(conn, group_id)
+        if not found:
+            raise _group_not_found(group_id)
 
-        channel_count = get_group_channel_count(conn, group_id)
+        group, channel_count = found
         delete_group(conn, group_id)
 
     logger.info("[DELETED] Event group id=%d name=%s channels=%d", group_id, group.name, channel_count)
@@ -1033,17 +986,14 @@ def delete_group_by_id(group_id: int) -> dict:
 @router.get("/{group_id}/stats", response_model=GroupStatsResponse)
 def get_group_stats(group_id: int):
     """Get statistics for an event EPG group."""
-    from teamarr.database.groups import get_group, get_group_stats
+    _raise_if_known_missing(group_id)
 
     with get_db() as conn:
         group = get_group(conn, group_id)
         if not group:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Group {group_id} not found",
-            )
+            raise _group_not_found(group_id)
 
-        stats = get_group_stats(conn, group_id)
+        stats = db_get_group_stats(conn, group_id)
 
     return GroupStatsResponse(
         group_id=group_id,
@@ -1054,15 +1004,12 @@ def get_group_stats(group_id: int):
 @router.post("/{group_id}/enable")
 def enable_group(group_id: int) -> dict:
     """Enable an event EPG group."""
-    from teamarr.database.groups import get_group, set_group_enabled
+    _raise_if_known_missing(group_id)
 
     with get_db() as conn:
         group = get_group(conn, group_id)
         if not group:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Group {group_id} not found",
-            )
+            raise _group_not_found(group_id)
 
         set_group_enabled(conn, group_id, True)
 
@@ -1072,15 +1019,12 @@ def enable_group(group_id: int) -> dict:
 @router.post("/{group_id}/disable")
 def disable_group(group_id: int) -> dict:
     """Disable an event EPG group."""
-    from teamarr.database.groups import get_group, set_group_enabled
+    _raise_if_known_missing(group_id)
 
     with get_db() as conn:
         group = get_group(conn, group_id)
         if not group:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Group {group_id} not found",
-            )
+            raise _group_not_found(group_id)
 
         set_group_enabled(conn, group_id, False)
 
@@ -1092,13 +1036,29 @@ def disable_group(group_id: int) -> dict:
 # =============================================================================
 
 
-@router.get("/m3u/groups", response_model=M3UGroupListResponse)
-def list_m3u_groups():
-    """List available M3U groups from Dispatcharr.
+# Dispatcharr M3U groups and account names change rarely but are read on
+# every group list/detail request and polled by the UI dropdowns
+M3U_LOOKUP_CACHE_TTL_SECONDS = 30
+_m3u_lookup_cache = TTLCache(default_ttl_seconds=M3U_LOOKUP_CACHE_TTL_SECONDS, max_size=16)
+_m3u_lookup_fetch_lock = threading.Lock()
 
-    Returns groups that can be used as stream sources for event EPG groups.
+
+def _m3u_lookup_cache_key(kind: str) -> str:
+    """Cache key for a lookup, scoped to the configured Dispatcharr instance.
+
+    Pointing Teamarr at another URL or user changes the key, so lookups cached
+    against the previous server are never served for the new one.
+    """
+    settings = get_cached_dispatcharr_settings(get_db)
+    return f"{kind}:{settings.url}:{settings.username}"
+
+
+def _fetch_m3u_groups(what: str) -> list:
+    """Fetch M3U groups from Dispatcharr (blocking; run off the event loop).
+
+    Args:
+        what: Description used in the error detail, e.g. "M3U groups"
     """
-    from teamarr.dispatcharr import get_dispatcharr_connection
 
     conn = get_dispatcharr_connection(get_db)
     if not conn:
@@ -1107,13 +1067,63 @@ def list_m3u_groups():
             detail="Dispatcharr not configured or not connected",
         )
 
+    cache_key = _m3u_lookup_cache_key("groups")
+    groups = _m3u_lookup_cache.get(cache_key)
+    if groups is not None:
+        return groups
+
+    # Serialize misses so a burst of requests triggers one upstream fetch
+    with _m3u_lookup_fetch_lock:
+        groups = _m3u_lookup_cache.get(cache_key)
+        if groups is not None:
+            return groups
+        try:
+            groups = conn.m3u.list_groups()
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to fetch {what}: {e}",
+            ) from e
+        # An empty list usually means the upstream call failed; don't pin it
+        if groups:
+            _m3u_lookup_cache.set(cache_key, groups)
+    return groups
+
+
+def _get_m3u_account_names() -> dict[int, str]:
+    """Map M3U account ID to its current name in Dispatcharr.
+
+    Returns an empty dict if Dispatcharr is unavailable, so callers fall
+    back to the names stored on the groups.
+    """
     try:
-        groups = conn.m3u.list_groups()
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch M3U groups: {e}",
-        ) from e
+        conn = get_dispatcharr_connection(get_db)
+        if not conn:
+            return {}
+
+        cache_key = _m3u_lookup_cache_key("accounts")
+        names = _m3u_lookup_cache.get(cache_key)
+        if names is not None:
+            return names
+
+        with _m3u_lookup_fetch_lock:
+            names = _m3u_lookup_cache.get(cache_key)
+            if names is None:
+                names = {a.id: a.name for a in conn.m3u.list_accounts()}
+                if names:
+                    _m3u_lookup_cache.set(cache_key, names)
+        return names
+    except Exception:
+        return {}  # Fall back to stored names if Dispatcharr unavailable
+
+
+@router.get("/m3u/groups", response_model=M3UGroupListResponse)
+async def list_m3u_groups():
+    """List available M3U groups from Dispatcharr.
+
+    Returns groups that can be used as stream sources for event EPG groups.
+    """
+    groups = await asyncio.to_thread(_fetch_m3u_groups, "M3U groups")
 
     return M3UGroupListResponse(
         groups=[
@@ -1129,27 +1139,12 @@ def list_m3u_groups():
 
 
 @router.get("/dispatcharr/channel-groups")
-def list_dispatcharr_channel_groups() -> dict:
+async def list_dispatcharr_channel_groups() -> dict:
     """List available channel groups from Dispatcharr.
 
     Returns channel groups that can be assigned to event EPG groups.
     """
-    from teamarr.dispatcharr import get_dispatcharr_connection
-
-    conn = get_dispatcharr_connection(get_db)
-    if not conn:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Dispatcharr not configured or not connected",
-        )
-
-    try:
-        groups = conn.m3u.list_groups()
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch channel groups: {e}",
-        ) from e
+    groups = await asyncio.to_thread(_fetch_m3u_groups, "channel groups")
 
     return {
         "groups": [{"id": g.id, "name": g.name} for g in groups],
@@ -1230,19 +1225,11 @@ def preview_group(group_id: int):
     Fetches streams from Dispatcharr, filters them, matches them to events,
     but does NOT create channels or generate EPG.
     """
-    from datetime import date
-
-    from teamarr.database.groups import get_group
-    from teamarr.dispatcharr import get_factory
-    from teamarr.services import create_group_service
 
     with get_db() as conn:
         group = get_group(conn, group_id)
         if not group:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Group {group_id} not found",
-            )
+            raise _group_not_found(group_id)
 
     # Get Dispatcharr connection (has m3u manager)
     factory = get_factory(get_db)
@@ -1292,19 +1279,11 @@ def process_group(group_id: int):
     Fetches streams from Dispatcharr, matches them to events,
     and creates/updates channels.
     """
-    from datetime import date
-
-    from teamarr.database.groups import get_group
-    from teamarr.dispatcharr import get_factory
-    from teamarr.services import create_group_service
 
     with get_db() as conn:
         group = get_group(conn, group_id)
         if not group:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Group {group_id} not found",
-            )
+            raise _group_not_found(group_id)
 
     # Get Dispatcharr client
     factory = get_factory(get_db)
@@ -1340,10 +1319,6 @@ def process_all_groups():
     Fetches streams from Dispatcharr, matches them to events,
     and creates/updates channels for all active groups.
     """
-    from datetime import date
-
-    from teamarr.dispatcharr import get_factory
-    from teamarr.services import create_group_service
 
     # Get Dispatcharr client
     factory = get_factory(get_db)
@@ -1400,16 +1375,12 @@ def get_group_xmltv(group_id: int) -> Response:
 
     Returns 404 if the group hasn't been processed yet.
     """
-    from teamarr.database.groups import get_group
 
     with get_db() as conn:
         # Verify group exists
         group = get_group(conn, group_id)
         if not group:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Group {group_id} not found",
-            )
+            raise _group_not_found(group_id)
 
         # Get stored XMLTV
         row = conn.execute(
@@ -1440,9 +1411,6 @@ def get_combined_xmltv() -> Response:
     Merges XMLTV content from all groups that have been processed.
     This is useful for having a single EPG source in Dispatcharr.
     """
-    from teamarr.database.groups import get_all_groups
-    from teamarr.database.settings import get_display_settings
-    from teamarr.utilities.xmltv import merge_xmltv_content
 
     with get_db() as conn:
         # Get all enabled groups
@@ -4,18 +4,26 @@ from datetime import date, datetime
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from teamarr.api.dependencies import get_sports_service
+from teamarr.api.dependencies import get_matching_service
 from teamarr.api.models import EventMatchRequest, EventMatchResponse
-from teamarr.services import SportsDataService, create_matching_service
+from teamarr.api.responses import FastJSONResponse
+from teamarr.services import MatchingService
 
 router = APIRouter()
 
+# Serialized as-is for every miss; same shape as EventMatchResponse(found=False)
+_NOT_FOUND_PAYLOAD = EventMatchResponse(found=False).model_dump()
+
 
 def _parse_date(date_str: str | None) -> date:
     """Parse date string or return today."""
     if not date_str:
         return date.today()
     try:
+        # Canonical YYYY-MM-DD takes the C fast path; strptime still covers
+        # unpadded forms like 2024-1-5
+        if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+            return date.fromisoformat(date_str)
         return datetime.strptime(date_str, "%Y-%m-%d").date()
     except ValueError:
         raise HTTPException(
@@ -24,14 +32,15 @@ def _parse_date(date_str: str | None) -> date:
         ) from None
 
 
-@router.post("/matching/events", response_model=EventMatchResponse)
+@router.post(
+    "/matching/events", response_model=EventMatchResponse, response_class=FastJSONResponse
+)
 def match_event(
     request: EventMatchRequest,
-    service: SportsDataService = Depends(get_sports_service),
+    matching_service: MatchingService = Depends(get_matching_service),
 ):
     """Match a query to a sporting event."""
     target = _parse_date(request.target_date)
-    matching_service = create_matching_service(service)
 
     if request.team1_id and request.team2_id:
         result = matching_service.match_by_team_ids(
@@ -48,14 +57,17 @@ def match_event(
         )
 
     if not result.found or not result.event:
-        return EventMatchResponse(found=False)
-
-    return EventMatchResponse(
-        found=True,
-        event_id=result.event.id,
-        event_name=result.event.name,
-        home_team=result.event.home_team.name,
-        away_team=result.event.away_team.name,
-        start_time=result.event.start_time.isoformat(),
-        venue=result.event.venue.name if result.event.venue else None,
+        return FastJSONResponse(_NOT_FOUND_PAYLOAD)
+
+    event = result.event
+    return FastJSONResponse(
+        {
+            "found": True,
+            "event_id": event.id,
+            "event_name": event.name,
+            "home_team": event.home_team.name,
+            "away_team": event.away_team.name,
+            "start_time": event.start_time,
+            "venue": event.venue.name if event.venue else None,
+        }
     )
@@ -13,7 +13,7 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
-from teamarr.database.connection import get_connection, DEFAULT_DB_PATH
+from teamarr.database.connection import get_connection, DEFAULT_DB_PATH, close_pooled_connections
 
 logger = logging.getLogger(__name__)
 
@@ -115,6 +115,7 @@ async def archive_v1_database():
 
     try:
         # Move database to backup location
+        close_pooled_connections()
         shutil.move(str(db_path), str(backup_path))
 
         logger.info("[MIGRATION] Archived V1 database to %s", backup_path)
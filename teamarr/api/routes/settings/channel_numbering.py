@@ -3,6 +3,7 @@
 from fastapi import APIRouter, HTTPException, status
 
 from teamarr.database import get_db
+from teamarr.database.settings import invalidate_settings_cache
 
 from .models import (
     ChannelNumberingSettingsModel,
@@ -75,6 +76,7 @@ def update_channel_numbering_settings(update: ChannelNumberingSettingsUpdate):
             sorting_scope=update.sorting_scope,
             sort_by=update.sort_by,
         )
+    invalidate_settings_cache()
 
     # Return updated settings
     with get_db() as conn:
@@ -3,6 +3,7 @@
 from fastapi import APIRouter
 
 from teamarr.database import get_db
+from teamarr.database.settings import invalidate_settings_cache
 
 from .models import (
     ConnectionTestRequest,
@@ -51,6 +52,7 @@ def update_dispatcharr_settings(update: DispatcharrSettingsUpdate):
             epg_id=update.epg_id,
             default_channel_profile_ids=update.default_channel_profile_ids,
         )
+    invalidate_settings_cache()
 
     # Trigger reconnect on next use
     try:
@@ -5,6 +5,7 @@ from dataclasses import asdict
 from fastapi import APIRouter, HTTPException, status
 
 from teamarr.database import get_db
+from teamarr.database.settings import invalidate_settings_cache
 
 from .models import (
     DisplaySettingsModel,
@@ -48,6 +49,7 @@ def update_duration_settings(update: dict[str, float]) -> dict[str, float]:
     with get_db() as conn:
         # Pass all values from the update dict as kwargs
         db_update(conn, **update)
+    invalidate_settings_cache()
 
     with get_db() as conn:
         settings = get_all_settings(conn)
@@ -105,6 +107,7 @@ def update_reconciliation_settings(update: ReconciliationSettingsModel):
             default_duplicate_event_handling=update.default_duplicate_event_handling,
             channel_history_retention_days=update.channel_history_retention_days,
         )
+    invalidate_settings_cache()
 
     with get_db() as conn:
         settings = get_all_settings(conn)
@@ -172,6 +175,7 @@ def update_display_settings_endpoint(update: DisplaySettingsModel):
             xmltv_generator_url=update.xmltv_generator_url,
             tsdb_api_key=update.tsdb_api_key,
         )
+    invalidate_settings_cache()
 
     # Update cached display settings so new values are used immediately
     set_config_display(
@@ -3,6 +3,7 @@
 from fastapi import APIRouter
 
 from teamarr.database import get_db
+from teamarr.database.settings import invalidate_settings_cache
 
 from .models import EPGSettingsModel
 
@@ -49,6 +50,7 @@ def update_epg_settings(update: EPGSettingsModel):
             midnight_crossover_mode=update.midnight_crossover_mode,
             cron_expression=update.cron_expression,
         )
+    invalidate_settings_cache()
 
     # Update cached timezone so new value is used immediately
     set_timezone(update.epg_timezone)
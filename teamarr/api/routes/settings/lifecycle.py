@@ -3,6 +3,7 @@
 from fastapi import APIRouter, HTTPException, status
 
 from teamarr.database import get_db
+from teamarr.database.settings import invalidate_settings_cache
 
 from .models import (
     LifecycleSettingsModel,
@@ -80,6 +81,7 @@ def update_lifecycle_settings(update: LifecycleSettingsModel):
             channel_range_start=update.channel_range_start,
             channel_range_end=update.channel_range_end,
         )
+    invalidate_settings_cache()
 
     with get_db() as conn:
         settings = get_lifecycle_settings(conn)
@@ -131,6 +133,7 @@ def update_scheduler_settings(update: SchedulerSettingsModel):
             enabled=update.enabled,
             interval_minutes=update.interval_minutes,
         )
+    invalidate_settings_cache()
 
     with get_db() as conn:
         settings = get_scheduler_settings(conn)
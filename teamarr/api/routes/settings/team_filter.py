@@ -7,7 +7,11 @@ that applies to all event groups without their own filter.
 from fastapi import APIRouter
 
 from teamarr.database import get_db
-from teamarr.database.settings import get_team_filter_settings, update_team_filter_settings
+from teamarr.database.settings import (
+    get_team_filter_settings,
+    invalidate_settings_cache,
+    update_team_filter_settings,
+)
 
 from .models import TeamFilterSettingsModel, TeamFilterSettingsUpdate
 
@@ -56,6 +60,7 @@ def update_team_filter(update: TeamFilterSettingsUpdate):
             clear_exclude_teams=update.clear_exclude_teams,
         )
         settings = get_team_filter_settings(conn)
+    invalidate_settings_cache()
 
     return TeamFilterSettingsModel(
         enabled=settings.enabled,
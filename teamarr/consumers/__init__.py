@@ -71,6 +71,7 @@ from teamarr.consumers.reconciliation import (
 )
 from teamarr.consumers.scheduler import (
     LifecycleScheduler,
+    get_scheduler_instance,
     get_scheduler_status,
     is_scheduler_running,
     start_lifecycle_scheduler,
@@ -158,6 +159,7 @@ __all__ = [
     "create_reconciler",
     # Scheduler
     "LifecycleScheduler",
+    "get_scheduler_instance",
     "get_scheduler_status",
     "is_scheduler_running",
     "start_lifecycle_scheduler",
@@ -309,7 +309,7 @@ class TeamLeagueCache:
         try:
             with self._db() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM team_cache")
+                cursor.execute("SELECT EXISTS(SELECT 1 FROM team_cache)")
                 row = cursor.fetchone()
                 return row[0] == 0 if row else True
         except Exception:
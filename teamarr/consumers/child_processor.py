@@ -114,7 +114,7 @@ class ChildStreamProcessor:
         """
         from teamarr.database.channels import (
             add_stream_to_channel,
-            check_exception_keyword,
+            check_exception_keywords_batch,
             find_parent_channel_for_event,
             get_exception_keywords,
             get_next_stream_priority,
@@ -132,6 +132,11 @@ class ChildStreamProcessor:
                 if self._exception_keywords is None:
                     self._exception_keywords = get_exception_keywords(conn)
 
+                keyword_matches = check_exception_keywords_batch(
+                    [m.get("stream", {}).get("name", "") for m in matched_streams],
+                    self._exception_keywords,
+                )
+
                 for matched in matched_streams:
                     stream = matched.get("stream", {})
                     event = matched.get("event")
@@ -151,9 +156,7 @@ class ChildStreamProcessor:
                     event_provider = getattr(event, "provider", "espn")
 
                     # Check exception keyword for routing
-                    matched_keyword, keyword_behavior = check_exception_keyword(
-                        stream_name, self._exception_keywords
-                    )
+                    matched_keyword, keyword_behavior = keyword_matches[stream_name]
 
                     # Skip if keyword behavior is 'ignore'
                     if keyword_behavior == "ignore":
@@ -84,7 +84,7 @@ class KeywordEnforcer:
         """
         from teamarr.database.channels import (
             add_stream_to_channel,
-            check_exception_keyword,
+            check_exception_keywords_batch,
             get_all_managed_channels,
             get_channel_streams,
             get_exception_keywords,
@@ -120,14 +120,15 @@ class KeywordEnforcer:
                 # Check each channel's streams
                 for channel in channels:
                     streams = get_channel_streams(conn, channel.id, include_removed=False)
+                    keyword_matches = check_exception_keywords_batch(
+                        [stream.stream_name or "" for stream in streams], exception_keywords
+                    )
 
                     for stream in streams:
                         stream_name = stream.stream_name or ""
 
                         # What keyword should this stream have?
-                        expected_keyword, behavior = check_exception_keyword(
-                            stream_name, exception_keywords
-                        )
+                        expected_keyword, behavior = keyword_matches[stream_name]
 
                         # Normalize: None for no keyword
                         current_keyword = channel.exception_keyword or None
@@ -86,12 +86,22 @@ class EventEPGGenerator:
             target_date,
         )
 
+        # Fetch every league's events in one concurrent batch.
+        # TSDB leagues use cache-only (no API calls during generation).
+        # Provider errors propagate, as with per-league get_events calls,
+        # rather than silently producing an empty EPG for a failing league.
+        tsdb_leagues = {
+            league for league in leagues if self._service.get_provider_name(league) == "tsdb"
+        }
+        fetched = self._service.get_events_bulk(
+            ((league, target_date) for league in leagues),
+            cache_only_leagues=tsdb_leagues,
+            raise_errors=True,
+        )
+
         all_events: list[Event] = []
         for league in leagues:
-            # TSDB leagues use cache-only (no API calls during generation)
-            is_tsdb = self._service.get_provider_name(league) == "tsdb"
-            events = self._service.get_events(league, target_date, cache_only=is_tsdb)
-            all_events.extend(events)
+            all_events.extend(fetched[(league, target_date)])
 
         programmes = []
         channels = []
@@ -16,6 +16,7 @@ import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass, field
 from datetime import date, datetime, timedelta
+from operator import attrgetter
 from sqlite3 import Connection
 from typing import Any, Callable
 
@@ -41,7 +42,6 @@ from teamarr.consumers.matching import BatchMatchResult, StreamMatcher
 from teamarr.core import Event
 from teamarr.database.groups import (
     EventEPGGroup,
-    get_all_group_xmltv,
     get_all_groups,
     get_group,
     update_group_stats,
@@ -56,15 +56,30 @@ from teamarr.database.stats import (
 )
 from teamarr.services import SportsDataService, create_default_service
 from teamarr.services.stream_filter import FilterResult
-from teamarr.utilities.xmltv import merge_xmltv_content, programmes_to_xmltv
+from teamarr.utilities.xmltv import programmes_to_xmltv
 
 logger = logging.getLogger(__name__)
 
 # Number of parallel workers for event fetching
 MAX_WORKERS = 100
+# Concurrent Dispatcharr stream-list requests when prefetching a batch run
+STREAM_PREFETCH_WORKERS = 8
+
+# DispatcharrStream attributes copied into the stream dicts used for matching
+_STREAM_FIELDS = (
+    "id",
+    "name",
+    "tvg_id",
+    "tvg_name",
+    "channel_group",
+    "channel_group_id",
+    "m3u_account_id",
+    "is_stale",
+)
+_stream_values = attrgetter(*_STREAM_FIELDS)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of processing an event group."""
 
@@ -145,14 +160,13 @@ class ProcessingResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchProcessingResult:
     """Result of processing multiple groups."""
 
     started_at: datetime = field(default_factory=datetime.now)
     completed_at: datetime | None = None
     results: list[ProcessingResult] = field(default_factory=list)
-    total_xmltv: str = ""
 
     @property
     def groups_processed(self) -> int:
@@ -344,6 +358,10 @@ class EventGroupProcessor:
         # This avoids redundant API/cache lookups when multiple groups search the same leagues
         self._shared_events: dict[str, list[Event]] = {}
 
+        # M3U streams fetched up front for a batch run, keyed by group ID.
+        # Each entry is consumed by the group's first _fetch_streams call.
+        self._prefetched_streams: dict[int, list[dict]] = {}
+
     def process_group(
         self,
         group_id: int,
@@ -518,7 +536,7 @@ class EventGroupProcessor:
             generation: Cache generation counter (shared across all groups)
 
         Returns:
-            BatchProcessingResult with all group results and combined XMLTV
+            BatchProcessingResult with all group results
         """
         target_date = target_date or date.today()
         batch_result = BatchProcessingResult()
@@ -527,6 +545,7 @@ class EventGroupProcessor:
         # Clear shared events cache at start of new generation run
         # This ensures fresh data and allows cross-group reuse within this run
         self._shared_events.clear()
+        self._prefetched_streams.clear()
 
         with self._db_factory() as conn:
             groups = get_all_groups(conn, include_disabled=False)
@@ -543,7 +562,22 @@ class EventGroupProcessor:
                 else:
                     progress_callback(0, 1, "No event groups configured")
 
-            processed_group_ids = []
+            # Fetch events for every league any group uses in one concurrent
+            # batch up front; each group then reads from the shared cache
+            all_leagues = list(dict.fromkeys(
+                league for g in groups for league in g.leagues
+            ))
+            if all_leagues:
+                if progress_callback:
+                    progress_callback(
+                        0, max(total_groups, 1),
+                        f"Prefetching events for {len(all_leagues)} leagues..."
+                    )
+                self._prefetch_events(all_leagues, self._get_fetch_dates(target_date))
+
+            # Stream lists are independent per group, so fetch them concurrently too
+            self._prefetch_streams(groups)
+
             multi_league_ids = [g.id for g in multi_league_groups]
 
             # Phase 1: Process parent groups (create channels, generate EPG)
@@ -583,7 +617,6 @@ class EventGroupProcessor:
                     status_callback=status_cb,
                 )
                 batch_result.results.append(result)
-                processed_group_ids.append(group.id)
                 processed_count += 1
                 if progress_callback:
                     # Include stream stats in progress: "Group Name (5/8 streams matched)"
@@ -668,7 +701,6 @@ class EventGroupProcessor:
                     status_callback=status_cb,
                 )
                 batch_result.results.append(result)
-                processed_group_ids.append(group.id)
                 processed_count += 1
                 if progress_callback:
                     stats = f"({result.streams_matched}/{result.streams_fetched} matched)"
@@ -688,22 +720,6 @@ class EventGroupProcessor:
                     conn, multi_league_ids, lifecycle_service=enforcement_lifecycle
                 )
 
-            # Aggregate XMLTV from all processed groups (parents + multi-league)
-            if processed_group_ids:
-                xmltv_contents = get_all_group_xmltv(conn, processed_group_ids)
-                if xmltv_contents:
-                    from teamarr.database.settings import get_display_settings
-                    display_settings = get_display_settings(conn)
-                    batch_result.total_xmltv = merge_xmltv_content(
-                        xmltv_contents,
-                        generator_name=display_settings.xmltv_generator_name,
-                        generator_url=display_settings.xmltv_generator_url,
-                    )
-                    logger.info(
-                        f"Aggregated XMLTV from {len(xmltv_contents)} groups, "
-                        f"{len(batch_result.total_xmltv)} bytes"
-                    )
-
         batch_result.completed_at = datetime.now()
         return batch_result
 
@@ -873,7 +889,6 @@ class EventGroupProcessor:
                 run_id=stats_run.id,
                 group_id=group.id,
                 group_name=group.name,
-                streams=streams,
                 match_result=match_result,
             )
 
@@ -1149,7 +1164,6 @@ class EventGroupProcessor:
                 run_id=stats_run.id,
                 group_id=group.id,
                 group_name=group.name,
-                streams=streams,
                 match_result=match_result,
             )
 
@@ -1279,11 +1293,33 @@ class EventGroupProcessor:
         result.completed_at = datetime.now()
         return result
 
+    def _prefetch_streams(self, groups: list[EventEPGGroup]) -> None:
+        """Fetch M3U streams for several groups concurrently.
+
+        Results are held in _prefetched_streams until each group's
+        _fetch_streams call picks them up. Group processing itself stays
+        sequential: channel numbering, consolidation and child groups depend
+        on the groups processed before them.
+        """
+        if not self._dispatcharr_client or not groups:
+            return
+
+        num_workers = min(STREAM_PREFETCH_WORKERS, len(groups))
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = {executor.submit(self._fetch_streams, g): g.id for g in groups}
+            for future in as_completed(futures):
+                self._prefetched_streams[futures[future]] = future.result()
+
     def _fetch_streams(self, group: EventEPGGroup) -> list[dict]:
         """Fetch M3U streams from Dispatcharr for the group.
 
-        Uses group's m3u_group_id to filter streams.
+        Uses group's m3u_group_id to filter streams. Streams prefetched for
+        the current batch run are returned without another request.
         """
+        prefetched = self._prefetched_streams.pop(group.id, None)
+        if prefetched is not None:
+            return prefetched
+
         if not self._dispatcharr_client:
             logger.warning("[EVENT_EPG] Dispatcharr not configured - cannot fetch streams")
             return []
@@ -1298,19 +1334,9 @@ class EventGroupProcessor:
                 # Fetch all streams if no group filter
                 streams = m3u_manager.list_streams()
 
-            # Convert to dicts for matcher (sorted by name for consistent order)
+            # Convert to dicts for matcher
             stream_dicts = [
-                {
-                    "id": s.id,
-                    "name": s.name,
-                    "tvg_id": s.tvg_id,
-                    "tvg_name": s.tvg_name,
-                    "channel_group": s.channel_group,
-                    "channel_group_id": s.channel_group_id,
-                    "m3u_account_id": s.m3u_account_id,
-                    "is_stale": s.is_stale,
-                }
-                for s in streams
+                dict(zip(_STREAM_FIELDS, _stream_values(s), strict=True)) for s in streams
             ]
             # Sort by stream ID ascending for consistent processing order
             stream_dicts.sort(key=lambda s: s["id"])
@@ -1397,18 +1423,12 @@ class EventGroupProcessor:
             cursor = conn.execute("SELECT league_slug FROM league_cache")
             return [row[0] for row in cursor.fetchall()]
 
-    def _fetch_events(self, leagues: list[str], target_date: date) -> list[Event]:
-        """Fetch events from data providers for leagues in parallel.
+    def _get_fetch_dates(self, target_date: date) -> list[date]:
+        """Dates to fetch events for around target_date.
 
         Uses a fixed 7-day lookback (for weekly sports like NFL) and
         event_match_days_ahead setting for future events.
         """
-        if not leagues:
-            return []
-
-        all_events: list[Event] = []
-        num_workers = min(MAX_WORKERS, len(leagues))
-
         # Load date range settings
         # Note: days_back is hardcoded to 7 for weekly sports like NFL
         with self._db_factory() as conn:
@@ -1419,39 +1439,72 @@ class EventGroupProcessor:
             days_ahead = row["event_match_days_ahead"] if row and row["event_match_days_ahead"] else 3
 
         # Build date range: [target - days_back, target + days_ahead]
-        dates_to_fetch = [
+        return [
             target_date + timedelta(days=offset)
             for offset in range(-days_back, days_ahead + 1)
         ]
-        logger.debug("[EVENT_EPG] Fetching events from %s to %s (%d days)", dates_to_fetch[0], dates_to_fetch[-1], len(dates_to_fetch))
 
-        def fetch_league_events(league: str, fetch_date: date) -> tuple[str, date, list[Event]]:
-            """Fetch events for a single league/date (for parallel execution)."""
-            try:
-                # TSDB leagues: cache-only (don't hit API during EPG generation)
-                # TSDB cache builds organically from startup/scheduled refresh
-                is_tsdb = self._service.get_provider_name(league) == "tsdb"
-                events = self._service.get_events(league, fetch_date, cache_only=is_tsdb)
-                return (league, fetch_date, events)
-            except Exception as e:
-                logger.warning("[EVENT_EPG] Failed to fetch events for %s on %s: %s", league, fetch_date, e)
-                return (league, fetch_date, [])
+    def _prefetch_events(
+        self, leagues: list[str], dates_to_fetch: list[date]
+    ) -> dict[tuple[str, date], list[Event]]:
+        """Fetch league/date events not yet in the shared events cache.
 
-        with ThreadPoolExecutor(max_workers=num_workers) as executor:
-            # Create tasks for all league/date combinations
-            futures = {}
-            for league in leagues:
-                for fetch_date in dates_to_fetch:
-                    future = executor.submit(fetch_league_events, league, fetch_date)
-                    futures[future] = (league, fetch_date)
+        All missing pairs go to the service as one concurrent bulk fetch.
+        Non-empty API results are stored in _shared_events for reuse by later
+        groups (and the matcher) in the same run.
 
-            for future in as_completed(futures):
-                try:
-                    league, fetch_date, events = future.result()
-                    all_events.extend(events)
-                except Exception as e:
-                    league, fetch_date = futures[future]
-                    logger.warning("[EVENT_EPG] Failed to fetch events for %s on %s: %s", league, fetch_date, e)
+        Returns:
+            Dict of (league, date) -> events for the pairs fetched by this call
+        """
+        shared = self._shared_events
+        missing = [
+            (league, fetch_date)
+            for league in leagues
+            for fetch_date in dates_to_fetch
+            if f"{league}:{fetch_date.isoformat()}" not in shared
+        ]
+        if not missing:
+            return {}
+
+        # TSDB leagues: cache-only (don't hit API during EPG generation)
+        # TSDB cache builds organically from startup/scheduled refresh
+        tsdb_leagues = {
+            league for league in leagues if self._service.get_provider_name(league) == "tsdb"
+        }
+        fetched = self._service.get_events_bulk(
+            missing,
+            cache_only_leagues=tsdb_leagues,
+            max_workers=min(MAX_WORKERS, len(leagues)),
+        )
+        # Same rule as the matcher: only share non-empty API results, so a
+        # later group can still fetch what a cache-only read missed
+        for (league, fetch_date), events in fetched.items():
+            if events and league not in tsdb_leagues:
+                shared[f"{league}:{fetch_date.isoformat()}"] = events
+        return fetched
+
+    def _fetch_events(self, leagues: list[str], target_date: date) -> list[Event]:
+        """Fetch events from data providers for leagues in parallel.
+
+        Uses a fixed 7-day lookback (for weekly sports like NFL) and
+        event_match_days_ahead setting for future events. League/date pairs
+        already fetched earlier in the run are reused.
+        """
+        if not leagues:
+            return []
+
+        dates_to_fetch = self._get_fetch_dates(target_date)
+        logger.debug("[EVENT_EPG] Fetching events from %s to %s (%d days)", dates_to_fetch[0], dates_to_fetch[-1], len(dates_to_fetch))
+
+        fetched = self._prefetch_events(leagues, dates_to_fetch)
+
+        all_events: list[Event] = []
+        for league in leagues:
+            for fetch_date in dates_to_fetch:
+                events = self._shared_events.get(f"{league}:{fetch_date.isoformat()}")
+                if events is None:
+                    events = fetched.get((league, fetch_date), [])
+                all_events.extend(events)
 
         return all_events
 
@@ -1539,22 +1592,19 @@ class EventGroupProcessor:
 
         Returns list of dicts with 'stream' and 'event' keys.
         """
-        # Build name -> stream lookup
-        stream_lookup = {s["name"]: s for s in streams}
-
-        matched = []
-        for result in match_result.results:
-            if result.matched and result.included and result.event:
-                stream = stream_lookup.get(result.stream_name)
-                if stream:
-                    matched.append(
-                        {
-                            "stream": stream,
-                            "event": result.event,
-                        }
-                    )
-
-        return matched
+        # Key by ID: stream names are not unique (the same name can appear in
+        # several M3U accounts), and a name-keyed lookup drops all but one
+        stream_lookup = {s["id"]: s for s in streams}
+
+        # included is only ever set on matched results, so test it first
+        return [
+            {"stream": stream, "event": result.event}
+            for result in match_result.results
+            if result.included
+            and result.matched
+            and result.event
+            and (stream := stream_lookup.get(result.stream_id))
+        ]
 
     def _enrich_matched_events(self, matched_streams: list[dict]) -> list[dict]:
         """Enrich all matched events with fresh status from provider.
@@ -1825,7 +1875,6 @@ class EventGroupProcessor:
         run_id: int,
         group_id: int,
         group_name: str,
-        streams: list[dict],
         match_result: BatchMatchResult,
         filter_result: FilterResult | None = None,
     ) -> None:
@@ -1833,15 +1882,11 @@ class EventGroupProcessor:
 
         Stores both matched streams and failed/unmatched streams for analysis.
         """
-        # Build name -> stream lookup for stream IDs
-        stream_lookup = {s["name"]: s for s in streams}
-
         matched_list: list[MatchedStream] = []
         failed_list: list[FailedMatch] = []
 
         for result in match_result.results:
-            stream = stream_lookup.get(result.stream_name, {})
-            stream_id = stream.get("id")
+            stream_id = result.stream_id
 
             if result.matched and result.included and result.event:
                 # Successfully matched and included
@@ -5,10 +5,24 @@ Used for event-based EPG where streams need to be linked to specific events.
 """
 
 import unicodedata
+from functools import lru_cache
 
 from teamarr.core import Event
 
 
+@lru_cache(maxsize=8192)
+def _normalize_text(text: str) -> str:
+    """Normalize text for matching (memoized; see EventMatcher._normalize)."""
+    text = text.lower().strip()
+
+    # Remove accents
+    text = unicodedata.normalize("NFD", text)
+    text = "".join(c for c in text if unicodedata.category(c) != "Mn")
+
+    # Common abbreviations
+    return text.replace("st.", "saint").replace("st ", "saint ")
+
+
 class EventMatcher:
     """Match queries to sporting events.
 
@@ -124,13 +138,5 @@ class EventMatcher:
         if not text:
             return ""
 
-        text = text.lower().strip()
-
-        # Remove accents
-        text = unicodedata.normalize("NFD", text)
-        text = "".join(c for c in text if unicodedata.category(c) != "Mn")
-
-        # Common abbreviations
-        text = text.replace("st.", "saint").replace("st ", "saint ")
-
-        return text
+        # Team names and event searchable strings repeat across calls
+        return _normalize_text(text)
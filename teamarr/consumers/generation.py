@@ -5,6 +5,7 @@ Both the streaming API endpoint and the background scheduler call this.
 """
 
 import logging
+import os
 import threading
 import time
 from collections.abc import Callable
@@ -120,7 +121,7 @@ def run_full_generation(
     from teamarr.database.stats import create_run, save_run
     from teamarr.dispatcharr import EPGManager
     from teamarr.services import create_default_service
-    from teamarr.utilities.xmltv import merge_xmltv_content
+    from teamarr.utilities.xmltv import write_merged_xmltv
 
     result = GenerationResult()
     result.started_at = time.time()
@@ -319,17 +320,25 @@ def run_full_generation(
 
         output_path = settings.epg_output_path
         if xmltv_contents and output_path:
-            merged_xmltv = merge_xmltv_content(
-                xmltv_contents,
-                generator_name=display_settings.xmltv_generator_name,
-                generator_url=display_settings.xmltv_generator_url,
-            )
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
-            output_file.write_text(merged_xmltv, encoding="utf-8")
+            # Stream to a sibling temp file and swap it in, so a failed merge
+            # never leaves a truncated EPG behind for Dispatcharr to read
+            tmp_file = output_file.with_suffix(".tmp")
+            try:
+                with tmp_file.open("w", encoding="utf-8") as f:
+                    result.file_size = write_merged_xmltv(
+                        xmltv_contents,
+                        f,
+                        generator_name=display_settings.xmltv_generator_name,
+                        generator_url=display_settings.xmltv_generator_url,
+                    )
+                os.replace(tmp_file, output_file)
+            except BaseException:
+                tmp_file.unlink(missing_ok=True)
+                raise
             result.file_written = True
             result.file_path = str(output_file.absolute())
-            result.file_size = len(merged_xmltv)
             logger.info("[GENERATION] EPG written to %s (%s bytes)", output_path, f"{result.file_size:,}")
 
         # Create lifecycle service once for steps 5-6
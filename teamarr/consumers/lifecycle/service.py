@@ -7,6 +7,7 @@ Handles channel creation, deletion, settings sync, and EPG association.
 import json
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from sqlite3 import Connection
 from typing import Any
 
@@ -25,6 +26,9 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+# Concurrent Dispatcharr delete requests when processing scheduled deletions
+SCHEDULED_DELETE_WORKERS = 8
+
 
 class ChannelLifecycleService:
     """Full channel lifecycle management with Dispatcharr integration.
@@ -219,20 +223,20 @@ class ChannelLifecycleService:
             self._exception_keywords = get_exception_keywords(conn)
         return self._exception_keywords
 
-    def _check_exception_keyword(
+    def _check_exception_keywords(
         self,
-        stream_name: str,
+        stream_names: list[str],
         conn: Connection,
-    ) -> tuple[str | None, str | None]:
-        """Check if stream name matches any exception keyword.
+    ) -> dict[str, tuple[str | None, str | None]]:
+        """Check a batch of stream names against the exception keywords.
 
         Returns:
-            Tuple of (matched_keyword, behavior) or (None, None)
+            Dict of stream name -> (matched_keyword, behavior) or (None, None)
         """
-        from teamarr.database.channels import check_exception_keyword
+        from teamarr.database.channels import check_exception_keywords_batch
 
         keywords = self._get_exception_keywords(conn)
-        return check_exception_keyword(stream_name, keywords)
+        return check_exception_keywords_batch(stream_names, keywords)
 
     def process_matched_streams(
         self,
@@ -292,6 +296,11 @@ class ChannelLifecycleService:
                     dispatcharr_settings = get_dispatcharr_settings(conn)
                     raw_profile_ids = dispatcharr_settings.default_channel_profile_ids
 
+                # Resolve exception keywords for the whole batch up front
+                keyword_matches = self._check_exception_keywords(
+                    [m.get("stream", {}).get("name", "") for m in matched_streams], conn
+                )
+
                 for matched in matched_streams:
                     stream = matched.get("stream", {})
                     event = matched.get("event")
@@ -336,9 +345,7 @@ class ChannelLifecycleService:
                         continue
 
                     # Check exception keyword
-                    matched_keyword, keyword_behavior = self._check_exception_keyword(
-                        stream_name, conn
-                    )
+                    matched_keyword, keyword_behavior = keyword_matches[stream_name]
 
                     # V1 Parity: If behavior is 'ignore', skip stream entirely
                     # This must happen BEFORE any channel lookup/creation
@@ -1545,34 +1552,45 @@ class ChannelLifecycleService:
         Returns:
             True if deleted successfully
         """
-        from teamarr.database.channels import (
-            get_managed_channel,
-            log_channel_history,
-            mark_channel_deleted,
-        )
+        from teamarr.database.channels import get_managed_channel
 
         channel = get_managed_channel(conn, managed_channel_id)
         if not channel:
             return False
 
+        with self._dispatcharr_lock:
+            self._delete_from_dispatcharr(channel)
+
+        self._mark_channel_deleted(conn, channel, reason)
+        return True
+
+    def _delete_from_dispatcharr(self, channel: Any) -> None:
+        """Delete a managed channel and its logo from Dispatcharr.
+
+        Caller must hold the Dispatcharr lock (or own it for a batch).
+        """
         # Delete logo from Dispatcharr (V1 parity)
         logo_id = getattr(channel, "dispatcharr_logo_id", None)
         if self._logo_manager and logo_id:
             try:
-                with self._dispatcharr_lock:
-                    self._logo_manager.delete(logo_id)
+                self._logo_manager.delete(logo_id)
             except Exception as e:
                 logger.debug("[LIFECYCLE] Failed to delete logo %s: %s", logo_id, e)
 
         # Delete channel from Dispatcharr
         if self._channel_manager and channel.dispatcharr_channel_id:
-            with self._dispatcharr_lock:
-                result = self._channel_manager.delete_channel(channel.dispatcharr_channel_id)
-                if not result.success:
-                    logger.warning(
-                        f"Failed to delete channel {channel.dispatcharr_channel_id} "
-                        f"from Dispatcharr: {result.error}"
-                    )
+            result = self._channel_manager.delete_channel(channel.dispatcharr_channel_id)
+            if not result.success:
+                logger.warning(
+                    f"Failed to delete channel {channel.dispatcharr_channel_id} "
+                    f"from Dispatcharr: {result.error}"
+                )
+
+    def _mark_channel_deleted(self, conn: Connection, channel: Any, reason: str) -> None:
+        """Mark a managed channel deleted in the DB and log it to history."""
+        from teamarr.database.channels import log_channel_history, mark_channel_deleted
+
+        managed_channel_id = channel.id
 
         # Mark as deleted in DB
         mark_channel_deleted(conn, managed_channel_id, reason)
@@ -1587,14 +1605,22 @@ class ChannelLifecycleService:
         )
 
         logger.info("[LIFECYCLE] Deleted channel '%s' (%s)", channel.channel_name, reason)
-        return True
 
-    def process_scheduled_deletions(self) -> StreamProcessResult:
+    def process_scheduled_deletions(
+        self, concurrency: int = SCHEDULED_DELETE_WORKERS
+    ) -> StreamProcessResult:
         """Process all channels past their scheduled delete time.
 
         First recalculates scheduled_delete_at for all active channels based on
         current settings (handles settings changes), then deletes any that are past due.
 
+        Dispatcharr delete requests for the batch run concurrently while this
+        service holds its Dispatcharr lock; the DB updates are then written in
+        the same transaction.
+
+        Args:
+            concurrency: Maximum concurrent Dispatcharr delete requests
+
         Returns:
             StreamProcessResult with deleted channels
         """
@@ -1613,14 +1639,13 @@ class ChannelLifecycleService:
                 # Step 2: Get channels that are now past their delete time
                 channels = get_channels_pending_deletion(conn)
 
-                for channel in channels:
-                    success = self.delete_managed_channel(
-                        conn,
-                        channel.id,
-                        reason="scheduled_delete",
-                    )
+                # Step 3: Delete from Dispatcharr, fanning out the HTTP requests
+                remote_ok = self._delete_batch_from_dispatcharr(channels, concurrency)
 
+                # Step 4: Record deletions
+                for channel, success in zip(channels, remote_ok, strict=True):
                     if success:
+                        self._mark_channel_deleted(conn, channel, "scheduled_delete")
                         result.deleted.append(
                             {
                                 "channel_id": channel.id,
@@ -1646,6 +1671,36 @@ class ChannelLifecycleService:
 
         return result
 
+    def _delete_batch_from_dispatcharr(self, channels: list, concurrency: int) -> list[bool]:
+        """Delete channels from Dispatcharr concurrently.
+
+        Holds the Dispatcharr lock for the whole batch so other operations on
+        this service don't interleave; the worker threads don't take it.
+
+        Returns:
+            Per-channel flags, False where the delete raised (channel is left
+            pending and retried next run)
+        """
+
+        def delete(channel: Any) -> bool:
+            try:
+                self._delete_from_dispatcharr(channel)
+                return True
+            except Exception as e:
+                logger.warning(
+                    "[LIFECYCLE] Failed to delete channel '%s' from Dispatcharr: %s",
+                    channel.channel_name,
+                    e,
+                )
+                return False
+
+        with self._dispatcharr_lock:
+            if len(channels) < 2 or not (self._channel_manager or self._logo_manager):
+                return [delete(channel) for channel in channels]
+            workers = max(1, min(concurrency, len(channels)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(delete, channels))
+
     def _recalculate_deletion_times(self, conn) -> int:
         """Recalculate scheduled_delete_at for all active channels.
 
@@ -771,6 +771,11 @@ class TeamMatcher:
         if not team1 and not team2:
             return None
 
+        canonical1 = TEAM_ALIASES.get(team1.lower()) if team1 else None
+        canonical2 = TEAM_ALIASES.get(team2.lower()) if team2 else None
+        if not canonical1 and not canonical2:
+            return None
+
         # Generate patterns for alias checking
         home_patterns = self._fuzzy.generate_team_patterns(event.home_team)
         away_patterns = self._fuzzy.generate_team_patterns(event.away_team)
@@ -779,22 +784,18 @@ class TeamMatcher:
         team2_match = False
 
         # Check team1 against aliases
-        if team1:
-            canonical = TEAM_ALIASES.get(team1.lower())
-            if canonical:
-                if any(canonical in tp.pattern for tp in home_patterns):
-                    team1_match = True
-                elif any(canonical in tp.pattern for tp in away_patterns):
-                    team1_match = True
+        if canonical1:
+            if any(canonical1 in tp.pattern for tp in home_patterns):
+                team1_match = True
+            elif any(canonical1 in tp.pattern for tp in away_patterns):
+                team1_match = True
 
         # Check team2 against aliases
-        if team2:
-            canonical = TEAM_ALIASES.get(team2.lower())
-            if canonical:
-                if any(canonical in tp.pattern for tp in home_patterns):
-                    team2_match = True
-                elif any(canonical in tp.pattern for tp in away_patterns):
-                    team2_match = True
+        if canonical2:
+            if any(canonical2 in tp.pattern for tp in home_patterns):
+                team2_match = True
+            elif any(canonical2 in tp.pattern for tp in away_patterns):
+                team2_match = True
 
         # Need both teams to match via alias (if both were extracted)
         if team1 and team2:
@@ -14,13 +14,22 @@ import logging
 import threading
 import time
 from datetime import datetime
-from typing import Any
+from typing import Any, TypedDict
 
 from croniter import croniter
 
 logger = logging.getLogger(__name__)
 
 
+class SchedulerStatusInfo(TypedDict, total=False):
+    """Status of the global scheduler as returned by get_scheduler_status()."""
+
+    running: bool
+    cron_expression: str
+    last_run: datetime | None
+    next_run: datetime | None
+
+
 class CronScheduler:
     """Background scheduler using cron expressions.
 
@@ -424,14 +433,41 @@ def is_scheduler_running() -> bool:
     return _scheduler is not None and _scheduler.is_running
 
 
-def get_scheduler_status() -> dict:
-    """Get status of the global scheduler."""
+def get_scheduler_instance(db_factory: Any, dispatcharr_client: Any = None) -> CronScheduler:
+    """Get the global scheduler, or a standalone one if none is active.
+
+    Manual runs go through the running scheduler so its last-run time
+    reflects them. The standalone fallback is not started and not
+    registered as the global scheduler.
+
+    Args:
+        db_factory: Factory function returning database connection
+        dispatcharr_client: Optional DispatcharrClient for the fallback scheduler
+
+    Returns:
+        CronScheduler to call run_once() on
+    """
+    if _scheduler:
+        return _scheduler
+
+    return CronScheduler(
+        db_factory,
+        dispatcharr_client=dispatcharr_client,
+        run_on_start=False,
+    )
+
+
+def get_scheduler_status() -> SchedulerStatusInfo:
+    """Get status of the global scheduler.
+
+    Run times are returned as datetime objects (or None).
+    """
     if not _scheduler:
         return {"running": False}
 
     return {
         "running": _scheduler.is_running,
         "cron_expression": _scheduler.cron_expression,
-        "last_run": _scheduler.last_run.isoformat() if _scheduler.last_run else None,
-        "next_run": _scheduler.next_run.isoformat() if _scheduler.next_run else None,
+        "last_run": _scheduler.last_run,
+        "next_run": _scheduler.next_run,
     }
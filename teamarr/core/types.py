@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Venue:
     """Event location."""
 
@@ -18,7 +18,7 @@ class Venue:
     country: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Team:
     """Team identity."""
 
@@ -33,7 +33,7 @@ class Team:
     color: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventStatus:
     """Current state of an event."""
 
@@ -43,7 +43,7 @@ class EventStatus:
     clock: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """A single sporting event (game/match)."""
 
@@ -72,7 +72,7 @@ class Event:
     main_card_start: datetime | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TeamStats:
     """Team statistics for template variables.
 
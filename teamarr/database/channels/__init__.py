@@ -32,6 +32,7 @@ from .history import (
 # Keywords operations
 from .keywords import (
     check_exception_keyword,
+    check_exception_keywords_batch,
     get_exception_keywords,
 )
 
@@ -83,6 +84,7 @@ __all__ = [
     # Keywords
     "get_exception_keywords",
     "check_exception_keyword",
+    "check_exception_keywords_batch",
     # Settings helpers
     "get_dispatcharr_settings",
     "get_reconciliation_settings",
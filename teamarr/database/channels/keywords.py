@@ -4,15 +4,39 @@ Read-only access to consolidation_exception_keywords for lifecycle service.
 Full CRUD is in database/exception_keywords.py.
 """
 
-import re
+from functools import lru_cache
 from sqlite3 import Connection
 
-from teamarr.database.exception_keywords import ExceptionKeyword, get_all_keywords
+import ahocorasick
+
+from teamarr.database.exception_keywords import (
+    ExceptionKeyword,
+    get_all_keywords,
+    get_keywords_generation,
+)
+
+# enabled_only -> (staleness token, keywords)
+_keyword_cache: dict[bool, tuple[tuple, list[ExceptionKeyword]]] = {}
+
+
+def _keywords_token(conn: Connection) -> tuple:
+    """Cheap staleness token for the keyword table.
+
+    The table has no updated_at column, so the in-process write counter
+    covers edits made through the CRUD functions, and row count / max id
+    catch inserts and deletes made by anything else.
+    """
+    row = conn.execute(
+        "SELECT COUNT(*), MAX(id) FROM consolidation_exception_keywords"
+    ).fetchone()
+    return (get_keywords_generation(), row[0], row[1])
 
 
 def get_exception_keywords(conn: Connection, enabled_only: bool = True) -> list[ExceptionKeyword]:
     """Get all consolidation exception keywords.
 
+    The list is cached in-process and only re-read when the table changes.
+
     Args:
         conn: Database connection
         enabled_only: Only return enabled keywords
@@ -20,40 +44,89 @@ def get_exception_keywords(conn: Connection, enabled_only: bool = True) -> list[
     Returns:
         List of ExceptionKeyword objects
     """
-    return get_all_keywords(conn, include_disabled=not enabled_only)
+    token = _keywords_token(conn)
+    cached = _keyword_cache.get(enabled_only)
+    if cached is None or cached[0] != token:
+        cached = (token, get_all_keywords(conn, include_disabled=not enabled_only))
+        _keyword_cache[enabled_only] = cached
+    return list(cached[1])
 
 
-def _make_keyword_pattern(term: str) -> str:
-    """Create regex pattern with smart boundaries for term matching.
+def _is_word_char(ch: str) -> bool:
+    """Same test as the regex \\w class for a single character."""
+    return ch.isalnum() or ch == "_"
 
-    Uses \\b for word characters, (?<!\\w)/(?!\\w) for non-word characters.
-    This allows terms like "(ESP)" to match correctly while still preventing
-    false positives like "Eli" matching "Pelicans".
 
-    Supports phrase matching - multi-word terms like "Peyton and Eli" will
-    match as a complete phrase.
+# (label, behavior, match_terms) per keyword, in priority order
+_KeywordSetKey = tuple[tuple[str, str, str], ...]
 
-    Args:
-        term: The term/phrase to create a pattern for
 
-    Returns:
-        Regex pattern string
-    """
-    escaped = re.escape(term.lower())
+class _KeywordMatcher:
+    """Matches stream names against a whole keyword list at once.
 
-    # Start boundary: \b if term starts with word char, else (?<!\w)
-    if term and re.match(r"\w", term[0]):
-        start = r"\b"
-    else:
-        start = r"(?<!\w)"
+    Every term goes into one Aho-Corasick automaton so a stream name is
+    scanned once regardless of keyword count. Hits are then checked against
+    smart boundaries, one neighbouring character each side: a term edge that
+    is a word character needs a \\b-style boundary, any other edge just must
+    not touch a word character. That lets "(ESP)" match while "Eli" still
+    does not match "Pelicans", and multi-word terms match as whole phrases.
 
-    # End boundary: \b if term ends with word char, else (?!\w)
-    if term and re.match(r"\w", term[-1]):
-        end = r"\b"
-    else:
-        end = r"(?!\w)"
+    The first keyword in list order that matches anywhere wins, the same
+    priority as checking keywords one by one.
+    """
 
-    return start + escaped + end
+    def __init__(self, key: _KeywordSetKey):
+        self.results: list[tuple[str, str]] = []
+        # lowercased term -> (index of the first keyword using it, term)
+        terms: dict[str, tuple[int, str]] = {}
+        for label, behavior, match_terms in key:
+            kw_terms = [t.strip() for t in match_terms.split(",") if t.strip()]
+            if not kw_terms:
+                continue
+            index = len(self.results)
+            for term in kw_terms:
+                terms.setdefault(term.lower(), (index, term))
+            self.results.append((label, behavior))
+
+        self._automaton = None
+        if not terms:
+            return
+        self._automaton = ahocorasick.Automaton()
+        for term_lower, (index, term) in terms.items():
+            # Word-character flag each edge must differ from (\\b), or
+            # None when the neighbour just must not be a word char
+            start = _is_word_char(term_lower[0]) if _is_word_char(term[0]) else None
+            end = _is_word_char(term_lower[-1]) if _is_word_char(term[-1]) else None
+            self._automaton.add_word(term_lower, (index, len(term_lower), start, end))
+        self._automaton.make_automaton()
+
+    def search(self, stream_lower: str) -> tuple[str, str] | None:
+        """Return (label, behavior) of the highest-priority match, or None."""
+        if self._automaton is None:
+            return None
+        best = None
+        last = len(stream_lower) - 1
+        for end, payload in self._automaton.iter(stream_lower):
+            index, length, start_word, end_word = payload
+            if best is not None and index >= best:
+                continue
+            start = end - length + 1
+            before = start > 0 and _is_word_char(stream_lower[start - 1])
+            after = end < last and _is_word_char(stream_lower[end + 1])
+            if before if start_word is None else before == start_word:
+                continue
+            if after if end_word is None else after == end_word:
+                continue
+            best = index
+            if best == 0:
+                break
+        return self.results[best] if best is not None else None
+
+
+@lru_cache(maxsize=64)
+def _get_keyword_matcher(key: _KeywordSetKey) -> _KeywordMatcher:
+    """Build (and memoize) the matcher for a keyword list."""
+    return _KeywordMatcher(key)
 
 
 def check_exception_keyword(
@@ -75,13 +148,34 @@ def check_exception_keyword(
         The label is the configured display name for the keyword, used for
         channel naming and the {exception_keyword} template variable.
     """
-    stream_lower = stream_name.lower()
+    matcher = _get_keyword_matcher(
+        tuple((kw.label, kw.behavior, kw.match_terms) for kw in keywords)
+    )
+    # Returns the label (not the matched term) for channel naming
+    return matcher.search(stream_name.lower()) or (None, None)
+
 
-    for kw in keywords:
-        for term in kw.match_term_list:
-            pattern = _make_keyword_pattern(term)
-            if re.search(pattern, stream_lower):
-                # Return the label (not the matched term) for channel naming
-                return (kw.label, kw.behavior)
+def check_exception_keywords_batch(
+    stream_names: list[str],
+    keywords: list[ExceptionKeyword],
+) -> dict[str, tuple[str | None, str | None]]:
+    """Check many stream names against the exception keywords at once.
 
-    return (None, None)
+    Equivalent to calling check_exception_keyword for each name, but the
+    matcher is resolved once and each distinct name is lowercased and
+    scanned only once.
+
+    Args:
+        stream_names: Stream names to check (duplicates are collapsed)
+        keywords: List of ExceptionKeyword objects
+
+    Returns:
+        Dict mapping each stream name to (label, behavior), or (None, None)
+        if it matched no keyword.
+    """
+    matcher = _get_keyword_matcher(
+        tuple((kw.label, kw.behavior, kw.match_terms) for kw in keywords)
+    )
+    search = matcher.search
+    no_match = (None, None)
+    return {name: search(name.lower()) or no_match for name in dict.fromkeys(stream_names)}
@@ -5,6 +5,7 @@ Simple SQLite connection handling with schema initialization.
 
 import logging
 import sqlite3
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
@@ -17,6 +18,14 @@ DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / "data" / "teamarr.db"
 # Schema file location
 SCHEMA_PATH = Path(__file__).parent / "schema.sql"
 
+# Idle connections kept per database file for reuse by get_db().
+# Opening a connection costs a file open, WAL/shared-memory attach and the
+# PRAGMA setup below, so get_db() hands out pooled connections instead.
+DB_POOL_SIZE = 8
+
+_pool: dict[Path, list[sqlite3.Connection]] = {}
+_pool_lock = threading.Lock()
+
 # Global flag for V1 database detection (set during init, checked by migration)
 _v1_database_detected = False
 
@@ -46,6 +55,15 @@ def get_connection(db_path: Path | str | None = None) -> sqlite3.Connection:
     # WAL allows readers to not block writers and vice versa
     conn.execute("PRAGMA journal_mode=WAL")
 
+    # In WAL mode NORMAL only syncs at checkpoints, not on every commit. A power
+    # loss can drop the last few commits but cannot corrupt the database.
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+    # Keep temp tables/indices (sorts, GROUP BY) in memory and read the
+    # database through a memory map instead of read() syscalls
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+
     # Wait up to 30 seconds if a table is locked (milliseconds)
     conn.execute("PRAGMA busy_timeout=30000")
 
@@ -59,22 +77,78 @@ def get_connection(db_path: Path | str | None = None) -> sqlite3.Connection:
 def get_db(db_path: Path | str | None = None) -> Generator[sqlite3.Connection, None, None]:
     """Context manager for database connections.
 
+    Commits on success and rolls back on error. Connections are pooled per
+    database file and reused across calls.
+
     Usage:
         with get_db() as conn:
             cursor = conn.execute("SELECT * FROM teams")
             teams = cursor.fetchall()
     """
-    conn = get_connection(db_path)
+    path = Path(db_path) if db_path else DEFAULT_DB_PATH
+    conn = _acquire_pooled(path)
+    reusable = True
     try:
         yield conn
         conn.commit()
     except Exception:
-        conn.rollback()
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            reusable = False
         raise
     finally:
+        _release_pooled(path, conn, reusable)
+
+
+def _acquire_pooled(path: Path) -> sqlite3.Connection:
+    """Take an idle pooled connection for path, or open a new one."""
+    with _pool_lock:
+        idle = _pool.get(path)
+        if idle:
+            return idle.pop()
+    return get_connection(path)
+
+
+def _release_pooled(path: Path, conn: sqlite3.Connection, reusable: bool) -> None:
+    """Return a connection to the pool, closing it if it can't be reused."""
+    try:
+        reusable = reusable and not conn.in_transaction
+    except sqlite3.ProgrammingError:
+        # Closed by the caller
+        return
+    if reusable:
+        with _pool_lock:
+            idle = _pool.setdefault(path, [])
+            if len(idle) < DB_POOL_SIZE:
+                idle.append(conn)
+                return
+    conn.close()
+
+
+def close_pooled_connections() -> None:
+    """Close all idle pooled connections.
+
+    Call before the database file is replaced, moved or deleted so no
+    pooled connection keeps pointing at the old file.
+    """
+    with _pool_lock:
+        idle = [conn for conns in _pool.values() for conn in conns]
+        _pool.clear()
+    for conn in idle:
         conn.close()
 
 
+def checkpoint_db(db_path: Path | str | None = None) -> None:
+    """Fold the WAL into the main database file.
+
+    Pooled connections keep the WAL open, so committed data may live only
+    in the -wal file. Call before copying the database file on its own.
+    """
+    with get_db(db_path) as conn:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
 def init_db(db_path: Path | str | None = None) -> None:
     """Initialize database with schema.
 
@@ -153,6 +227,10 @@ def init_db(db_path: Path | str | None = None) -> None:
                 "Please use a fresh data directory or delete the existing database."
             ) from e
         raise
+    finally:
+        # Migrations toggle per-connection state (e.g. foreign_keys), so the
+        # connection used here is not handed out again
+        close_pooled_connections()
 
 
 def _verify_database_integrity(conn: sqlite3.Connection, path: Path) -> None:
@@ -923,6 +1001,61 @@ def _run_migrations(conn: sqlite3.Connection) -> None:
         logger.info("[MIGRATE] Schema upgraded to version 35 (exception keywords label + match_terms)")
         current_version = 35
 
+    # Version 36: service_cache expires_at/created_at stored as unix epoch seconds
+    # Integer compares replace ISO string compares/parsing on load and cleanup
+    if current_version < 36:
+        _migrate_to_v36(conn)
+        conn.execute("UPDATE settings SET schema_version = 36 WHERE id = 1")
+        logger.info("[MIGRATE] Schema upgraded to version 36 (service_cache epoch timestamps)")
+        current_version = 36
+
+
+def _migrate_to_v36(conn: sqlite3.Connection) -> None:
+    """Convert service_cache ISO timestamps to integer unix epoch seconds.
+
+    Rows whose expires_at can't be parsed are dropped (it's only a cache).
+    Also restores data_json rows flushed as UTF-8 bytes to TEXT.
+    """
+    from datetime import datetime
+
+    conn.execute(
+        "UPDATE service_cache SET data_json = CAST(data_json AS TEXT) "
+        "WHERE typeof(data_json) = 'blob'"
+    )
+
+    rows = conn.execute(
+        """SELECT cache_key, expires_at, created_at FROM service_cache
+           WHERE typeof(expires_at) = 'text' OR typeof(created_at) = 'text'"""
+    ).fetchall()
+
+    def to_epoch(value):
+        if isinstance(value, str):
+            return int(datetime.fromisoformat(value).timestamp())
+        return value
+
+    updates = []
+    invalid = []
+    for row in rows:
+        try:
+            expires_at = to_epoch(row["expires_at"])
+            created_at = to_epoch(row["created_at"])
+        except ValueError:
+            invalid.append((row["cache_key"],))
+            continue
+        updates.append((expires_at, created_at, row["cache_key"]))
+
+    conn.executemany(
+        "UPDATE service_cache SET expires_at = ?, created_at = ? WHERE cache_key = ?",
+        updates,
+    )
+    conn.executemany("DELETE FROM service_cache WHERE cache_key = ?", invalid)
+    if rows:
+        logger.info(
+            "[MIGRATE] Converted %d service_cache rows to epoch timestamps (dropped %d)",
+            len(updates),
+            len(invalid),
+        )
+
 
 def _migrate_to_v35(conn: sqlite3.Connection) -> None:
     """Restructure exception keywords table: keywords -> match_terms, display_name -> label.
@@ -1938,6 +2071,7 @@ def reset_db(db_path: Path | str | None = None) -> None:
     """
     path = Path(db_path) if db_path else DEFAULT_DB_PATH
 
+    close_pooled_connections()
     if path.exists():
         path.unlink()
 
@@ -14,6 +14,20 @@ logger = logging.getLogger(__name__)
 
 ExceptionBehavior = Literal["consolidate", "separate", "ignore"]
 
+# Bumped on every write so cached keyword lists know to reload
+_keywords_generation = 0
+
+
+def get_keywords_generation() -> int:
+    """Get the in-process write counter for exception keywords."""
+    return _keywords_generation
+
+
+def invalidate_keywords_cache() -> None:
+    """Mark cached keyword lists stale (called after any keyword write)."""
+    global _keywords_generation
+    _keywords_generation += 1
+
 
 @dataclass
 class ExceptionKeyword:
@@ -172,6 +186,7 @@ def create_keyword(
         (label, match_terms, behavior, int(enabled)),
     )
     conn.commit()
+    invalidate_keywords_cache()
     keyword_id = cursor.lastrowid
     logger.info("[CREATED] Exception keyword id=%d label=%s", keyword_id, label)
     return keyword_id
@@ -232,6 +247,7 @@ def update_keyword(
     cursor = conn.execute(query, values)
     conn.commit()
     if cursor.rowcount > 0:
+        invalidate_keywords_cache()
         logger.info("[UPDATED] Exception keyword id=%d", keyword_id)
         return True
     return False
@@ -254,6 +270,7 @@ def set_keyword_enabled(conn: Connection, keyword_id: int, enabled: bool) -> boo
     )
     conn.commit()
     if cursor.rowcount > 0:
+        invalidate_keywords_cache()
         logger.info("[UPDATED] Exception keyword id=%d enabled=%s", keyword_id, enabled)
         return True
     return False
@@ -279,6 +296,7 @@ def delete_keyword(conn: Connection, keyword_id: int) -> bool:
     )
     conn.commit()
     if cursor.rowcount > 0:
+        invalidate_keywords_cache()
         logger.info("[DELETED] Exception keyword id=%d", keyword_id)
         return True
     return False
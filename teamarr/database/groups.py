@@ -9,6 +9,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from sqlite3 import Connection
 
+from teamarr.utilities import fast_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,13 +78,21 @@ class EventEPGGroup:
     updated_at: datetime | None = None
 
 
-def _row_to_group(row) -> EventEPGGroup:
-    """Convert a database row to EventEPGGroup."""
-    leagues = json.loads(row["leagues"]) if row["leagues"] else []
+def _row_to_group(row, leagues: list[str] | None = None) -> EventEPGGroup:
+    """Convert a database row to EventEPGGroup.
+
+    Args:
+        row: event_epg_groups row
+        leagues: Already-decoded leagues column, if the caller parsed it
+    """
+    # Optional columns are probed for older schemas; build the name set once
+    columns = set(row.keys())
+    if leagues is None:
+        leagues = fast_json.loads(row["leagues"]) if row["leagues"] else []
     channel_profile_ids = []
     if row["channel_profile_ids"]:
         try:
-            channel_profile_ids = json.loads(row["channel_profile_ids"])
+            channel_profile_ids = fast_json.loads(row["channel_profile_ids"])
         except (json.JSONDecodeError, TypeError):
             pass
 
@@ -110,13 +120,13 @@ def _row_to_group(row) -> EventEPGGroup:
     return EventEPGGroup(
         id=row["id"],
         name=row["name"],
-        display_name=row["display_name"] if "display_name" in row.keys() else None,
+        display_name=row["display_name"] if "display_name" in columns else None,
         leagues=leagues,
-        group_mode=row["group_mode"] if "group_mode" in row.keys() else "single",
+        group_mode=row["group_mode"] if "group_mode" in columns else "single",
         template_id=row["template_id"],
         channel_start_number=row["channel_start_number"],
         channel_group_id=row["channel_group_id"],
-        channel_group_mode=row["channel_group_mode"] if "channel_group_mode" in row.keys() else "static",
+        channel_group_mode=row["channel_group_mode"] if "channel_group_mode" in columns else "static",
         channel_profile_ids=channel_profile_ids,
         duplicate_event_handling=row["duplicate_event_handling"] or "consolidate",
         channel_assignment_mode=row["channel_assignment_mode"] or "auto",
@@ -137,38 +147,38 @@ def _row_to_group(row) -> EventEPGGroup:
         stream_exclude_regex_enabled=bool(row["stream_exclude_regex_enabled"]),
         custom_regex_teams=row["custom_regex_teams"],
         custom_regex_teams_enabled=bool(row["custom_regex_teams_enabled"]),
-        custom_regex_date=row["custom_regex_date"] if "custom_regex_date" in row.keys() else None,
+        custom_regex_date=row["custom_regex_date"] if "custom_regex_date" in columns else None,
         custom_regex_date_enabled=bool(row["custom_regex_date_enabled"])
-        if "custom_regex_date_enabled" in row.keys()
+        if "custom_regex_date_enabled" in columns
         else False,
-        custom_regex_time=row["custom_regex_time"] if "custom_regex_time" in row.keys() else None,
+        custom_regex_time=row["custom_regex_time"] if "custom_regex_time" in columns else None,
         custom_regex_time_enabled=bool(row["custom_regex_time_enabled"])
-        if "custom_regex_time_enabled" in row.keys()
+        if "custom_regex_time_enabled" in columns
         else False,
         skip_builtin_filter=bool(row["skip_builtin_filter"]),
         # Team filtering
-        include_teams=json.loads(row["include_teams"]) if row["include_teams"] else None,
-        exclude_teams=json.loads(row["exclude_teams"]) if row["exclude_teams"] else None,
-        team_filter_mode=row["team_filter_mode"] if "team_filter_mode" in row.keys() else "include",
+        include_teams=fast_json.loads(row["include_teams"]) if row["include_teams"] else None,
+        exclude_teams=fast_json.loads(row["exclude_teams"]) if row["exclude_teams"] else None,
+        team_filter_mode=row["team_filter_mode"] if "team_filter_mode" in columns else "include",
         # Processing stats by category (FILTERED / FAILED / EXCLUDED)
-        filtered_stale=row["filtered_stale"] if "filtered_stale" in row.keys() else 0,
+        filtered_stale=row["filtered_stale"] if "filtered_stale" in columns else 0,
         filtered_include_regex=row["filtered_include_regex"] or 0,
         filtered_exclude_regex=row["filtered_exclude_regex"] or 0,
-        filtered_not_event=row["filtered_not_event"] if "filtered_not_event" in row.keys() else 0,
-        filtered_team=row["filtered_team"] if "filtered_team" in row.keys() else 0,
+        filtered_not_event=row["filtered_not_event"] if "filtered_not_event" in columns else 0,
+        filtered_team=row["filtered_team"] if "filtered_team" in columns else 0,
         # Handle both old (filtered_no_match) and new (failed_count) column names
         failed_count=(
             row["failed_count"]
-            if "failed_count" in row.keys()
-            else (row["filtered_no_match"] if "filtered_no_match" in row.keys() else 0)
+            if "failed_count" in columns
+            else (row["filtered_no_match"] if "filtered_no_match" in columns else 0)
         )
         or 0,
-        streams_excluded=row["streams_excluded"] if "streams_excluded" in row.keys() else 0,
+        streams_excluded=row["streams_excluded"] if "streams_excluded" in columns else 0,
         # EXCLUDED breakdown by reason
-        excluded_event_final=row["excluded_event_final"] if "excluded_event_final" in row.keys() else 0,
-        excluded_event_past=row["excluded_event_past"] if "excluded_event_past" in row.keys() else 0,
-        excluded_before_window=row["excluded_before_window"] if "excluded_before_window" in row.keys() else 0,
-        excluded_league_not_included=row["excluded_league_not_included"] if "excluded_league_not_included" in row.keys() else 0,
+        excluded_event_final=row["excluded_event_final"] if "excluded_event_final" in columns else 0,
+        excluded_event_past=row["excluded_event_past"] if "excluded_event_past" in columns else 0,
+        excluded_before_window=row["excluded_before_window"] if "excluded_before_window" in columns else 0,
+        excluded_league_not_included=row["excluded_league_not_included"] if "excluded_league_not_included" in columns else 0,
         # Multi-sport enhancements
         channel_sort_order=row["channel_sort_order"] or "time",
         overlap_handling=row["overlap_handling"] or "add_stream",
@@ -218,6 +228,31 @@ def get_group(conn: Connection, group_id: int) -> EventEPGGroup | None:
     return _row_to_group(row) if row else None
 
 
+def get_group_with_counts(conn: Connection, group_id: int) -> tuple[EventEPGGroup, int] | None:
+    """Get a group and its active managed channel count in one query.
+
+    Args:
+        conn: Database connection
+        group_id: Group ID
+
+    Returns:
+        Tuple of (EventEPGGroup, active channel count) or None if not found
+    """
+    cursor = conn.execute(
+        """SELECT g.*, COUNT(c.id) AS active_channel_count
+           FROM event_epg_groups g
+           LEFT JOIN managed_channels c
+             ON c.event_epg_group_id = g.id AND c.deleted_at IS NULL
+           WHERE g.id = ?
+           GROUP BY g.id""",
+        (group_id,),
+    )
+    row = cursor.fetchone()
+    if not row:
+        return None
+    return _row_to_group(row), row["active_channel_count"]
+
+
 def get_group_by_name(conn: Connection, name: str, m3u_account_id: int | None = None) -> EventEPGGroup | None:
     """Get a single event EPG group by name (optionally scoped to account).
 
@@ -256,9 +291,9 @@ def get_groups_for_league(conn: Connection, league: str) -> list[EventEPGGroup]:
 
     groups = []
     for row in cursor.fetchall():
-        leagues = json.loads(row["leagues"]) if row["leagues"] else []
+        leagues = fast_json.loads(row["leagues"]) if row["leagues"] else []
         if league in leagues:
-            groups.append(_row_to_group(row))
+            groups.append(_row_to_group(row, leagues))
 
     return groups
 
@@ -308,9 +343,13 @@ def create_group(
     channel_sort_order: str = "time",
     overlap_handling: str = "add_stream",
     enabled: bool = True,
-) -> int:
+) -> EventEPGGroup | None:
     """Create a new event EPG group.
 
+    The name check and insert are a single statement, so concurrent creates
+    cannot both claim a name. As with get_group_by_name(), the name must be
+    unique within m3u_account_id, or globally when no account is given.
+
     Args:
         conn: Database connection
         name: Unique group name
@@ -331,7 +370,7 @@ def create_group(
         enabled: Whether group is enabled
 
     Returns:
-        New group ID
+        The created EventEPGGroup, or None if the name is already taken
     """
     # Auto-calculate sort_order for AUTO mode groups
     if channel_assignment_mode == "auto" and sort_order == 0:
@@ -358,7 +397,14 @@ def create_group(
             skip_builtin_filter,
             include_teams, exclude_teams, team_filter_mode,
             channel_sort_order, overlap_handling, enabled
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        )
+        SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+               ?, ?, ?, ?, ?, ?
+        WHERE NOT EXISTS (
+            SELECT 1 FROM event_epg_groups
+            WHERE name = ? AND (? IS NULL OR m3u_account_id = ?)
+        )
+        RETURNING *""",
         (
             name,
             display_name,
@@ -395,11 +441,17 @@ def create_group(
             channel_sort_order,
             overlap_handling,
             int(enabled),
+            # Name uniqueness, matching get_group_by_name()
+            name,
+            m3u_account_id,
+            m3u_account_id,
         ),
     )
-    group_id = cursor.lastrowid
-    logger.info("[CREATED] Event group id=%d name=%s", group_id, name)
-    return group_id
+    row = cursor.fetchone()
+    if not row:
+        return None
+    logger.info("[CREATED] Event group id=%d name=%s", row["id"], name)
+    return _row_to_group(row)
 
 
 # =============================================================================
@@ -869,13 +921,30 @@ def get_group_channel_count(conn: Connection, group_id: int) -> int:
     Returns:
         Number of managed channels (active, not deleted)
     """
+    return get_group_channel_counts(conn, [group_id]).get(group_id, 0)
+
+
+def get_group_channel_counts(conn: Connection, group_ids: list[int]) -> dict[int, int]:
+    """Get counts of managed channels for several groups in one query.
+
+    Args:
+        conn: Database connection
+        group_ids: Group IDs to count
+
+    Returns:
+        Dict mapping group_id to active (not deleted) channel count.
+        Groups without channels are omitted.
+    """
+    if not group_ids:
+        return {}
+    placeholders = ",".join("?" * len(group_ids))
     cursor = conn.execute(
-        """SELECT COUNT(*) as count FROM managed_channels
-           WHERE event_epg_group_id = ? AND deleted_at IS NULL""",
-        (group_id,),
+        f"""SELECT event_epg_group_id, COUNT(*) as count FROM managed_channels
+            WHERE event_epg_group_id IN ({placeholders}) AND deleted_at IS NULL
+            GROUP BY event_epg_group_id""",
+        list(group_ids),
     )
-    row = cursor.fetchone()
-    return row["count"] if row else 0
+    return {row["event_epg_group_id"]: row["count"] for row in cursor.fetchall()}
 
 
 def get_group_stats(conn: Connection, group_id: int) -> dict:
@@ -2,6 +2,10 @@
 
 Used by SportsDataService to serialize Event, Team, TeamStats to/from
 JSON for storage in PersistentTTLCache (SQLite-backed).
+
+Optional Event/Team fields are only written when set; the dict_to_*
+readers already default them, so cached payloads stay small and older
+entries with every key present still load.
 """
 
 from datetime import datetime
@@ -11,7 +15,15 @@ from teamarr.core import Event, EventStatus, Team, TeamStats, Venue
 
 def event_to_dict(event: Event) -> dict:
     """Serialize Event to dict for JSON storage."""
-    return {
+    status = {"state": event.status.state}
+    if event.status.detail is not None:
+        status["detail"] = event.status.detail
+    if event.status.period is not None:
+        status["period"] = event.status.period
+    if event.status.clock is not None:
+        status["clock"] = event.status.clock
+
+    data = {
         "id": event.id,
         "provider": event.provider,
         "name": event.name,
@@ -19,26 +31,28 @@ def event_to_dict(event: Event) -> dict:
         "start_time": event.start_time.isoformat(),
         "home_team": team_to_dict(event.home_team),
         "away_team": team_to_dict(event.away_team),
-        "status": {
-            "state": event.status.state,
-            "detail": event.status.detail,
-            "period": event.status.period,
-            "clock": event.status.clock,
-        },
+        "status": status,
         "league": event.league,
         "sport": event.sport,
-        "home_score": event.home_score,
-        "away_score": event.away_score,
-        "venue": venue_to_dict(event.venue) if event.venue else None,
-        "broadcasts": event.broadcasts,
-        "season_year": event.season_year,
-        "season_type": event.season_type,
     }
+    if event.home_score is not None:
+        data["home_score"] = event.home_score
+    if event.away_score is not None:
+        data["away_score"] = event.away_score
+    if event.venue:
+        data["venue"] = venue_to_dict(event.venue)
+    if event.broadcasts:
+        data["broadcasts"] = event.broadcasts
+    if event.season_year is not None:
+        data["season_year"] = event.season_year
+    if event.season_type is not None:
+        data["season_type"] = event.season_type
+    return data
 
 
 def team_to_dict(team: Team) -> dict:
     """Serialize Team to dict."""
-    return {
+    data = {
         "id": team.id,
         "provider": team.provider,
         "name": team.name,
@@ -46,9 +60,12 @@ def team_to_dict(team: Team) -> dict:
         "abbreviation": team.abbreviation,
         "league": team.league,
         "sport": team.sport,
-        "logo_url": team.logo_url,
-        "color": team.color,
     }
+    if team.logo_url is not None:
+        data["logo_url"] = team.logo_url
+    if team.color is not None:
+        data["color"] = team.color
+    return data
 
 
 def venue_to_dict(venue: Venue) -> dict:
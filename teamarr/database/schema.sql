@@ -900,7 +900,12 @@ CREATE INDEX IF NOT EXISTS idx_tc_team_short ON team_cache(team_short_name COLLA
 CREATE INDEX IF NOT EXISTS idx_tc_league ON team_cache(league);
 CREATE INDEX IF NOT EXISTS idx_tc_sport ON team_cache(sport);
 CREATE INDEX IF NOT EXISTS idx_tc_provider ON team_cache(provider);
-CREATE INDEX IF NOT EXISTS idx_tc_provider_team ON team_cache(provider, provider_team_id);
+-- Covers "which leagues does this team play in" lookups by (provider, team, sport)
+-- without touching table rows. Supersedes the old (provider, provider_team_id)
+-- index, whose columns are also a prefix of the UNIQUE constraint's index.
+DROP INDEX IF EXISTS idx_tc_provider_team;
+CREATE INDEX IF NOT EXISTS idx_tc_provider_team_sport
+    ON team_cache(provider, provider_team_id, sport, league);
 
 
 -- =============================================================================
@@ -973,9 +978,9 @@ CREATE TABLE IF NOT EXISTS service_cache (
     -- Cached data (JSON serialized)
     data_json TEXT NOT NULL,
 
-    -- TTL management
-    expires_at TIMESTAMP NOT NULL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    -- TTL management (unix epoch seconds)
+    expires_at INTEGER NOT NULL,
+    created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
 );
 
 -- Index for cleanup of expired entries
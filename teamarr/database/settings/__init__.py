@@ -4,6 +4,11 @@ Provides CRUD operations for the settings table (singleton row).
 Settings are organized into logical groups for easier management.
 """
 
+from .cached import (
+    get_cached_dispatcharr_settings,
+    get_cached_epg_settings,
+    invalidate_settings_cache,
+)
 from .read import (
     get_all_settings,
     get_channel_numbering_settings,
@@ -66,6 +71,10 @@ __all__ = [
     "get_stream_filter_settings",
     "get_team_filter_settings",
     "get_channel_numbering_settings",
+    # Cached reads
+    "get_cached_dispatcharr_settings",
+    "get_cached_epg_settings",
+    "invalidate_settings_cache",
     # Update operations
     "update_dispatcharr_settings",
     "update_scheduler_settings",
@@ -0,0 +1,68 @@
+"""Short-lived in-process cache for hot settings reads.
+
+Dispatcharr and EPG settings are read on every generation kickoff and on
+every /epg/xmltv fetch, but only change from the settings UI. Reads are
+served from memory for a few seconds. Writers call invalidate_settings_cache()
+after their transaction commits (the settings routes do so once their
+get_db() block exits); invalidating before the commit would let a concurrent
+reader re-cache the old row.
+"""
+
+import time
+from collections.abc import Callable
+from threading import Lock
+from typing import Any
+
+from .read import get_dispatcharr_settings, get_epg_settings
+from .types import DispatcharrSettings, EPGSettings
+
+# Seconds a cached settings object is served before re-reading the DB.
+# Bounds staleness for writes that bypass the update functions (e.g. restore).
+SETTINGS_CACHE_TTL_SECONDS = 30.0
+
+_cache: dict[str, tuple[float, Any]] = {}
+_cache_lock = Lock()
+
+
+def _get_cached(key: str, db_factory: Callable[[], Any], reader: Callable[[Any], Any]) -> Any:
+    now = time.monotonic()
+    entry = _cache.get(key)
+    if entry is not None and now - entry[0] < SETTINGS_CACHE_TTL_SECONDS:
+        return entry[1]
+
+    with db_factory() as conn:
+        value = reader(conn)
+
+    with _cache_lock:
+        _cache[key] = (now, value)
+    return value
+
+
+def get_cached_dispatcharr_settings(db_factory: Callable[[], Any]) -> DispatcharrSettings:
+    """Get Dispatcharr settings, served from memory when fresh.
+
+    Args:
+        db_factory: Factory returning a database connection context manager
+
+    Returns:
+        DispatcharrSettings object
+    """
+    return _get_cached("dispatcharr", db_factory, get_dispatcharr_settings)
+
+
+def get_cached_epg_settings(db_factory: Callable[[], Any]) -> EPGSettings:
+    """Get EPG settings, served from memory when fresh.
+
+    Args:
+        db_factory: Factory returning a database connection context manager
+
+    Returns:
+        EPGSettings object
+    """
+    return _get_cached("epg", db_factory, get_epg_settings)
+
+
+def invalidate_settings_cache() -> None:
+    """Drop all cached settings so the next read hits the database."""
+    with _cache_lock:
+        _cache.clear()
@@ -73,11 +73,7 @@ class DispatcharrFactory:
     @property
     def is_configured(self) -> bool:
         """Check if Dispatcharr settings are configured."""
-        from teamarr.database.settings import get_dispatcharr_settings
-
-        with self._db_factory() as conn:
-            settings = get_dispatcharr_settings(conn)
-
+        settings = self._get_settings()
         return bool(settings.enabled and settings.url and settings.username)
 
     @property
@@ -269,11 +265,7 @@ class DispatcharrFactory:
         Returns:
             DispatcharrConnection or None if not configured
         """
-        from teamarr.database.settings import get_dispatcharr_settings
-
-        with self._db_factory() as conn:
-            settings = get_dispatcharr_settings(conn)
-
+        settings = self._get_settings()
         if not settings.enabled or not settings.url or not settings.username:
             return None
 
@@ -308,13 +300,20 @@ class DispatcharrFactory:
                 logger.warning("[DISPATCHARR] Error closing connection: %s", e)
             self._connection = None
 
-    def _get_settings_hash(self) -> str:
-        """Get a hash of current settings for change detection."""
-        from teamarr.database.settings import get_dispatcharr_settings
+    def _get_settings(self):
+        """Read Dispatcharr settings through the in-process settings cache.
+
+        get_connection() runs on every request that talks to Dispatcharr;
+        the cache is invalidated by settings updates, so a changed config is
+        still picked up (and triggers a reconnect) on the next call.
+        """
+        from teamarr.database.settings import get_cached_dispatcharr_settings
 
-        with self._db_factory() as conn:
-            settings = get_dispatcharr_settings(conn)
+        return get_cached_dispatcharr_settings(self._db_factory)
 
+    def _get_settings_hash(self) -> str:
+        """Get a hash of current settings for change detection."""
+        settings = self._get_settings()
         return f"{settings.url}:{settings.username}:{settings.password}:{settings.enabled}"
 
 
@@ -12,15 +12,15 @@ from typing import Any
 from teamarr.services.sports_data import SportsDataService
 
 
-@dataclass
+@dataclass(slots=True)
 class DeletionResult:
     """Result of channel deletion processing."""
 
-    deleted: list[int] = field(default_factory=list)
-    errors: list[str] = field(default_factory=list)
+    deleted: tuple[int, ...] = ()
+    errors: tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class ReconciliationIssue:
     """A detected reconciliation issue."""
 
@@ -35,7 +35,7 @@ class ReconciliationIssue:
     auto_fixable: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ReconciliationSummary:
     """Summary of reconciliation results."""
 
@@ -45,17 +45,17 @@ class ReconciliationSummary:
     drift: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ReconciliationResult:
     """Result of reconciliation operation."""
 
     started_at: datetime | None = None
     completed_at: datetime | None = None
     summary: ReconciliationSummary = field(default_factory=ReconciliationSummary)
-    issues_found: list[ReconciliationIssue] = field(default_factory=list)
+    issues_found: tuple[ReconciliationIssue, ...] = ()
     issues_fixed: int = 0
     issues_skipped: int = 0
-    errors: list[str] = field(default_factory=list)
+    errors: tuple[str, ...] = ()
 
 
 class ChannelService:
@@ -74,6 +74,30 @@ class ChannelService:
         self._db_factory = db_factory
         self._sports_service = sports_service
         self._client = dispatcharr_client
+        # Consumer services are built on first use and reused for later calls
+        # on this instance (routes build one service per request)
+        self._lifecycle: Any | None = None
+        self._reconciler: Any | None = None
+
+    def _get_lifecycle(self) -> Any:
+        """Get the lifecycle service, creating it on first use."""
+        if self._lifecycle is None:
+            from teamarr.consumers.channel_lifecycle import create_lifecycle_service
+
+            self._lifecycle = create_lifecycle_service(
+                self._db_factory,
+                self._sports_service,
+                self._client,
+            )
+        return self._lifecycle
+
+    def _get_reconciler(self) -> Any:
+        """Get the reconciler, creating it on first use."""
+        if self._reconciler is None:
+            from teamarr.consumers.reconciliation import create_reconciler
+
+            self._reconciler = create_reconciler(self._db_factory, self._client)
+        return self._reconciler
 
     def delete_channel(self, conn: Connection, channel_id: int, reason: str = "manual") -> bool:
         """Delete a managed channel.
@@ -86,33 +110,27 @@ class ChannelService:
         Returns:
             True if deleted successfully
         """
-        from teamarr.consumers.channel_lifecycle import create_lifecycle_service
+        return self._get_lifecycle().delete_managed_channel(conn, channel_id, reason=reason)
 
-        service = create_lifecycle_service(
-            self._db_factory,
-            self._sports_service,
-            self._client,
-        )
-        return service.delete_managed_channel(conn, channel_id, reason=reason)
-
-    def process_scheduled_deletions(self) -> DeletionResult:
+    def process_scheduled_deletions(self, concurrency: int | None = None) -> DeletionResult:
         """Process channels scheduled for deletion.
 
+        Args:
+            concurrency: Maximum concurrent Dispatcharr delete requests
+                (None = lifecycle service default)
+
         Returns:
             DeletionResult with list of deleted channel IDs and errors
         """
-        from teamarr.consumers.channel_lifecycle import create_lifecycle_service
-
-        service = create_lifecycle_service(
-            self._db_factory,
-            self._sports_service,
-            self._client,
-        )
-        result = service.process_scheduled_deletions()
+        lifecycle = self._get_lifecycle()
+        if concurrency is None:
+            result = lifecycle.process_scheduled_deletions()
+        else:
+            result = lifecycle.process_scheduled_deletions(concurrency=concurrency)
 
         return DeletionResult(
-            deleted=result.deleted,
-            errors=result.errors,
+            deleted=tuple(result.deleted),
+            errors=tuple(result.errors),
         )
 
     def reconcile(
@@ -129,13 +147,10 @@ class ChannelService:
         Returns:
             ReconciliationResult with issues found and fixed
         """
-        from teamarr.consumers.reconciliation import create_reconciler
-
-        reconciler = create_reconciler(self._db_factory, self._client)
-        result = reconciler.reconcile(auto_fix=auto_fix, group_ids=group_ids)
+        result = self._get_reconciler().reconcile(auto_fix=auto_fix, group_ids=group_ids)
 
         # Convert consumer types to service types
-        issues = [
+        issues = tuple(
             ReconciliationIssue(
                 issue_type=i.issue_type,
                 severity=i.severity,
@@ -148,13 +163,14 @@ class ChannelService:
                 auto_fixable=i.auto_fixable,
             )
             for i in result.issues_found
-        ]
+        )
 
+        counts = result.summary
         summary = ReconciliationSummary(
-            orphan_teamarr=result.summary.get("orphan_teamarr", 0),
-            orphan_dispatcharr=result.summary.get("orphan_dispatcharr", 0),
-            duplicates=result.summary.get("duplicates", 0),
-            drift=result.summary.get("drift", 0),
+            counts.get("orphan_teamarr", 0),
+            counts.get("orphan_dispatcharr", 0),
+            counts.get("duplicates", 0),
+            counts.get("drift", 0),
         )
 
         return ReconciliationResult(
@@ -164,7 +180,7 @@ class ChannelService:
             issues_found=issues,
             issues_fixed=result.issues_fixed,
             issues_skipped=result.issues_skipped,
-            errors=result.errors,
+            errors=tuple(result.errors),
         )
 
 
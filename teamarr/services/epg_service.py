@@ -10,7 +10,7 @@ from datetime import date, datetime
 from teamarr.services.sports_data import SportsDataService
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamChannelConfig:
     """Configuration for a team-based EPG channel."""
 
@@ -27,7 +27,7 @@ class TeamChannelConfig:
     additional_leagues: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamEPGOptions:
     """Options for team-based EPG generation."""
 
@@ -37,7 +37,7 @@ class TeamEPGOptions:
     default_duration_hours: float = 3.0
 
 
-@dataclass
+@dataclass(slots=True)
 class EventEPGOptions:
     """Options for event-based EPG generation."""
 
@@ -47,7 +47,7 @@ class EventEPGOptions:
     postgame_minutes: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationResult:
     """Result of EPG generation."""
 
@@ -68,7 +68,12 @@ class EPGService:
 
     def __init__(self, sports_service: SportsDataService):
         """Initialize with sports data service."""
+        # Import consumer layer here to maintain layer separation
+        from teamarr.consumers.orchestrator import Orchestrator
+
         self._service = sports_service
+        # Shared by team and event generation; its generators hold no per-run state
+        self._orchestrator = Orchestrator(sports_service)
 
     def generate_team_epg(
         self,
@@ -85,12 +90,9 @@ class EPGService:
             GenerationResult with programmes and XMLTV
         """
         # Import consumer layer here to maintain layer separation
-        from teamarr.consumers.orchestrator import Orchestrator
         from teamarr.consumers.orchestrator import TeamChannelConfig as ConsumerConfig
         from teamarr.consumers.team_epg import TeamEPGOptions as ConsumerOptions
 
-        orchestrator = Orchestrator(self._service)
-
         # Convert service layer types to consumer layer types
         consumer_configs = [
             ConsumerConfig(
@@ -118,7 +120,7 @@ class EPGService:
                 default_duration_hours=options.default_duration_hours,
             )
 
-        result = orchestrator.generate_for_teams(consumer_configs, consumer_options)
+        result = self._orchestrator.generate_for_teams(consumer_configs, consumer_options)
 
         return GenerationResult(
             programmes=result.programmes,
@@ -148,9 +150,6 @@ class EPGService:
             GenerationResult with programmes and XMLTV
         """
         from teamarr.consumers.event_epg import EventEPGOptions as ConsumerOptions
-        from teamarr.consumers.orchestrator import Orchestrator
-
-        orchestrator = Orchestrator(self._service)
 
         consumer_options = None
         if options:
@@ -158,7 +157,7 @@ class EPGService:
                 output_days_ahead=options.output_days_ahead,
             )
 
-        result = orchestrator.generate_for_events(
+        result = self._orchestrator.generate_for_events(
             leagues=leagues,
             target_date=target_date,
             channel_prefix=channel_prefix,
@@ -65,7 +65,6 @@ class BatchGroupResult:
     total_programmes: int = 0
     total_errors: int = 0
     results: list[GroupProcessingResult] = field(default_factory=list)
-    total_xmltv: str = ""
 
 
 class GroupService:
@@ -159,7 +158,6 @@ class GroupService:
             total_programmes=sum(r.programmes_generated for r in batch.results),
             total_errors=batch.total_errors,
             results=[self._convert_result(r) for r in batch.results],
-            total_xmltv=batch.total_xmltv,
         )
 
     def _convert_result(self, result: Any) -> GroupProcessingResult:
@@ -26,7 +26,12 @@ class MatchingService:
 
     def __init__(self, sports_service: SportsDataService):
         """Initialize with sports data service."""
+        # Imported here: teamarr.consumers imports teamarr.services at load time
+        from teamarr.consumers.event_matcher import EventMatcher
+
         self._service = sports_service
+        # EventMatcher holds no state, so one instance serves every call
+        self._matcher = EventMatcher()
 
     def match_by_team_ids(
         self,
@@ -46,14 +51,11 @@ class MatchingService:
         Returns:
             MatchResult with found status and event if matched
         """
-        from teamarr.consumers.event_matcher import EventMatcher
-
         events = self._service.get_events(league, target_date)
         if not events:
             return MatchResult(found=False)
 
-        matcher = EventMatcher()
-        event = matcher.find_by_team_ids(events, team1_id, team2_id)
+        event = self._matcher.find_by_team_ids(events, team1_id, team2_id)
 
         if event:
             return MatchResult(found=True, event=event)
@@ -77,14 +79,11 @@ class MatchingService:
         Returns:
             MatchResult with found status and event if matched
         """
-        from teamarr.consumers.event_matcher import EventMatcher
-
         events = self._service.get_events(league, target_date)
         if not events:
             return MatchResult(found=False)
 
-        matcher = EventMatcher()
-        event = matcher.find_by_team_names(events, team1_name, team2_name)
+        event = self._matcher.find_by_team_names(events, team1_name, team2_name)
 
         if event:
             return MatchResult(found=True, event=event)
@@ -3,11 +3,24 @@
 This module provides a clean API for scheduler operations.
 """
 
+import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+# Seconds a status snapshot is served to pollers before re-reading the scheduler.
+# The service is created per request, so the snapshot is kept at module level.
+STATUS_CACHE_TTL_SECONDS = 1.0
+
+_status_cache: tuple[float, "SchedulerStatus"] | None = None
+
+
+def _parse_iso(data: dict, key: str) -> datetime | None:
+    """Parse an optional ISO 8601 timestamp from a result dict."""
+    value = data.get(key)
+    return datetime.fromisoformat(value) if value else None
+
 
 @dataclass
 class SchedulerStatus:
@@ -31,6 +44,11 @@ class SchedulerRunResult:
     cleanup: dict = field(default_factory=dict)
 
 
+def _invalidate_status_cache() -> None:
+    global _status_cache
+    _status_cache = None
+
+
 class SchedulerService:
     """Service for scheduler operations.
 
@@ -57,11 +75,14 @@ class SchedulerService:
         """
         from teamarr.consumers.scheduler import start_lifecycle_scheduler
 
-        return start_lifecycle_scheduler(
-            self._db_factory,
-            cron_expression=cron_expression,
-            dispatcharr_client=self._client,
-        )
+        try:
+            return start_lifecycle_scheduler(
+                self._db_factory,
+                cron_expression=cron_expression,
+                dispatcharr_client=self._client,
+            )
+        finally:
+            _invalidate_status_cache()
 
     def stop(self, timeout: float = 30.0) -> bool:
         """Stop the cron scheduler.
@@ -74,7 +95,10 @@ class SchedulerService:
         """
         from teamarr.consumers.scheduler import stop_lifecycle_scheduler
 
-        return stop_lifecycle_scheduler(timeout)
+        try:
+            return stop_lifecycle_scheduler(timeout)
+        finally:
+            _invalidate_status_cache()
 
     def get_status(self) -> SchedulerStatus:
         """Get scheduler status.
@@ -82,19 +106,24 @@ class SchedulerService:
         Returns:
             SchedulerStatus with running state, cron expression, and run times
         """
+        global _status_cache
+
+        now = time.monotonic()
+        cached = _status_cache
+        if cached is not None and now - cached[0] < STATUS_CACHE_TTL_SECONDS:
+            return cached[1]
+
         from teamarr.consumers.scheduler import get_scheduler_status
 
         status = get_scheduler_status()
-        return SchedulerStatus(
+        result = SchedulerStatus(
             running=status.get("running", False),
             cron_expression=status.get("cron_expression", "0 * * * *"),
-            last_run=(
-                datetime.fromisoformat(status["last_run"]) if status.get("last_run") else None
-            ),
-            next_run=(
-                datetime.fromisoformat(status["next_run"]) if status.get("next_run") else None
-            ),
+            last_run=status.get("last_run"),
+            next_run=status.get("next_run"),
         )
+        _status_cache = (now, result)
+        return result
 
     def run_once(self) -> SchedulerRunResult:
         """Run all scheduled tasks once (for testing/manual trigger).
@@ -102,24 +131,18 @@ class SchedulerService:
         Returns:
             SchedulerRunResult with task results
         """
-        from teamarr.consumers.scheduler import CronScheduler
+        from teamarr.consumers.scheduler import get_scheduler_instance
 
-        scheduler = CronScheduler(
-            self._db_factory,
-            dispatcharr_client=self._client,
-            run_on_start=False,
-        )
-        result = scheduler.run_once()
+        scheduler = get_scheduler_instance(self._db_factory, self._client)
+        try:
+            result = scheduler.run_once()
+        finally:
+            # The running scheduler's last_run changed
+            _invalidate_status_cache()
 
         return SchedulerRunResult(
-            started_at=(
-                datetime.fromisoformat(result["started_at"]) if result.get("started_at") else None
-            ),
-            completed_at=(
-                datetime.fromisoformat(result["completed_at"])
-                if result.get("completed_at")
-                else None
-            ),
+            started_at=_parse_iso(result, "started_at"),
+            completed_at=_parse_iso(result, "completed_at"),
             epg_generation=result.get("epg_generation", {}),
             deletions=result.get("deletions", {}),
             reconciliation=result.get("reconciliation", {}),
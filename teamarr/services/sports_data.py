@@ -12,7 +12,11 @@ Uses PersistentTTLCache for all caching:
 
 import logging
 import threading
+from collections import OrderedDict
+from collections.abc import Collection, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from typing import Any
 
 from teamarr.core import Event, SportsProvider, Team, TeamStats
 from teamarr.database.provider_cache import (
@@ -53,6 +57,35 @@ def _get_shared_cache() -> PersistentTTLCache:
     return _shared_cache
 
 
+# Decoded event lists for cache hits, keyed by cache key. Each entry keeps the
+# cached payload it was decoded from: a replaced or expired cache entry yields
+# a different (or no) payload, so a stale list is never served.
+DECODED_EVENTS_MAX_SIZE = 2048
+_decoded_events: OrderedDict[str, tuple[Any, list[Event]]] = OrderedDict()
+_decoded_events_lock = threading.Lock()
+
+
+def _decode_cached_events(cache_key: str, cached: list[dict]) -> list[Event]:
+    """Deserialize a cached event list, reusing the last decode of this payload.
+
+    Returns a new list each call; the Event objects are shared.
+    """
+    with _decoded_events_lock:
+        entry = _decoded_events.get(cache_key)
+        if entry is not None and entry[0] is cached:
+            _decoded_events.move_to_end(cache_key)
+            return list(entry[1])
+
+    events = [dict_to_event(e) for e in cached]
+
+    with _decoded_events_lock:
+        _decoded_events[cache_key] = (cached, events)
+        _decoded_events.move_to_end(cache_key)
+        if len(_decoded_events) > DECODED_EVENTS_MAX_SIZE:
+            _decoded_events.popitem(last=False)
+    return list(events)
+
+
 def flush_shared_cache() -> int:
     """Flush the shared cache to SQLite.
 
@@ -141,7 +174,7 @@ class SportsDataService:
         if cached is not None:
             logger.debug("[CACHE_HIT] %s", cache_key)
             try:
-                return [dict_to_event(e) for e in cached]
+                return _decode_cached_events(cache_key, cached)
             except (KeyError, TypeError) as e:
                 logger.warning("[CACHE_ERROR] Deserialization failed: %s", e)
 
@@ -160,6 +193,50 @@ class SportsDataService:
                     return events
         return []
 
+    def get_events_bulk(
+        self,
+        requests: Iterable[tuple[str, date]],
+        cache_only_leagues: Collection[str] = (),
+        max_workers: int = 16,
+        raise_errors: bool = False,
+    ) -> dict[tuple[str, date], list[Event]]:
+        """Get events for many (league, date) pairs concurrently.
+
+        Duplicate pairs are fetched once. Cache misses are provider HTTP
+        round-trips, so fetches run on a thread pool. By default a failed
+        fetch is logged and yields an empty list for that pair.
+
+        Args:
+            requests: (league, date) pairs to fetch
+            cache_only_leagues: Leagues served from cache only (no API calls)
+            max_workers: Maximum concurrent fetches
+            raise_errors: Re-raise the first failed fetch (in request order)
+                instead of substituting an empty list
+
+        Returns:
+            Dict of (league, date) -> list of events
+        """
+        pairs = list(dict.fromkeys(requests))
+        if not pairs:
+            return {}
+
+        def fetch(pair: tuple[str, date]) -> list[Event]:
+            league, target_date = pair
+            try:
+                return self.get_events(
+                    league, target_date, cache_only=league in cache_only_leagues
+                )
+            except Exception as e:
+                if raise_errors:
+                    raise
+                logger.warning(
+                    "[FETCH_ERROR] Failed to fetch events for %s on %s: %s", league, target_date, e
+                )
+                return []
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pairs)))) as executor:
+            return dict(zip(pairs, executor.map(fetch, pairs), strict=True))
+
     def get_team_schedule(
         self,
         team_id: str,
@@ -174,7 +251,7 @@ class SportsDataService:
         if cached is not None:
             logger.debug("[CACHE_HIT] %s", cache_key)
             try:
-                return [dict_to_event(e) for e in cached]
+                return _decode_cached_events(cache_key, cached)
             except (KeyError, TypeError) as e:
                 logger.warning("[CACHE_ERROR] Deserialization failed: %s", e)
 
@@ -313,6 +390,8 @@ class SportsDataService:
     def clear_cache(self) -> None:
         """Clear all cached data."""
         self._cache.clear()
+        with _decoded_events_lock:
+            _decoded_events.clear()
 
     def flush_cache(self) -> int:
         """Flush dirty cache entries to SQLite.
@@ -1,28 +1,16 @@
 """Template variables module.
 
-Importing this module registers all template variables via decorators.
-Each variable file defines extractors decorated with @register_variable.
+Each category file defines extractors decorated with @register_variable.
+Category modules are imported lazily: get_registry() loads them all on first
+use (so the registry is always complete), and attribute access such as
+`variables.streaks` imports just that module (PEP 562).
 """
 
-from teamarr.templates.variables import (  # noqa: F401 - side effect imports
-    broadcast,
-    conference,
-    home_away,
-    identity,
-    odds,
-    outcome,
-    playoffs,
-    rankings,
-    records,
-    scores,
-    soccer,
-    standings,
-    statistics,
-    streaks,
-    venue,
-)
-from teamarr.templates.variables import datetime as datetime_vars  # noqa: F401
+import importlib
+from types import ModuleType
+
 from teamarr.templates.variables.registry import (
+    CATEGORY_MODULES,
     Category,
     SuffixRules,
     VariableDefinition,
@@ -39,3 +27,14 @@ __all__ = [
     "get_registry",
     "register_variable",
 ]
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in CATEGORY_MODULES:
+        # Importing a submodule binds it as an attribute of this package
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(CATEGORY_MODULES))
@@ -5,6 +5,9 @@ Variables are registered using the @register_variable decorator, which
 captures metadata alongside the extraction function.
 """
 
+import importlib
+import logging
+import os
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum, auto
@@ -13,9 +16,34 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from teamarr.templates.context import GameContext, TemplateContext
 
+logger = logging.getLogger(__name__)
+
 # Type alias for extractor functions
 Extractor = Callable[["TemplateContext", "GameContext | None"], str]
 
+# Category modules under teamarr.templates.variables, in registration order.
+# Importing one registers its variables; get_registry() loads all enabled ones.
+CATEGORY_MODULES = (
+    "broadcast",
+    "conference",
+    "home_away",
+    "identity",
+    "odds",
+    "outcome",
+    "playoffs",
+    "rankings",
+    "records",
+    "scores",
+    "soccer",
+    "standings",
+    "statistics",
+    "streaks",
+    "venue",
+    "datetime",
+)
+
+_categories_loaded = False
+
 
 class Category(Enum):
     """Variable categories for organization and documentation."""
@@ -146,6 +174,36 @@ def register_variable(
     return decorator
 
 
+def _enabled_categories() -> list[str]:
+    """Category modules to load, minus any listed in DISABLED_VARIABLE_CATEGORIES.
+
+    DISABLED_VARIABLE_CATEGORIES is a comma-separated list of module names
+    (e.g. "odds,soccer"). Variables from disabled categories are never
+    registered, so they aren't extracted on render and stay literal in templates.
+    """
+    disabled = {
+        name.strip().lower()
+        for name in os.getenv("DISABLED_VARIABLE_CATEGORIES", "").split(",")
+        if name.strip()
+    }
+    if disabled:
+        logger.info(
+            "[TEMPLATES] Variable categories disabled: %s",
+            ", ".join(sorted(disabled & set(CATEGORY_MODULES))),
+        )
+    return [module for module in CATEGORY_MODULES if module not in disabled]
+
+
+def _load_categories() -> None:
+    """Import every enabled category module so its variables are registered."""
+    global _categories_loaded
+    for module in _enabled_categories():
+        importlib.import_module(f"teamarr.templates.variables.{module}")
+    _categories_loaded = True
+
+
 def get_registry() -> VariableRegistry:
-    """Get the singleton variable registry."""
+    """Get the singleton variable registry, loading all categories on first use."""
+    if not _categories_loaded:
+        _load_categories()
     return VariableRegistry()
@@ -10,278 +10,256 @@ Variable naming:
 - Prefixed versions: `opponent_*`, `home_team_*`, `away_team_*`
 """
 
+from collections.abc import Callable
+from functools import lru_cache
+
 from teamarr.core import TeamStats
 from teamarr.templates.context import GameContext, TemplateContext
 from teamarr.templates.variables.registry import (
     Category,
+    Extractor,
     SuffixRules,
     register_variable,
 )
 
+# Indexes into the rendered streak tuple, one per variable kind
+_FORMATTED, _LENGTH, _TYPE, _WIN, _LOSS = range(5)
 
-def _get_streak_info(stats: TeamStats | None) -> tuple[str, int, str]:
-    """Extract streak info from stats.
-
-    Returns:
-        Tuple of (formatted, length, type):
-        - formatted: "W3" or "L2"
-        - length: 3 (absolute value)
-        - type: "win" or "loss"
-    """
-    if not stats or not stats.streak:
-        return "", 0, ""
-
-    formatted = stats.streak  # "W3" or "L2"
-    count = stats.streak_count  # signed: 3 or -2
-
-    length = abs(count)
-    streak_type = "win" if count > 0 else "loss" if count < 0 else ""
+_NO_STREAK: tuple[str, str, str, str, str] = ("", "", "", "", "")
 
-    return formatted, length, streak_type
+# Pre-rendered streak lengths; real streaks are far shorter than this
+_LEN_STR = tuple(str(i) for i in range(128))
 
 
-# =============================================================================
-# OUR TEAM'S STREAK
-# =============================================================================
+def _length_str(length: int) -> str:
+    """String form of a streak length, from the lookup table when possible."""
+    return _LEN_STR[length] if length < len(_LEN_STR) else str(length)
 
 
-@register_variable(
-    name="streak",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.BASE_ONLY,
-    description="Team's current streak formatted (e.g., 'W3' or 'L2')",
-)
-def extract_streak(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    formatted, _, _ = _get_streak_info(ctx.team_stats)
-    return formatted
+@lru_cache(maxsize=256)
+def _streak_info(formatted: str, count: int) -> tuple[str, str, str, str, str]:
+    """Render every streak variable value for a streak; memoized by value."""
+    length = abs(count)
+    length_str = _length_str(length) if length > 0 else ""
+    streak_type = "win" if count > 0 else "loss" if count < 0 else ""
+    return (
+        formatted,
+        length_str,
+        streak_type,
+        length_str if streak_type == "win" else "",
+        length_str if streak_type == "loss" else "",
+    )
 
 
-@register_variable(
-    name="streak_length",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.BASE_ONLY,
-    description="Team's streak as absolute value (e.g., '3' for either W3 or L3)",
-)
-def extract_streak_length(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    _, length, _ = _get_streak_info(ctx.team_stats)
-    return str(length) if length > 0 else ""
+def _get_streak_info(stats: TeamStats | None) -> tuple[str, str, str, str, str]:
+    """Extract rendered streak values from stats.
 
+    TeamStats is a slotted frozen dataclass, so the derived tuple is memoized
+    on the (streak, streak_count) values rather than on the instance. Every
+    streak variable in a render then shares one computation.
 
-@register_variable(
-    name="streak_type",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.BASE_ONLY,
-    description="Team's streak direction: 'win' or 'loss'",
-)
-def extract_streak_type(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    _, _, streak_type = _get_streak_info(ctx.team_stats)
-    return streak_type
+    Returns:
+        Tuple indexed by _FORMATTED, _LENGTH, _TYPE, _WIN, _LOSS:
+        - formatted: "W3" or "L2"
+        - length: "3" (absolute value, empty if no streak)
+        - type: "win" or "loss"
+        - win / loss: length only if the streak is of that type
+    """
+    if not stats or not stats.streak:
+        return _NO_STREAK
 
+    # formatted is "W3" or "L2"; streak_count is signed: 3 or -2
+    return _streak_info(stats.streak, stats.streak_count)
 
-@register_variable(
-    name="win_streak",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.BASE_ONLY,
-    description="Team's winning streak length (empty if on losing streak)",
-)
-def extract_win_streak(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    _, length, streak_type = _get_streak_info(ctx.team_stats)
-    return str(length) if streak_type == "win" else ""
 
+# =============================================================================
+# STATS SOURCES
+# =============================================================================
 
-@register_variable(
-    name="loss_streak",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.BASE_ONLY,
-    description="Team's losing streak length (empty if on winning streak)",
-)
-def extract_loss_streak(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    _, length, streak_type = _get_streak_info(ctx.team_stats)
-    return str(length) if streak_type == "loss" else ""
+StatsGetter = Callable[[TemplateContext, GameContext | None], TeamStats | None]
 
 
-# =============================================================================
-# OPPONENT'S STREAK
-# =============================================================================
+def _get_team_stats(ctx: TemplateContext, game_ctx: GameContext | None) -> TeamStats | None:
+    """Get stats for our team."""
+    return ctx.team_stats
 
 
-@register_variable(
-    name="opponent_streak",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.ALL,
-    description="Opponent's current streak formatted (e.g., 'W3' or 'L2')",
-)
-def extract_opponent_streak(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    if not game_ctx:
-        return ""
-    formatted, _, _ = _get_streak_info(game_ctx.opponent_stats)
-    return formatted
-
-
-@register_variable(
-    name="opponent_streak_length",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.ALL,
-    description="Opponent's streak as absolute value (e.g., '3')",
-)
-def extract_opponent_streak_length(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    if not game_ctx:
-        return ""
-    _, length, _ = _get_streak_info(game_ctx.opponent_stats)
-    return str(length) if length > 0 else ""
-
-
-@register_variable(
-    name="opponent_streak_type",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.ALL,
-    description="Opponent's streak direction: 'win' or 'loss'",
-)
-def extract_opponent_streak_type(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    if not game_ctx:
-        return ""
-    _, _, streak_type = _get_streak_info(game_ctx.opponent_stats)
-    return streak_type
-
-
-@register_variable(
-    name="opponent_win_streak",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.ALL,
-    description="Opponent's winning streak length (empty if on losing streak)",
-)
-def extract_opponent_win_streak(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    if not game_ctx:
-        return ""
-    _, length, streak_type = _get_streak_info(game_ctx.opponent_stats)
-    return str(length) if streak_type == "win" else ""
-
-
-@register_variable(
-    name="opponent_loss_streak",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.ALL,
-    description="Opponent's losing streak length (empty if on winning streak)",
-)
-def extract_opponent_loss_streak(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    if not game_ctx:
-        return ""
-    _, length, streak_type = _get_streak_info(game_ctx.opponent_stats)
-    return str(length) if streak_type == "loss" else ""
+def _get_opponent_stats(ctx: TemplateContext, game_ctx: GameContext | None) -> TeamStats | None:
+    """Get stats for the opponent in this game."""
+    return game_ctx.opponent_stats if game_ctx else None
 
 
-# =============================================================================
-# HOME/AWAY TEAM STREAKS (for event-based templates)
-# =============================================================================
+def _resolve_home_away_stats(
+    ctx: TemplateContext, game_ctx: GameContext | None
+) -> tuple[TeamStats | None, TeamStats | None]:
+    """Get (home, away) stats for this game from our team's perspective."""
+    if not game_ctx or not game_ctx.event:
+        return None, None
+    if game_ctx.event.home_team.id == ctx.team_config.team_id:
+        return ctx.team_stats, game_ctx.opponent_stats
+    return game_ctx.opponent_stats, ctx.team_stats
 
 
 def _get_home_team_stats(ctx: TemplateContext, game_ctx: GameContext | None) -> TeamStats | None:
     """Get stats for the home team in this game."""
-    if not game_ctx or not game_ctx.event:
-        return None
-    is_home = game_ctx.event.home_team.id == ctx.team_config.team_id
-    return ctx.team_stats if is_home else game_ctx.opponent_stats
+    return _resolve_home_away_stats(ctx, game_ctx)[0]
 
 
 def _get_away_team_stats(ctx: TemplateContext, game_ctx: GameContext | None) -> TeamStats | None:
     """Get stats for the away team in this game."""
-    if not game_ctx or not game_ctx.event:
-        return None
-    is_home = game_ctx.event.home_team.id == ctx.team_config.team_id
-    return game_ctx.opponent_stats if is_home else ctx.team_stats
-
-
-@register_variable(
-    name="home_team_streak",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.ALL,
-    description="Home team's current streak formatted (e.g., 'W3' or 'L2')",
-)
-def extract_home_team_streak(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    stats = _get_home_team_stats(ctx, game_ctx)
-    formatted, _, _ = _get_streak_info(stats)
-    return formatted
+    return _resolve_home_away_stats(ctx, game_ctx)[1]
 
 
-@register_variable(
-    name="home_team_streak_length",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.ALL,
-    description="Home team's streak as absolute value",
-)
-def extract_home_team_streak_length(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    stats = _get_home_team_stats(ctx, game_ctx)
-    _, length, _ = _get_streak_info(stats)
-    return str(length) if length > 0 else ""
-
-
-@register_variable(
-    name="home_team_win_streak",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.ALL,
-    description="Home team's winning streak (empty if losing)",
-)
-def extract_home_team_win_streak(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    stats = _get_home_team_stats(ctx, game_ctx)
-    _, length, streak_type = _get_streak_info(stats)
-    return str(length) if streak_type == "win" else ""
-
-
-@register_variable(
-    name="home_team_loss_streak",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.ALL,
-    description="Home team's losing streak (empty if winning)",
-)
-def extract_home_team_loss_streak(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    stats = _get_home_team_stats(ctx, game_ctx)
-    _, length, streak_type = _get_streak_info(stats)
-    return str(length) if streak_type == "loss" else ""
+def _make_streak_extractor(get_stats: StatsGetter, index: int) -> Extractor:
+    """Build an extractor returning one rendered streak value for a team."""
 
+    def extract(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
+        return _get_streak_info(get_stats(ctx, game_ctx))[index]
 
-@register_variable(
-    name="away_team_streak",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.ALL,
-    description="Away team's current streak formatted (e.g., 'W3' or 'L2')",
-)
-def extract_away_team_streak(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    stats = _get_away_team_stats(ctx, game_ctx)
-    formatted, _, _ = _get_streak_info(stats)
-    return formatted
-
+    return extract
 
-@register_variable(
-    name="away_team_streak_length",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.ALL,
-    description="Away team's streak as absolute value",
-)
-def extract_away_team_streak_length(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    stats = _get_away_team_stats(ctx, game_ctx)
-    _, length, _ = _get_streak_info(stats)
-    return str(length) if length > 0 else ""
 
+# =============================================================================
+# VARIABLE SPECS
+# =============================================================================
 
-@register_variable(
-    name="away_team_win_streak",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.ALL,
-    description="Away team's winning streak (empty if losing)",
+# (name, stats source, value index, suffix rules, description)
+_STREAK_VARIABLES: tuple[tuple[str, StatsGetter, int, SuffixRules, str], ...] = (
+    # Our team's streak
+    (
+        "streak",
+        _get_team_stats,
+        _FORMATTED,
+        SuffixRules.BASE_ONLY,
+        "Team's current streak formatted (e.g., 'W3' or 'L2')",
+    ),
+    (
+        "streak_length",
+        _get_team_stats,
+        _LENGTH,
+        SuffixRules.BASE_ONLY,
+        "Team's streak as absolute value (e.g., '3' for either W3 or L3)",
+    ),
+    (
+        "streak_type",
+        _get_team_stats,
+        _TYPE,
+        SuffixRules.BASE_ONLY,
+        "Team's streak direction: 'win' or 'loss'",
+    ),
+    (
+        "win_streak",
+        _get_team_stats,
+        _WIN,
+        SuffixRules.BASE_ONLY,
+        "Team's winning streak length (empty if on losing streak)",
+    ),
+    (
+        "loss_streak",
+        _get_team_stats,
+        _LOSS,
+        SuffixRules.BASE_ONLY,
+        "Team's losing streak length (empty if on winning streak)",
+    ),
+    # Opponent's streak
+    (
+        "opponent_streak",
+        _get_opponent_stats,
+        _FORMATTED,
+        SuffixRules.ALL,
+        "Opponent's current streak formatted (e.g., 'W3' or 'L2')",
+    ),
+    (
+        "opponent_streak_length",
+        _get_opponent_stats,
+        _LENGTH,
+        SuffixRules.ALL,
+        "Opponent's streak as absolute value (e.g., '3')",
+    ),
+    (
+        "opponent_streak_type",
+        _get_opponent_stats,
+        _TYPE,
+        SuffixRules.ALL,
+        "Opponent's streak direction: 'win' or 'loss'",
+    ),
+    (
+        "opponent_win_streak",
+        _get_opponent_stats,
+        _WIN,
+        SuffixRules.ALL,
+        "Opponent's winning streak length (empty if on losing streak)",
+    ),
+    (
+        "opponent_loss_streak",
+        _get_opponent_stats,
+        _LOSS,
+        SuffixRules.ALL,
+        "Opponent's losing streak length (empty if on winning streak)",
+    ),
+    # Home/away team streaks (for event-based templates)
+    (
+        "home_team_streak",
+        _get_home_team_stats,
+        _FORMATTED,
+        SuffixRules.ALL,
+        "Home team's current streak formatted (e.g., 'W3' or 'L2')",
+    ),
+    (
+        "home_team_streak_length",
+        _get_home_team_stats,
+        _LENGTH,
+        SuffixRules.ALL,
+        "Home team's streak as absolute value",
+    ),
+    (
+        "home_team_win_streak",
+        _get_home_team_stats,
+        _WIN,
+        SuffixRules.ALL,
+        "Home team's winning streak (empty if losing)",
+    ),
+    (
+        "home_team_loss_streak",
+        _get_home_team_stats,
+        _LOSS,
+        SuffixRules.ALL,
+        "Home team's losing streak (empty if winning)",
+    ),
+    (
+        "away_team_streak",
+        _get_away_team_stats,
+        _FORMATTED,
+        SuffixRules.ALL,
+        "Away team's current streak formatted (e.g., 'W3' or 'L2')",
+    ),
+    (
+        "away_team_streak_length",
+        _get_away_team_stats,
+        _LENGTH,
+        SuffixRules.ALL,
+        "Away team's streak as absolute value",
+    ),
+    (
+        "away_team_win_streak",
+        _get_away_team_stats,
+        _WIN,
+        SuffixRules.ALL,
+        "Away team's winning streak (empty if losing)",
+    ),
+    (
+        "away_team_loss_streak",
+        _get_away_team_stats,
+        _LOSS,
+        SuffixRules.ALL,
+        "Away team's losing streak (empty if winning)",
+    ),
 )
-def extract_away_team_win_streak(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    stats = _get_away_team_stats(ctx, game_ctx)
-    _, length, streak_type = _get_streak_info(stats)
-    return str(length) if streak_type == "win" else ""
-
 
-@register_variable(
-    name="away_team_loss_streak",
-    category=Category.STREAKS,
-    suffix_rules=SuffixRules.ALL,
-    description="Away team's losing streak (empty if winning)",
-)
-def extract_away_team_loss_streak(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    stats = _get_away_team_stats(ctx, game_ctx)
-    _, length, streak_type = _get_streak_info(stats)
-    return str(length) if streak_type == "loss" else ""
+for _name, _get_stats, _index, _suffix_rules, _description in _STREAK_VARIABLES:
+    register_variable(
+        name=_name,
+        category=Category.STREAKS,
+        suffix_rules=_suffix_rules,
+        description=_description,
+    )(_make_streak_extractor(_get_stats, _index))
@@ -17,23 +17,29 @@ TTL recommendations:
 """
 
 import atexit
-import json
 import logging
 import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Any
 
+from teamarr.utilities import fast_json
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
-    """A cached value with expiration."""
+    """A cached value with expiration.
+
+    expires_at is time.monotonic() seconds; wall-clock epoch seconds are only
+    used at the persistence boundary (get_all_entries/set_with_expiry).
+    """
 
     value: Any
-    expires_at: datetime
-    last_accessed: datetime
+    expires_at: float
 
 
 class TTLCache:
@@ -59,64 +65,72 @@ class TTLCache:
         default_ttl_seconds: int = 3600,
         max_size: int = DEFAULT_MAX_SIZE,
     ):
-        self._cache: dict[str, CacheEntry] = {}
-        self._default_ttl = timedelta(seconds=default_ttl_seconds)
+        # Insertion order doubles as recency order (least recent first)
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._default_ttl = float(default_ttl_seconds)
         self._max_size = max_size
         self._lock = threading.Lock()
         self._hits = 0
         self._misses = 0
 
     def get(self, key: str) -> Any | None:
-        """Get value if exists and not expired."""
+        """Get value if exists and not expired.
+
+        Hits don't wait on the lock: a single dict lookup is atomic, and the
+        LRU position is only refreshed when the lock is free (recency is
+        best-effort under contention). Misses and expiry take the lock.
+        """
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() <= entry.expires_at:
+            if self._lock.acquire(blocking=False):
+                try:
+                    # Mark as most recently used (unless evicted meanwhile)
+                    if key in self._cache:
+                        self._cache.move_to_end(key)
+                    self._hits += 1
+                finally:
+                    self._lock.release()
+            else:
+                self._hits += 1  # Unlocked increment; stats are approximate
+            return entry.value
+
         with self._lock:
             entry = self._cache.get(key)
             if entry is None:
                 self._misses += 1
                 return None
-            if datetime.now() > entry.expires_at:
+            now = time.monotonic()
+            if now > entry.expires_at:
                 del self._cache[key]
                 self._misses += 1
                 return None
-            # Update last accessed time for LRU
-            entry.last_accessed = datetime.now()
+            # Mark as most recently used
+            self._cache.move_to_end(key)
             self._hits += 1
             return entry.value
 
     def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
         """Set value with optional custom TTL."""
-        ttl = timedelta(seconds=ttl_seconds) if ttl_seconds else self._default_ttl
-        now = datetime.now()
-        expires_at = now + ttl
+        ttl = ttl_seconds if ttl_seconds else self._default_ttl
+        expires_at = time.monotonic() + ttl
 
         with self._lock:
             # Evict if at max size and key is new
             if self._max_size > 0 and key not in self._cache:
                 self._evict_if_needed()
 
-            self._cache[key] = CacheEntry(
-                value=value,
-                expires_at=expires_at,
-                last_accessed=now,
-            )
+            self._cache[key] = CacheEntry(value=value, expires_at=expires_at)
+            self._cache.move_to_end(key)
 
     def _evict_if_needed(self) -> None:
         """Evict entries if cache is at max size. Called with lock held."""
         if self._max_size <= 0:
             return
 
-        # First, remove expired entries
-        now = datetime.now()
-        expired_keys = [k for k, v in self._cache.items() if now > v.expires_at]
-        for key in expired_keys:
-            del self._cache[key]
-
-        # If still at/over max, evict least recently used
-        while len(self._cache) >= self._max_size:
-            if not self._cache:
-                break
-            # Find LRU entry
-            lru_key = min(self._cache.keys(), key=lambda k: self._cache[k].last_accessed)
-            del self._cache[lru_key]
+        # Evict least recently used. Expired entries elsewhere in the order are
+        # dropped on access or by cleanup_expired() rather than scanning here.
+        while self._cache and len(self._cache) >= self._max_size:
+            self._cache.popitem(last=False)
 
     def delete(self, key: str) -> None:
         """Delete a key from cache."""
@@ -132,7 +146,7 @@ class TTLCache:
 
     def cleanup_expired(self) -> int:
         """Remove all expired entries. Returns count removed."""
-        now = datetime.now()
+        now = time.monotonic()
         removed = 0
         with self._lock:
             expired_keys = [k for k, v in self._cache.items() if now > v.expires_at]
@@ -153,54 +167,59 @@ class TTLCache:
 
     def stats(self) -> dict:
         """Get cache statistics."""
-        now = datetime.now()
+        # Snapshot under the lock; count expired entries after releasing it
         with self._lock:
-            total = len(self._cache)
-            expired = sum(1 for v in self._cache.values() if now > v.expires_at)
-            total_requests = self._hits + self._misses
-            hit_rate = self._hits / total_requests if total_requests > 0 else 0
-            return {
-                "total_entries": total,
-                "active_entries": total - expired,
-                "expired_entries": expired,
-                "max_size": self._max_size,
-                "hits": self._hits,
-                "misses": self._misses,
-                "hit_rate": round(hit_rate, 3),
-            }
-
-    def get_all_entries(self) -> dict[str, tuple[Any, datetime]]:
+            expirations = [v.expires_at for v in self._cache.values()]
+            hits = self._hits
+            misses = self._misses
+
+        now = time.monotonic()
+        total = len(expirations)
+        expired = sum(now > expires_at for expires_at in expirations)
+        total_requests = hits + misses
+        hit_rate = hits / total_requests if total_requests > 0 else 0
+        return {
+            "total_entries": total,
+            "active_entries": total - expired,
+            "expired_entries": expired,
+            "max_size": self._max_size,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hit_rate, 3),
+        }
+
+    def get_all_entries(self) -> dict[str, tuple[Any, float]]:
         """Get all cache entries with their expiration times.
 
-        Returns dict of key -> (value, expires_at) for serialization.
-        Only returns non-expired entries.
+        Returns dict of key -> (value, expires_at) for serialization, with
+        expires_at as unix epoch seconds. Only returns non-expired entries.
         """
-        now = datetime.now()
         with self._lock:
+            now = time.monotonic()
+            wall_now = time.time()
             return {
-                k: (v.value, v.expires_at)
+                k: (v.value, wall_now + (v.expires_at - now))
                 for k, v in self._cache.items()
                 if v.expires_at > now
             }
 
-    def set_with_expiry(self, key: str, value: Any, expires_at: datetime) -> None:
+    def set_with_expiry(self, key: str, value: Any, expires_at: float) -> None:
         """Set value with explicit expiration time.
 
-        Used when loading from persistent storage.
+        Used when loading from persistent storage; expires_at is unix epoch seconds.
         """
-        now = datetime.now()
-        if expires_at <= now:
+        remaining = expires_at - time.time()
+        if remaining <= 0:
             return  # Already expired, don't load
 
+        expires_at_monotonic = time.monotonic() + remaining
+
         with self._lock:
             if self._max_size > 0 and key not in self._cache:
                 self._evict_if_needed()
 
-            self._cache[key] = CacheEntry(
-                value=value,
-                expires_at=expires_at,
-                last_accessed=now,
-            )
+            self._cache[key] = CacheEntry(value=value, expires_at=expires_at_monotonic)
+            self._cache.move_to_end(key)
 
 
 class PersistentTTLCache:
@@ -260,7 +279,7 @@ class PersistentTTLCache:
         """Load non-expired entries from SQLite into memory."""
         from teamarr.database.connection import get_db
 
-        now = datetime.now()
+        now = time.time()
         loaded = 0
         expired = 0
 
@@ -272,16 +291,16 @@ class PersistentTTLCache:
 
             for row in rows:
                 try:
-                    expires_at = datetime.fromisoformat(row["expires_at"])
+                    expires_at = row["expires_at"]
                     if expires_at > now:
-                        value = json.loads(row["data_json"])
+                        value = fast_json.loads(row["data_json"])
                         self._memory_cache.set_with_expiry(
                             row["cache_key"], value, expires_at
                         )
                         loaded += 1
                     else:
                         expired += 1
-                except (json.JSONDecodeError, ValueError) as e:
+                except (TypeError, ValueError) as e:
                     logger.warning("[CACHE] Failed to load cache entry: %s", e)
 
             if loaded > 0 or expired > 0:
@@ -374,7 +393,7 @@ class PersistentTTLCache:
 
         # Clean SQLite
         try:
-            now = datetime.now().isoformat()
+            now = int(time.time())
             with get_db() as conn:
                 cursor = conn.execute(
                     "DELETE FROM service_cache WHERE expires_at < ?", (now,)
@@ -407,40 +426,46 @@ class PersistentTTLCache:
         entries = self._memory_cache.get_all_entries()
         to_write = {k: entries[k] for k in dirty_keys if k in entries}
 
-        written = 0
-        deleted = 0
+        # Serialize up front so the write transaction is as short as possible
+        now = int(time.time())
+        rows = []
+        for key, (value, expires_at) in to_write.items():
+            try:
+                data_json = fast_json.dumps(value, default=str)
+            except (TypeError, ValueError) as e:
+                logger.warning("[CACHE] Failed to serialize key %s: %s", key, e)
+                continue
+            rows.append((key, data_json, int(expires_at), now))
+
+        written = len(rows)
+        deleted = len(deleted_keys)
 
         try:
             with get_db() as conn:
                 # Delete removed keys
-                for key in deleted_keys:
-                    conn.execute(
-                        "DELETE FROM service_cache WHERE cache_key = ?", (key,)
+                if deleted_keys:
+                    conn.executemany(
+                        "DELETE FROM service_cache WHERE cache_key = ?",
+                        [(key,) for key in deleted_keys],
                     )
-                    deleted += 1
 
                 # Upsert dirty keys
-                now = datetime.now().isoformat()
-                for key, (value, expires_at) in to_write.items():
-                    try:
-                        data_json = json.dumps(value, default=str)
-                        conn.execute(
-                            """
-                            INSERT OR REPLACE INTO service_cache
-                            (cache_key, data_json, expires_at, created_at)
-                            VALUES (?, ?, ?, ?)
-                            """,
-                            (key, data_json, expires_at.isoformat(), now),
-                        )
-                        written += 1
-                    except (TypeError, ValueError) as e:
-                        logger.warning("[CACHE] Failed to serialize key %s: %s", key, e)
+                if rows:
+                    conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO service_cache
+                        (cache_key, data_json, expires_at, created_at)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        rows,
+                    )
 
             if written > 0 or deleted > 0:
                 logger.debug("[CACHE] Flush: %d written, %d deleted", written, deleted)
 
         except Exception as e:
             logger.error("[CACHE] Flush failed: %s", e)
+            written = 0
             # Put keys back for retry on next flush
             with self._dirty_lock:
                 self._dirty_keys.update(dirty_keys)
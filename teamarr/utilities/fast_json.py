@@ -0,0 +1,28 @@
+"""JSON helpers backed by orjson.
+
+orjson serializes in native code (releasing the GIL). Output is compact, and
+datetime/date values are emitted in ISO 8601 form.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+
+
+def dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> str:
+    """Serialize obj to a compact JSON string."""
+    return dumpb(obj, default).decode()
+
+
+def dumpb(obj: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes.
+
+    default is called for objects orjson cannot serialize natively.
+    """
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize a JSON document."""
+    return orjson.loads(data)
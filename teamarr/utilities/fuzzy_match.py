@@ -6,8 +6,9 @@ Provides whole-name token_set_ratio matching for event name comparison.
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 from unidecode import unidecode
 
 # Common abbreviations to expand for better matching
@@ -22,8 +23,17 @@ ABBREVIATIONS = {
     "v": "versus",
 }
 
+# Longest first so "ufc fn" wins over "fn"; word boundaries avoid partial matches
+_ABBREVIATIONS_RE = re.compile(
+    r"\b("
+    + "|".join(re.escape(abbrev) for abbrev in sorted(ABBREVIATIONS, key=len, reverse=True))
+    + r")\b"
+)
 
-@dataclass
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+
+@dataclass(frozen=True, slots=True)
 class TeamPattern:
     """A searchable pattern for team matching.
 
@@ -38,7 +48,7 @@ class TeamPattern:
     source: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class FuzzyMatchResult:
     """Result of a fuzzy match."""
 
@@ -47,15 +57,17 @@ class FuzzyMatchResult:
     pattern_used: str | None = None
 
 
+@lru_cache(maxsize=8192)
 def normalize_text(value: str) -> str:
     """Normalize text for matching.
 
     Applies: unidecode, lowercase, strip punctuation, normalize whitespace.
+    Memoized: the same team and event names are normalized for every stream.
     """
     # Normalize: strip accents (é→e, ü→u), lowercase
     normalized = unidecode(value).lower().strip()
     # Remove punctuation (hyphens become spaces)
-    normalized = re.sub(r"[^\w\s]", " ", normalized)
+    normalized = _PUNCTUATION_RE.sub(" ", normalized)
     # Clean up whitespace
     normalized = " ".join(normalized.split())
     return normalized
@@ -91,6 +103,39 @@ def match_event_name(
     )
 
 
+@lru_cache(maxsize=2048)
+def _expand_abbreviations(text: str) -> str:
+    """Expand abbreviations (memoized; see FuzzyMatcher._expand_abbreviations)."""
+    return _ABBREVIATIONS_RE.sub(lambda m: ABBREVIATIONS[m.group(1)], text.lower())
+
+
+@lru_cache(maxsize=4096)
+def _team_patterns(
+    name: str | None, short_name: str | None, abbreviation: str | None
+) -> tuple[TeamPattern, ...]:
+    """Build a team's patterns (memoized on its names; see generate_team_patterns)."""
+    patterns: list[TeamPattern] = []
+    seen: set[str] = set()
+
+    def add(value: str | None, source: str) -> None:
+        if value:
+            normalized = normalize_text(value)
+            if normalized and normalized not in seen and len(normalized) >= 2:
+                seen.add(normalized)
+                patterns.append(TeamPattern(normalized, source))
+
+    # 1. Full name: "Boston Celtics"
+    add(name, source="full_name")
+
+    # 2. Short name: "Celtics" or "Florida Atlantic"
+    add(short_name, source="short_name")
+
+    # 3. Abbreviation: "BOS", "CHI"
+    add(abbreviation, source="abbreviation")
+
+    return tuple(patterns)
+
+
 class FuzzyMatcher:
     """Fuzzy string matcher for team/event names.
 
@@ -129,29 +174,7 @@ class FuzzyMatcher:
         """
         from teamarr.core import Team
 
-        patterns: list[TeamPattern] = []
-        seen: set[str] = set()
-
-        def add(value: str | None, source: str) -> None:
-            if value:
-                normalized = normalize_text(value)
-                if normalized and normalized not in seen and len(normalized) >= 2:
-                    seen.add(normalized)
-                    patterns.append(TeamPattern(normalized, source))
-
-        # 1. Full name: "Boston Celtics"
-        if team.name:
-            add(team.name, source="full_name")
-
-        # 2. Short name: "Celtics" or "Florida Atlantic"
-        if team.short_name:
-            add(team.short_name, source="short_name")
-
-        # 3. Abbreviation: "BOS", "CHI"
-        if team.abbreviation:
-            add(team.abbreviation, source="abbreviation")
-
-        return patterns
+        return list(_team_patterns(team.name, team.short_name, team.abbreviation))
 
     def match_event_name(
         self,
@@ -181,17 +204,7 @@ class FuzzyMatcher:
 
         E.g., "UFC FN Prelims" -> "UFC Fight Night Prelims"
         """
-        result = text.lower()
-
-        # Sort by length descending to match longer abbreviations first
-        # (e.g., "ufc fn" before "fn")
-        for abbrev in sorted(ABBREVIATIONS.keys(), key=len, reverse=True):
-            expansion = ABBREVIATIONS[abbrev]
-            # Use word boundaries to avoid partial matches
-            pattern = r"\b" + re.escape(abbrev) + r"\b"
-            result = re.sub(pattern, expansion, result, flags=re.IGNORECASE)
-
-        return result
+        return _expand_abbreviations(text)
 
     def best_match(
         self,
@@ -207,30 +220,30 @@ class FuzzyMatcher:
         Returns:
             Tuple of (best_match, score) or (None, 0) if no match
         """
-        best_candidate = None
-        best_score = 0.0
-
         pattern_lower = pattern.lower()
-
-        for candidate in candidates:
-            candidate_lower = candidate.lower()
-
-            # Try different scoring methods, take the best
-            scores = [
-                fuzz.ratio(pattern_lower, candidate_lower),
-                fuzz.token_set_ratio(pattern_lower, candidate_lower),
-                fuzz.partial_ratio(pattern_lower, candidate_lower),
-            ]
-            score = max(scores)
-
-            if score > best_score:
-                best_score = score
-                best_candidate = candidate
-
-        if best_score >= self.threshold:
-            return best_candidate, best_score
-
-        return None, 0.0
+        candidates_lower = [candidate.lower() for candidate in candidates]
+
+        # Try different scoring methods, take the best per candidate. Each scorer
+        # runs over the whole list in one rapidfuzz call and only returns
+        # candidates at or above the threshold.
+        scores: dict[int, float] = {}
+        for scorer in (fuzz.ratio, fuzz.token_set_ratio, fuzz.partial_ratio):
+            for _, score, index in process.extract(
+                pattern_lower,
+                candidates_lower,
+                scorer=scorer,
+                limit=None,
+                score_cutoff=self.threshold,
+            ):
+                if score > scores.get(index, 0.0):
+                    scores[index] = score
+
+        if not scores:
+            return None, 0.0
+
+        # Highest score wins; earliest candidate on ties
+        best_index = min(scores, key=lambda i: (-scores[i], i))
+        return candidates[best_index], scores[best_index]
 
 
 # Default singleton for convenience
@@ -4,6 +4,7 @@ Converts Programme dataclasses to XMLTV format.
 All times are output in the user's configured timezone.
 """
 
+from typing import TextIO
 from xml.dom import minidom
 from xml.etree.ElementTree import Element, SubElement, tostring
 
@@ -135,25 +136,45 @@ def _prettify(xml_str: str) -> str:
     return "\n".join(lines)
 
 
-def merge_xmltv_content(
-    xmltv_contents: list[str],
-    generator_name: str = "Teamarr",
-    generator_url: str | None = None,
-) -> str:
-    """Merge multiple XMLTV content strings into one.
-
-    Combines channels and programmes from multiple sources,
-    removing duplicates by channel ID. Output follows XMLTV standard
-    convention: all channels first, then programmes sorted by channel.
+class _BlankLineFilter:
+    """Text writer that drops whitespace-only lines on the way to out.
 
-    Args:
-        xmltv_contents: List of XMLTV XML strings
-        generator_name: Generator info for XML header
-        generator_url: Generator URL for XML header
-
-    Returns:
-        Merged XMLTV XML string
+    Streaming counterpart of the line filter in _prettify: output matches
+    "\n".join(non-blank lines), with no trailing newline.
     """
+
+    def __init__(self, out: TextIO):
+        self._out = out
+        self._pending = ""
+        self._started = False
+        self.chars_written = 0
+
+    def _emit(self, line: str) -> None:
+        if not line.strip():
+            return
+        if self._started:
+            line = "\n" + line
+        self._started = True
+        self._out.write(line)
+        self.chars_written += len(line)
+
+    def write(self, text: str) -> None:
+        lines = (self._pending + text).split("\n")
+        self._pending = lines.pop()
+        for line in lines:
+            self._emit(line)
+
+    def close(self) -> None:
+        self._emit(self._pending)
+        self._pending = ""
+
+
+def _merge_xmltv_root(
+    xmltv_contents: list[str],
+    generator_name: str,
+    generator_url: str | None,
+) -> Element:
+    """Combine channels and programmes from XMLTV strings into one <tv> root."""
     import xml.etree.ElementTree as ET
 
     root = Element("tv")
@@ -198,5 +219,56 @@ def merge_xmltv_content(
     for programme in all_programmes:
         root.append(programme)
 
+    return root
+
+
+def merge_xmltv_content(
+    xmltv_contents: list[str],
+    generator_name: str = "Teamarr",
+    generator_url: str | None = None,
+) -> str:
+    """Merge multiple XMLTV content strings into one.
+
+    Combines channels and programmes from multiple sources,
+    removing duplicates by channel ID. Output follows XMLTV standard
+    convention: all channels first, then programmes sorted by channel.
+
+    Args:
+        xmltv_contents: List of XMLTV XML strings
+        generator_name: Generator info for XML header
+        generator_url: Generator URL for XML header
+
+    Returns:
+        Merged XMLTV XML string
+    """
+    root = _merge_xmltv_root(xmltv_contents, generator_name, generator_url)
     xml_str = tostring(root, encoding="unicode")
     return _prettify(xml_str)
+
+
+def write_merged_xmltv(
+    xmltv_contents: list[str],
+    out: TextIO,
+    generator_name: str = "Teamarr",
+    generator_url: str | None = None,
+) -> int:
+    """Merge multiple XMLTV content strings and stream the result to out.
+
+    Produces the same document as merge_xmltv_content, but the pretty-printed
+    output is written incrementally instead of being built as one string.
+
+    Args:
+        xmltv_contents: List of XMLTV XML strings
+        out: Text file-like object to write to
+        generator_name: Generator info for XML header
+        generator_url: Generator URL for XML header
+
+    Returns:
+        Number of characters written
+    """
+    root = _merge_xmltv_root(xmltv_contents, generator_name, generator_url)
+    dom = minidom.parseString(tostring(root, encoding="unicode"))
+    writer = _BlankLineFilter(out)
+    dom.writexml(writer, "", "  ", "\n")
+    writer.close()
+    return writer.chars_written